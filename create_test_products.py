@@ -1,23 +1,16 @@
 #!/usr/bin/env python3
 """
 Create test products in Firestore
-Run this once to setup test data for E2E tests
+Run this once to setup test data for E2E tests (safe to re-run: unchanged
+products are skipped and changed ones are updated in place)
 """
-from datetime import datetime
+import sys
+from pathlib import Path
 
-# Check if Firebase admin is available
-try:
-    import firebase_admin
-    from firebase_admin import credentials, firestore
-except:
-    import subprocess
-    import sys
-    print("Installing firebase-admin...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", "firebase-admin"])
-    import firebase_admin
-    from firebase_admin import credentials, firestore
+sys.path.insert(0, str(Path(__file__).parent))
 
-from pathlib import Path
+from tests.fixtures.test_products import SEED_PRODUCTS, SEED_PRODUCT_KEY
+from tests.utils.firestore_seeder import FirestoreSeeder
 
 # Get service account key
 key_path = Path(__file__).parent / "serviceAccountKey.json"
@@ -29,86 +22,27 @@ print("\n" + "="*70)
 print("🛍️  CREATING TEST PRODUCTS IN FIRESTORE")
 print("="*70 + "\n")
 
-# Initialize Firebase
-try:
-    app = firebase_admin.get_app()
-    print("✅ Using existing Firebase app")
-except ValueError:
-    print("🔧 Initializing Firebase...")
-    cred = credentials.Certificate(str(key_path))
-    app = firebase_admin.initialize_app(cred)
-    print("✅ Firebase initialized")
-
-db = firestore.client()
-
-# Test products
-products = [
-    {
-        "name": "Premium Laptop",
-        "description": "High-performance laptop perfect for development",
-        "price": 1299.99,
-        "category": "Electronics",
-        "stock": 50,
-        "status": "active",
-        "vendorId": "vendor_user_id_1",
-        "imageUrl": "https://via.placeholder.com/300x300?text=Laptop",
-        "rating": 4.8,
-        "reviews": 42,
-    },
-    {
-        "name": "Smartphone Pro",
-        "description": "Latest smartphone with advanced features",
-        "price": 999.99,
-        "category": "Electronics",
-        "stock": 100,
-        "status": "active",
-        "vendorId": "vendor_user_id_1",
-        "imageUrl": "https://via.placeholder.com/300x300?text=Phone",
-        "rating": 4.6,
-        "reviews": 187,
-    },
-    {
-        "name": "Wireless Headphones",
-        "description": "Premium noise-cancelling headphones",
-        "price": 249.99,
-        "category": "Electronics",
-        "stock": 75,
-        "status": "active",
-        "vendorId": "vendor_user_id_1",
-        "imageUrl": "https://via.placeholder.com/300x300?text=Headphones",
-        "rating": 4.5,
-        "reviews": 93,
-    }
-]
+print("🔧 Initializing Firebase...")
+seeder = FirestoreSeeder.create(str(key_path))
+print("✅ Firebase initialized")
 
 print("📝 Adding products to Firestore...\n")
 
-product_ids = []
-for i, product in enumerate(products, 1):
-    try:
-        # Add timestamps
-        product["createdAt"] = datetime.utcnow()
-        product["updatedAt"] = datetime.utcnow()
-        
-        # Add to Firestore
-        doc_ref = db.collection("products").add(product)
-        doc_id = doc_ref[1].id
-        product_ids.append(doc_id)
-        
-        print(f"   {i}. ✅ {product['name']}")
-        print(f"      ID: {doc_id}")
-        print(f"      Price: ${product['price']}")
-        print()
-    except Exception as e:
-        print(f"   {i}. ❌ {product['name']}: {str(e)}\n")
+try:
+    result = seeder.seed("products", SEED_PRODUCTS, key_fields=SEED_PRODUCT_KEY)
+except Exception as e:
+    print(f"❌ Seeding failed: {str(e)}\n")
+    exit(1)
 
-print("="*70)
-if product_ids:
-    print(f"✅ CREATED {len(product_ids)} PRODUCTS")
-    print("\n📝 Test data is ready!")
-    print("   Products will now show up in the products page")
-    print("   E2E tests can click on them and navigate to details\n")
-else:
-    print("❌ No products were created")
+for i, (product, doc_id) in enumerate(zip(SEED_PRODUCTS, result.ids), 1):
+    print(f"   {i}. ✅ {product['name']}")
+    print(f"      ID: {doc_id}")
+    print(f"      Price: ${product['price']}")
+    print()
 
+print("="*70)
+print(f"✅ {result.written} PRODUCTS WRITTEN, {result.skipped} ALREADY UP TO DATE ({result.seconds:.2f}s)")
+print("\n📝 Test data is ready!")
+print("   Products will now show up in the products page")
+print("   E2E tests can click on them and navigate to details\n")
 print("="*70 + "\n")
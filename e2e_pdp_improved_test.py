@@ -12,6 +12,7 @@ from selenium.webdriver.chrome.options import Options
 import time
 import json
 from datetime import datetime
+from tests.utils.element_extractor import ElementExtractor
 
 # Test configuration
 TEST_EMAIL = "customer1@zilacart.com"
@@ -118,10 +119,14 @@ class PDPE2ETest:
                 EC.presence_of_element_located((By.XPATH, "//span[contains(text(), 'Add to Cart')]/ancestor::button"))
             )
             
-            if add_to_cart.is_displayed():
+            button = ElementExtractor.extract_first(
+                self.driver,
+                (By.XPATH, "//span[contains(text(), 'Add to Cart')]/ancestor::button"),
+                ["visible", "descendants:svg@class"]
+            )
+            if button and button["visible"]:
                 # Check for icon
-                svgs = add_to_cart.find_elements(By.TAG_NAME, "svg")
-                has_cart_icon = any('shopping-cart' in svg.get_attribute('class') for svg in svgs)
+                has_cart_icon = any('shopping-cart' in (cls or '') for cls in button["descendants:svg@class"])
                 
                 self.log_test(
                     "Add to Cart Button Visibility",
@@ -182,12 +187,16 @@ class PDPE2ETest:
                 EC.presence_of_element_located((By.XPATH, "//button[contains(@aria-label, 'Wishlist')]"))
             )
             
-            if wishlist.is_displayed():
+            button = ElementExtractor.extract_first(
+                self.driver,
+                (By.XPATH, "//button[contains(@aria-label, 'Wishlist')]"),
+                ["visible", "attr:aria-label", "descendants:svg@class"]
+            )
+            if button and button["visible"]:
                 # Check for heart icon
-                svgs = wishlist.find_elements(By.TAG_NAME, "svg")
-                has_heart_icon = any('heart' in svg.get_attribute('class') for svg in svgs)
+                has_heart_icon = any('heart' in (cls or '') for cls in button["descendants:svg@class"])
                 
-                aria_label = wishlist.get_attribute('aria-label')
+                aria_label = button["attr:aria-label"]
                 
                 self.log_test(
                     "Wishlist Button Visibility",
@@ -278,25 +287,36 @@ class PDPE2ETest:
         try:
             print("\n[TEST 7/8] Button Styling & Icons...")
             
-            add_to_cart = self.driver.find_element(By.XPATH, "//span[contains(text(), 'Add to Cart')]/ancestor::button")
-            wishlist = self.driver.find_element(By.XPATH, "//button[contains(@aria-label, 'Wishlist')]")
-            
             # Check cart button
-            cart_svgs = add_to_cart.find_elements(By.TAG_NAME, "svg")
-            cart_classes = add_to_cart.get_attribute('class')
+            cart = ElementExtractor.extract_first(
+                self.driver,
+                (By.XPATH, "//span[contains(text(), 'Add to Cart')]/ancestor::button"),
+                ["count:svg", "attr:class"]
+            )
+            if not cart:
+                raise AssertionError("Add to Cart button not found")
+            cart_svgs = cart["count:svg"]
+            cart_classes = cart["attr:class"] or ""
             has_primary = 'bg-primary' in cart_classes or 'primary' in cart_classes.lower()
             
             # Check wishlist button
-            wish_svgs = wishlist.find_elements(By.TAG_NAME, "svg")
-            wish_classes = wishlist.get_attribute('class')
+            wish = ElementExtractor.extract_first(
+                self.driver,
+                (By.XPATH, "//button[contains(@aria-label, 'Wishlist')]"),
+                ["count:svg", "attr:class"]
+            )
+            if not wish:
+                raise AssertionError("Wishlist button not found")
+            wish_svgs = wish["count:svg"]
+            wish_classes = wish["attr:class"] or ""
             has_border = 'border' in wish_classes
             
             details = f"""
-            Cart: {len(cart_svgs)} SVG(s), Primary style: {has_primary}
-            Wishlist: {len(wish_svgs)} SVG(s), Border style: {has_border}
+            Cart: {cart_svgs} SVG(s), Primary style: {has_primary}
+            Wishlist: {wish_svgs} SVG(s), Border style: {has_border}
             """
             
-            if len(cart_svgs) > 0 and len(wish_svgs) > 0:
+            if cart_svgs > 0 and wish_svgs > 0:
                 self.log_test("Button Styling & Icons", True, details.replace('\n', ' '))
                 return True
             else:
@@ -1,6 +1,21 @@
 import type { NextConfig } from 'next';
 import webpack from 'webpack';
 
+// Local asset server used by synthetic test catalogs (tests/utils/asset_server.py).
+// Only allowed outside production, or when a production build is explicitly made
+// for a test run (ALLOW_TEST_ASSETS=true), and only on its own port.
+const allowTestAssets = process.env.NODE_ENV !== 'production' || process.env.ALLOW_TEST_ASSETS === 'true';
+const testAssetPatterns = allowTestAssets
+  ? [
+      {
+        protocol: 'http' as const,
+        hostname: 'localhost',
+        port: process.env.TEST_ASSET_PORT || '8099',
+        pathname: '/assets/**',
+      },
+    ]
+  : [];
+
 const nextConfig: NextConfig = {
   typescript: {
     ignoreBuildErrors: true,
@@ -40,6 +55,7 @@ const nextConfig: NextConfig = {
         port: '',
         pathname: '/**',
       },
+      ...testAssetPatterns,
     ],
   },
   // Server-side packages
@@ -14,6 +14,11 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
+from tests.config import CONFIG
+from tests.utils.element_extractor import ElementExtractor
+from tests.utils.visual import BaselineStore, VisualChecker
+
+ADD_TO_CART_BUTTON = (By.XPATH, "//button[@aria-label='Add to Cart']")
 
 class ShoppingCartIconTest:
     """Test class for Add to Cart icon verification"""
@@ -92,24 +97,19 @@ class ShoppingCartIconTest:
         """Test 3: Verify Shopping Cart icon is rendered"""
         print("\n[TEST 3] Shopping Cart Icon Rendering")
         try:
-            # Look for SVG elements within Add to Cart buttons
-            buttons = self.driver.find_elements(By.XPATH, "//button[@aria-label='Add to Cart']")
-            icon_found = False
+            # Look for SVG elements within Add to Cart buttons (one round trip for all buttons)
+            buttons = ElementExtractor.extract(self.driver, ADD_TO_CART_BUTTON, ["visible", "count:svg"])
             
             for button in buttons:
                 # Check if button contains SVG (icon)
-                svg_elements = button.find_elements(By.TAG_NAME, "svg")
-                if svg_elements:
-                    icon_found = True
-                    # Check button visibility
-                    is_visible = button.is_displayed()
+                if button["count:svg"]:
+                    is_visible = button["visible"]
                     self.log_test("Shopping Cart icon rendered and visible", is_visible, 
-                                f"SVGs found: {len(svg_elements)}, Button visible: {is_visible}")
+                                f"SVGs found: {button['count:svg']}, Button visible: {is_visible}")
                     return is_visible
             
-            if not icon_found:
-                self.log_test("Shopping Cart icon rendered and visible", False, "No SVG icons found in button")
-                return False
+            self.log_test("Shopping Cart icon rendered and visible", False, "No SVG icons found in button")
+            return False
         except Exception as e:
             self.log_test("Shopping Cart icon rendered and visible", False, str(e))
             return False
@@ -118,21 +118,20 @@ class ShoppingCartIconTest:
         """Test 4: Verify icon has proper color"""
         print("\n[TEST 4] Icon Color Verification")
         try:
-            # Get Add to Cart button and check computed style
-            buttons = self.driver.find_elements(By.XPATH, "//button[@aria-label='Add to Cart']")
+            # Button and icon classes for every Add to Cart button in a single call
+            buttons = ElementExtractor.extract(
+                self.driver, ADD_TO_CART_BUTTON, ["attr:class", "descendants:svg@class"]
+            )
             
             for button in buttons:
                 # Check for color classes in button or icon
-                button_class = button.get_attribute("class")
-                icon_elements = button.find_elements(By.CSS_SELECTOR, "svg")
+                button_class = button["attr:class"] or ""
                 
-                has_color = False
-                for icon in icon_elements:
-                    icon_class = icon.get_attribute("class")
-                    # Check if icon has color classes (text-primary-foreground, text-white, etc)
-                    if any(color in str(icon_class).lower() for color in ["text-", "color", "white", "foreground"]):
-                        has_color = True
-                        break
+                # Check if icon has color classes (text-primary-foreground, text-white, etc)
+                has_color = any(
+                    any(color in str(icon_class).lower() for color in ["text-", "color", "white", "foreground"])
+                    for icon_class in button["descendants:svg@class"]
+                )
                 
                 color_info = f"Button classes: {button_class[:50]}..."
                 self.log_test("Icon has proper color styling", has_color or "text-" in button_class, color_info)
@@ -148,11 +147,11 @@ class ShoppingCartIconTest:
         """Test 5: Verify Add to Cart button is clickable"""
         print("\n[TEST 5] Button Clickability")
         try:
-            buttons = self.driver.find_elements(By.XPATH, "//button[@aria-label='Add to Cart']")
+            buttons = ElementExtractor.extract(self.driver, ADD_TO_CART_BUTTON, ["enabled", "visible"])
             
             for button in buttons:
-                is_enabled = button.get_attribute("disabled") is None
-                is_visible = button.is_displayed()
+                is_enabled = button["enabled"]
+                is_visible = button["visible"]
                 
                 self.log_test("Add to Cart button is clickable", is_enabled and is_visible,
                             f"Enabled: {is_enabled}, Visible: {is_visible}")
@@ -238,22 +237,30 @@ class ShoppingCartIconTest:
             return False
     
     def test_screenshot(self):
-        """Test 9: Take screenshots for visual verification"""
-        print("\n[TEST 9] Screenshot Capture")
+        """Test 9: Compare desktop and mobile screenshots with their baselines"""
+        print("\n[TEST 9] Screenshot Comparison")
         try:
-            # Desktop screenshot
-            self.driver.set_window_size(1920, 1080)
-            self.driver.save_screenshot("/tmp/add_to_cart_desktop.png")
+            checker = VisualChecker(
+                self.driver,
+                BaselineStore(CONFIG.visual_baselines_dir),
+                "add_to_cart_icon_verification",
+                CONFIG.visual_diffs_dir,
+                threshold=CONFIG.visual_threshold,
+                max_ratio=CONFIG.visual_max_diff_ratio,
+                update=CONFIG.update_baselines
+            )
+            results = []
+            for width, height in ((1920, 1080), (375, 667)):
+                self.driver.set_window_size(width, height)
+                time.sleep(1)  # Let the responsive layout settle
+                results.append(checker.check("product_page"))
             
-            # Mobile screenshot
-            self.driver.set_window_size(375, 667)
-            self.driver.save_screenshot("/tmp/add_to_cart_mobile.png")
-            
-            self.log_test("Screenshots captured successfully", True, 
-                        "Desktop: /tmp/add_to_cart_desktop.png, Mobile: /tmp/add_to_cart_mobile.png")
-            return True
+            passed = all(result.passed for result in results)
+            self.log_test("Screenshots match baselines", passed,
+                        "; ".join(result.summary() for result in results))
+            return passed
         except Exception as e:
-            self.log_test("Screenshots captured successfully", False, str(e))
+            self.log_test("Screenshots match baselines", False, str(e))
             return False
     
     def run_all_tests(self):
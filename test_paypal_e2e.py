@@ -155,7 +155,8 @@ class PayPalE2ETest:
             chrome_options.add_experimental_option("prefs", prefs)
             
             self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.implicitly_wait(5)
+            # Every lookup below uses WebDriverWait; an implicit wait would only add to it
+            self.driver.implicitly_wait(float(os.getenv("IMPLICIT_WAIT", "0")))
             
             print("✅ Chrome WebDriver initialized successfully")
             return True
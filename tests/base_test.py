@@ -58,6 +58,15 @@ class BaseTest:
             name
         )
     
+    def take_element_screenshots(self, locators: dict, full_page: bool = False) -> dict:
+        """Crop every locator's element out of one screenshot; name -> path (None if not captured)"""
+        return ScreenshotManager.take_element_screenshots(
+            self.driver,
+            locators,
+            self.config.screenshots_dir,
+            full_page=full_page
+        )
+    
     def take_failure_screenshot(self, test_name: str) -> str:
         """Take screenshot on failure"""
         return ScreenshotManager.take_screenshot_on_failure(
@@ -24,7 +24,9 @@ class TestConfig:
     headless: bool = os.getenv("HEADLESS", "false").lower() == "true"
     window_width: int = 1920
     window_height: int = 1080
-    implicit_wait: int = 10
+    # Implicit waits compound with explicit waits; keep them off unless scoped
+    implicit_wait: float = float(os.getenv("IMPLICIT_WAIT", "0"))
+    implicit_wait_warn_ms: int = int(os.getenv("IMPLICIT_WAIT_WARN_MS", "500"))
     explicit_wait: int = 20
     
     # PayPal credentials - ONLY from environment variables
@@ -42,20 +44,128 @@ class TestConfig:
     project_root: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     screenshots_dir: str = os.path.join(project_root, "tests/reports/screenshots")
     logs_dir: str = os.path.join(project_root, "tests/reports/logs")
+    heap_snapshots_dir: str = os.path.join(project_root, "tests/reports/heap_snapshots")
+    traces_dir: str = os.path.join(project_root, "tests/reports/traces")
+    screencasts_dir: str = os.path.join(project_root, "tests/reports/screencasts")
+    visual_baselines_dir: str = os.path.join(project_root, "tests/visual_baselines")
+    visual_diffs_dir: str = os.path.join(project_root, "tests/reports/visual")
+    cache_dir: str = os.path.join(project_root, "tests/reports/cache")
+    hangs_dir: str = os.path.join(project_root, "tests/reports/hangs")
+    # Durations of passing tests (setup + call + teardown), recorded by every run
+    duration_history_path: str = os.path.join(project_root, "tests/reports/cache/test_durations.json")
+    service_account_key: str = os.getenv(
+        "FIREBASE_SERVICE_ACCOUNT_KEY", os.path.join(project_root, "serviceAccountKey.json")
+    )
     
     # Timeouts
     page_load_timeout: int = 30
     element_timeout: int = 20
     api_timeout: int = 10
+    settle_quiet_ms: int = 300
+    settle_timeout: int = 10
+    # Element waits without an explicit timeout use p99 of past waits x factor (at least min_s, at most element_timeout)
+    adaptive_timeouts: bool = os.getenv("ADAPTIVE_TIMEOUTS", "false").lower() == "true"
+    adaptive_timeout_factor: float = float(os.getenv("ADAPTIVE_TIMEOUT_FACTOR", "3"))
+    adaptive_timeout_min_s: float = float(os.getenv("ADAPTIVE_TIMEOUT_MIN_S", "2"))
+    adaptive_timeout_probe_after: int = int(os.getenv("ADAPTIVE_TIMEOUT_PROBE_AFTER", "3"))
+    # Hang watchdog: a test may run p99 of its past durations x factor, within [min, max]
+    hang_watchdog: bool = os.getenv("HANG_WATCHDOG", "true").lower() == "true"
+    hang_timeout_factor: float = float(os.getenv("HANG_TIMEOUT_FACTOR", "3"))
+    hang_timeout_min_s: float = float(os.getenv("HANG_TIMEOUT_MIN_S", "60"))
+    hang_timeout_max_s: float = float(os.getenv("HANG_TIMEOUT_MAX_S", "300"))
+    # Extra time before pytest-timeout fails a test the watchdog could not unblock
+    hang_grace_s: float = float(os.getenv("HANG_GRACE_S", "60"))
+    # pytest-timeout for benchmark/slow tests, which the watchdog skips (0 = no limit)
+    slow_test_timeout_s: float = float(os.getenv("SLOW_TEST_TIMEOUT_S", "0"))
     
     # Test behavior
     take_screenshots_on_failure: bool = True
     keep_browser_open_on_failure: bool = False
     retry_failed_tests: int = 1
+    # Size cap for tests/reports/screenshots (python -m tests.utils.screenshot_store compact)
+    screenshot_retention_mb: float = float(os.getenv("SCREENSHOT_RETENTION_MB", "200"))
+    
+    # Visual regression (visual fixture); UPDATE_BASELINES=true accepts the current screenshots
+    update_baselines: bool = os.getenv("UPDATE_BASELINES", "false").lower() == "true"
+    # Fail checks without a baseline instead of skipping them (set once baselines are committed)
+    visual_require_baselines: bool = os.getenv("VISUAL_REQUIRE_BASELINES", "false").lower() == "true"
+    # YIQ colour distance (0-1) below which two pixels count as equal
+    visual_threshold: float = float(os.getenv("VISUAL_THRESHOLD", "0.1"))
+    # Share of compared pixels allowed to change outside regions with their own limit
+    visual_max_diff_ratio: float = float(os.getenv("VISUAL_MAX_DIFF_RATIO", "0.0005"))
+    
+    # Metrics
+    instrument_commands: bool = os.getenv("INSTRUMENT_COMMANDS", "true").lower() == "true"
+    # Chrome traces, kept for failed tests and tests slower than their historical p95
+    capture_traces: bool = os.getenv("CAPTURE_TRACES", "true").lower() == "true"
+    trace_retention_mb: float = float(os.getenv("TRACE_RETENTION_MB", "500"))
+    trace_retention_files: int = int(os.getenv("TRACE_RETENTION_FILES", "50"))
+    # Seconds of screencast kept in memory and saved on failure (0 = off)
+    screencast_seconds: float = float(os.getenv("SCREENCAST_SECONDS", "0"))
     
     # API
     request_timeout: int = 10
     max_retries: int = 3
+    catalog_cache_ttl: int = int(os.getenv("CATALOG_CACHE_TTL", "3600"))
+    
+    # Test data
+    seed_firestore: bool = os.getenv("SEED_FIRESTORE", "false").lower() == "true"
+    
+    # Firebase emulator (per-test snapshot/restore)
+    use_firebase_emulator: bool = os.getenv("USE_FIREBASE_EMULATOR", "false").lower() == "true"
+    emulator_project_id: str = os.getenv("EMULATOR_PROJECT_ID", "demo-zilacart")
+    emulator_firestore_port: int = int(os.getenv("EMULATOR_FIRESTORE_PORT", "8080"))
+    emulator_auth_port: int = int(os.getenv("EMULATOR_AUTH_PORT", "9099"))
+    # xdist workers step every port by EMULATOR_PORT_STRIDE; bases a multiple of the stride apart
+    # would collide after that many workers, so the hub and logging bases differ by 5
+    emulator_hub_port: int = int(os.getenv("EMULATOR_HUB_PORT", "4400"))
+    emulator_logging_port: int = int(os.getenv("EMULATOR_LOGGING_PORT", "4405"))
+    emulator_websocket_port: int = int(os.getenv("EMULATOR_WEBSOCKET_PORT", "9150"))
+    emulator_port_stride: int = int(os.getenv("EMULATOR_PORT_STRIDE", "10"))
+    emulator_import_dir: Optional[str] = os.getenv("EMULATOR_IMPORT_DIR")
+    
+    # Benchmarks (tests/perf, opt-in)
+    run_benchmarks: bool = os.getenv("RUN_BENCHMARKS", "false").lower() == "true"
+    benchmark_dir: str = os.path.join(project_root, "tests/reports/benchmarks")
+    benchmark_repeats: int = int(os.getenv("BENCHMARK_REPEATS", "5"))
+    # Growth exponent (log-log slope) above which a metric counts as super-linear
+    benchmark_max_exponent: float = float(os.getenv("BENCHMARK_MAX_EXPONENT", "1.1"))
+    catalog_benchmark_sizes: tuple = tuple(
+        int(size) for size in os.getenv("CATALOG_BENCHMARK_SIZES", "100,1000,10000,50000").split(",")
+    )
+    order_benchmark_sizes: tuple = tuple(
+        int(size) for size in os.getenv("ORDER_BENCHMARK_SIZES", "10000,100000,500000").split(",")
+    )
+    order_benchmark_concurrency: tuple = tuple(
+        int(level) for level in os.getenv("ORDER_BENCHMARK_CONCURRENCY", "1,8,32").split(",")
+    )
+    order_analytics_p95_budget_ms: int = int(os.getenv("ORDER_ANALYTICS_P95_BUDGET_MS", "5000"))
+    stress_customers: int = int(os.getenv("STRESS_CUSTOMERS", "50"))
+    stress_stock: int = int(os.getenv("STRESS_STOCK", "10"))
+    stress_browsers: int = int(os.getenv("STRESS_BROWSERS", "0"))
+    webhook_orders: int = int(os.getenv("WEBHOOK_ORDERS", "500"))
+    # Deliveries per second; 0 posts everything at once like PayPal's retry burst after an outage
+    webhook_rates: tuple = tuple(float(rate) for rate in os.getenv("WEBHOOK_RATES", "20,100,0").split(","))
+    webhook_concurrency: int = int(os.getenv("WEBHOOK_CONCURRENCY", "32"))
+    webhook_duplicate_rate: float = float(os.getenv("WEBHOOK_DUPLICATE_RATE", "0.2"))
+    webhook_reorder_rate: float = float(os.getenv("WEBHOOK_REORDER_RATE", "0.1"))
+    webhook_p95_budget_ms: int = int(os.getenv("WEBHOOK_P95_BUDGET_MS", "2000"))
+    # Browser farm (tests/perf/journeys.py); 0 browsers = size to CPU cores and free memory
+    farm_browsers: int = int(os.getenv("FARM_BROWSERS", "0"))
+    farm_duration_s: float = float(os.getenv("FARM_DURATION_S", "300"))
+    farm_bucket_s: float = float(os.getenv("FARM_BUCKET_S", "30"))
+    farm_max_error_rate: float = float(os.getenv("FARM_MAX_ERROR_RATE", "0.05"))
+    # Leak checks (leak_check fixture); per-metric limits can be set with @pytest.mark.leak_check(...)
+    leak_check_iterations: int = int(os.getenv("LEAK_CHECK_ITERATIONS", "10"))
+    leak_check_max_heap_kb: float = float(os.getenv("LEAK_CHECK_MAX_HEAP_KB", "100"))
+    # Soak mode (python tests/runner.py soak)
+    soak_hours: float = float(os.getenv("SOAK_HOURS", "4"))
+    soak_sample_every_s: float = float(os.getenv("SOAK_SAMPLE_EVERY_S", "30"))
+    # Last-quarter median over first-quarter median allowed before a steady rise fails the run
+    soak_max_latency_growth: float = float(os.getenv("SOAK_MAX_LATENCY_GROWTH", "0.25"))
+    soak_max_memory_growth: float = float(os.getenv("SOAK_MAX_MEMORY_GROWTH", "0.2"))
+    # Share of failed iterations that fails the run (failed iterations record no samples)
+    soak_max_error_rate: float = float(os.getenv("SOAK_MAX_ERROR_RATE", "0.05"))
     
     @classmethod
     def get_config(cls) -> "TestConfig":
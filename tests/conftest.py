@@ -1,12 +1,38 @@
 """Pytest configuration and fixtures"""
 import pytest
 import logging
+import html
+import json
+import os
+import re
+from datetime import datetime
 from selenium.webdriver.remote.webdriver import WebDriver
 from tests.config import CONFIG
+from tests.pages.login_page import LoginPage
 from tests.utils.browser_helper import BrowserHelper
+from tests.utils.command_metrics import CommandStats, USER_PROPERTY, record_test_metrics
+from tests.utils.implicit_wait import ImplicitWaitDetector, set_implicit_wait
+from tests.utils.leak_detector import LeakDetector
+from tests.utils.product_catalog import ProductCatalog
+from tests.utils.progress import ProgressTracker
+from tests.utils.duration_history import DurationHistory
+from tests.utils.file_lock import FileLock
+from tests.fixtures.test_products import SEED_PRODUCTS, SEED_PRODUCT_KEY
+from tests.fixtures.test_user import SEED_ACCOUNTS
+from tests.utils.screencast import ScreencastRecorder
 from tests.utils.screenshot import ScreenshotManager
+from tests.utils.stream_report import StreamReport
+from tests.utils.timeout_advisor import TimeoutAdvisor
+from tests.utils.tracing import USER_PROPERTY as TRACE_PROPERTY, finish_trace
+from tests.utils.visual import USER_PROPERTY as VISUAL_PROPERTY, BaselineStore, VisualChecker
+from tests.utils.watchdog import HangWatchdog, hang_limit
 from tests.utils.logger import Logger
 
+try:
+    from pytest_html import extras as html_extras
+except ImportError:
+    html_extras = None
+
 
 # Configure logging
 logging.basicConfig(
@@ -14,6 +40,16 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+# WebDriver command metrics aggregated over the whole run
+RUN_COMMAND_STATS = CommandStats()
+TEST_ROUND_TRIPS = []
+
+# Tests run by this process: node ID -> {"duration", "passed"}; passing ones go to the duration history
+TEST_DURATIONS = {}
+
+# Tests the hang watchdog leaves alone (they legitimately run for minutes)
+LONG_RUNNING_MARKERS = ("benchmark", "slow")
+
 
 @pytest.fixture(scope="session")
 def config():
@@ -21,8 +57,100 @@ def config():
     return CONFIG
 
 
+@pytest.fixture(scope="session")
+def product_catalog(config) -> ProductCatalog:
+    """Valid product IDs discovered once per session (shared across xdist workers)"""
+    return ProductCatalog(
+        base_url=config.base_url,
+        api_base_url=config.api_base_url,
+        cache_path=os.path.join(config.cache_dir, "product_catalog.json"),
+        ttl=config.catalog_cache_ttl,
+        timeout=config.api_timeout
+    )
+
+
+@pytest.fixture(scope="session")
+def seeded_firestore(config):
+    """Seed test products and accounts once per session (SEED_FIRESTORE=true)
+    
+    Seeding is idempotent, so every xdist worker may call it; the lock only
+    keeps workers from racing on Auth user creation.
+    """
+    if not config.seed_firestore:
+        pytest.skip("Firestore seeding disabled (set SEED_FIRESTORE=true)")
+    from tests.utils.firestore_seeder import FirestoreSeeder
+    
+    with FileLock(os.path.join(config.cache_dir, "seed.lock")):
+        seeder = FirestoreSeeder.create(config.service_account_key)
+        products = seeder.seed("products", SEED_PRODUCTS, key_fields=SEED_PRODUCT_KEY)
+        uids = seeder.seed_users(SEED_ACCOUNTS)
+    return {"seeder": seeder, "product_ids": products.ids, "uids": uids}
+
+
+@pytest.fixture(scope="session")
+def firebase_emulator(config, worker_id):
+    """Firestore/Auth emulators for this session (USE_FIREBASE_EMULATOR=true)
+
+    Each xdist worker gets its own emulator pair on offset ports so that
+    per-test restores never clobber another worker's data.
+    """
+    if not config.use_firebase_emulator:
+        pytest.skip("Firebase emulator disabled (set USE_FIREBASE_EMULATOR=true)")
+    from tests.utils.firebase_emulator import FirebaseEmulator
+
+    step = (0 if worker_id == "master" else int(worker_id.lstrip("gw")) + 1) * config.emulator_port_stride
+    emulator = FirebaseEmulator(
+        project_id=config.emulator_project_id,
+        firestore_port=config.emulator_firestore_port + step,
+        auth_port=config.emulator_auth_port + step,
+        hub_port=config.emulator_hub_port + step,
+        logging_port=config.emulator_logging_port + step,
+        websocket_port=config.emulator_websocket_port + step,
+        import_dir=config.emulator_import_dir
+    )
+    if not emulator.is_running() and not emulator.find_cli():
+        pytest.skip("Firebase CLI not found (install firebase-tools or set FIREBASE_CLI)")
+    emulator.start()
+    yield emulator
+    emulator.stop()
+
+
+@pytest.fixture(scope="session")
+def emulator_dataset(firebase_emulator):
+    """Seed the emulator once and keep an in-memory snapshot of the result"""
+    seeder = firebase_emulator.seeder
+    products = seeder.seed("products", SEED_PRODUCTS, key_fields=SEED_PRODUCT_KEY)
+    uids = seeder.seed_users(SEED_ACCOUNTS)
+    return {
+        "snapshot": firebase_emulator.snapshot(),
+        "product_ids": products.ids,
+        "uids": uids,
+    }
+
+
 @pytest.fixture(scope="function")
-def driver(config) -> WebDriver:
+def clean_firestore(firebase_emulator, emulator_dataset):
+    """Reset emulator Firestore to the seeded snapshot before the test
+
+    Auth users are left in place: tests create throwaway accounts with
+    unique emails, and the seeded ones never change.
+    """
+    firebase_emulator.restore(emulator_dataset["snapshot"])
+    return emulator_dataset
+
+
+@pytest.fixture(scope="session")
+def customer_account(config, request) -> dict:
+    """Customer to sign in as: the seeded one on the emulator, else TEST_EMAIL/TEST_PASSWORD"""
+    if config.use_firebase_emulator:
+        request.getfixturevalue("emulator_dataset")
+        customer = next(account for account in SEED_ACCOUNTS if account["role"] == "customer")
+        return {"email": customer["email"], "password": customer["password"]}
+    return {"email": config.test_email, "password": config.test_password}
+
+
+@pytest.fixture(scope="function")
+def driver(config, request) -> WebDriver:
     """Create WebDriver instance for each test"""
     logger = Logger.get_logger("driver_fixture")
     
@@ -32,36 +160,128 @@ def driver(config) -> WebDriver:
         browser=config.browser.value,
         headless=config.headless,
         window_width=config.window_width,
-        window_height=config.window_height
+        window_height=config.window_height,
+        instrument=config.instrument_commands,
+        trace=config.capture_traces,
+        screencast_seconds=config.screencast_seconds
     )
     
     if web_driver:
-        web_driver.implicitly_wait(config.implicit_wait)
+        if config.instrument_commands:
+            ImplicitWaitDetector.attach(web_driver, config.implicit_wait_warn_ms)
+        set_implicit_wait(web_driver, config.implicit_wait)
         web_driver.set_page_load_timeout(config.page_load_timeout)
+        if config.hang_watchdog and hasattr(request.node, "hang_limit"):
+            request.node.hang_watchdog = HangWatchdog.attach(
+                web_driver,
+                request.node.nodeid,
+                request.node.hang_limit,
+                config.hangs_dir,
+                screenshots_dir=config.screenshots_dir
+            )
     
     yield web_driver
     
     # Cleanup
+    watchdog = HangWatchdog.get(web_driver) if web_driver else None
+    if watchdog:
+        watchdog.stop()
+        request.node.user_properties.extend(watchdog.properties())
     if web_driver:
+        record_test_metrics(request.node, web_driver)
+        finish_trace(request.node, web_driver, config)
         logger.info("Closing WebDriver")
         BrowserHelper.close_driver(web_driver)
 
 
+@pytest.fixture(scope="function")
+def signed_in(driver, config, customer_account) -> dict:
+    """Sign the test's browser in as customer_account (cart and wishlist only act for signed-in users)"""
+    if not LoginPage(driver, config.base_url).log_in(customer_account["email"], customer_account["password"]):
+        pytest.skip(f"Could not sign in as {customer_account['email']}")
+    return customer_account
+
+
+@pytest.fixture(scope="function")
+def leak_check(driver, config, request) -> LeakDetector:
+    """Leak detector bound to the test's driver
+
+    Settings come from @pytest.mark.leak_check(iterations=..., warmup=...,
+    <metric>=<max growth per iteration>), e.g. js_heap_used_kb=50.
+    """
+    marker = request.node.get_closest_marker("leak_check")
+    options = dict(marker.kwargs) if marker else {}
+    detector = LeakDetector(
+        driver,
+        name=request.node.name,
+        iterations=options.pop("iterations", config.leak_check_iterations),
+        warmup=options.pop("warmup", 2),
+        thresholds=dict({"js_heap_used_kb": config.leak_check_max_heap_kb}, **options),
+        snapshot_dir=config.heap_snapshots_dir
+    )
+    yield detector
+    for report in detector.reports:
+        request.node.user_properties.append(("leak_check", {
+            "growth_per_iteration": report.growth,
+            "passed": report.passed,
+            "heap_snapshot": report.snapshot_path,
+        }))
+
+
+@pytest.fixture(scope="function")
+def visual(driver, config, request) -> VisualChecker:
+    """Screenshot comparisons against this test's baselines in tests/visual_baselines"""
+    try:
+        checker = VisualChecker(
+            driver,
+            BaselineStore(config.visual_baselines_dir),
+            request.node.nodeid,
+            config.visual_diffs_dir,
+            threshold=config.visual_threshold,
+            max_ratio=config.visual_max_diff_ratio,
+            update=config.update_baselines,
+            require_baselines=config.visual_require_baselines
+        )
+    except RuntimeError as e:
+        pytest.skip(str(e))
+    yield checker
+    for result in checker.results:
+        request.node.user_properties.append((VISUAL_PROPERTY, result.to_dict()))
+
+
 @pytest.fixture(scope="function", autouse=True)
-def take_screenshot_on_failure(driver, config, request):
-    """Take screenshot on test failure"""
+def take_screenshot_on_failure(config, request):
+    """Take screenshot on test failure
+    
+    Only tests that use the driver (directly or through another fixture)
+    get one; API-only tests never start a browser. The driver is requested
+    before the test so that it is still open during this teardown.
+    """
+    driver = request.getfixturevalue("driver") if "driver" in request.fixturenames else None
     yield
+    if driver is None:
+        return
     
     if request.node.rep_call.failed if hasattr(request.node, "rep_call") else False:
         if config.take_screenshots_on_failure:
             logger = Logger.get_logger("screenshot_on_failure")
             logger.warning(f"Test failed: {request.node.name}. Taking screenshot...")
             
-            ScreenshotManager.take_screenshot_on_failure(
+            path = ScreenshotManager.take_screenshot_on_failure(
                 driver,
                 config.screenshots_dir,
                 request.node.name
             )
+            if path:
+                request.node.user_properties.append(("screenshot", path))
+        
+        recorder = ScreencastRecorder.get(driver) if driver else None
+        if recorder:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            name = re.sub(r"[^\w.-]+", "_", request.node.name)
+            path = recorder.save(os.path.join(config.screencasts_dir, f"failure_{name}_{timestamp}"))
+            if path:
+                request.node.user_properties.append(("screencast", path))
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -70,10 +290,125 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
     setattr(item, f"rep_{rep.when}", rep)
+    
+    watchdog = getattr(item, "hang_watchdog", None)
+    if rep.when == "call" and watchdog and watchdog.fired:
+        rep.sections.append(("hang watchdog", watchdog.summary()))
+    
+    if rep.when == "teardown" and html_extras:
+        metrics = dict(item.user_properties).get(USER_PROPERTY)
+        if metrics:
+            table = CommandStats.from_dict(metrics).format_table()
+            rep.extras = getattr(rep, "extras", []) + [
+                html_extras.html(f"<pre>WebDriver commands\n{html.escape(table)}</pre>")
+            ]
+        trace_path = dict(item.user_properties).get(TRACE_PROPERTY)
+        if trace_path:
+            rep.extras = getattr(rep, "extras", []) + [html_extras.url(trace_path, name="Chrome trace")]
+        screencast_path = dict(item.user_properties).get("screencast")
+        if screencast_path:
+            rep.extras = getattr(rep, "extras", []) + [html_extras.url(screencast_path, name="Screencast")]
+        for name, value in item.user_properties:
+            image_path = value.get("diff_path") or value.get("actual_path") if name == VISUAL_PROPERTY else None
+            if image_path:
+                rep.extras = getattr(rep, "extras", []) + [
+                    html_extras.image(image_path, name=f"Visual {value['status']}: {value['name']}")
+                ]
+
+
+def pytest_runtest_logreport(report):
+    """Collect test durations (where the test ran) and aggregate WebDriver command metrics into run totals"""
+    # Reports relayed from an xdist worker carry the worker node; that worker records them itself
+    if getattr(report, "node", None) is None:
+        entry = TEST_DURATIONS.setdefault(report.nodeid, {"duration": 0.0, "passed": True})
+        entry["duration"] += report.duration
+        entry["passed"] = entry["passed"] and report.passed
+    if report.when != "teardown":
+        return
+    metrics = dict(report.user_properties).get(USER_PROPERTY)
+    if metrics:
+        RUN_COMMAND_STATS.merge(CommandStats.from_dict(metrics))
+        TEST_ROUND_TRIPS.append((report.nodeid, metrics["round_trips"], metrics["total_ms"]))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Merge this process's test and element wait durations into their histories"""
+    DurationHistory(CONFIG.duration_history_path).record_many({
+        nodeid: entry["duration"] for nodeid, entry in TEST_DURATIONS.items() if entry["passed"]
+    })
+    TimeoutAdvisor.get_advisor().flush()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print per-run WebDriver command latency histogram"""
+    if hasattr(config, "workerinput") or not RUN_COMMAND_STATS.round_trips:
+        return
+    terminalreporter.write_sep("=", "WebDriver command latency")
+    terminalreporter.write_line(RUN_COMMAND_STATS.format_table())
+    
+    terminalreporter.write_line("")
+    terminalreporter.write_line("Most round trips per test:")
+    for nodeid, round_trips, total_ms in sorted(TEST_ROUND_TRIPS, key=lambda t: -t[1])[:10]:
+        terminalreporter.write_line(f"  {round_trips:>6}  {total_ms / 1000:>7.2f}s  {nodeid}")
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    metrics_file = os.path.join(os.path.dirname(CONFIG.logs_dir), f"command_metrics_{timestamp}.json")
+    with open(metrics_file, "w") as f:
+        json.dump({
+            "summary": RUN_COMMAND_STATS.summary(),
+            "tests": [
+                {"nodeid": nodeid, "round_trips": round_trips, "total_ms": total_ms}
+                for nodeid, round_trips, total_ms in TEST_ROUND_TRIPS
+            ],
+        }, f, indent=2)
+    terminalreporter.write_line(f"Command metrics written to {metrics_file}")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Give every test a hang limit from its history, backed by a pytest-timeout of limit + grace
+
+    Benchmark and slow tests get no watchdog, and SLOW_TEST_TIMEOUT_S (default
+    none) instead of the pytest.ini timeout.
+    """
+    if not CONFIG.hang_watchdog:
+        return
+    history = DurationHistory(CONFIG.duration_history_path).all()
+    has_timeout = config.pluginmanager.hasplugin("timeout")
+    for item in items:
+        if any(item.get_closest_marker(name) for name in LONG_RUNNING_MARKERS):
+            if has_timeout and not item.get_closest_marker("timeout"):
+                item.add_marker(pytest.mark.timeout(CONFIG.slow_test_timeout_s))
+            continue
+        item.hang_limit = hang_limit(
+            history.get(item.nodeid, []),
+            CONFIG.hang_timeout_factor,
+            CONFIG.hang_timeout_min_s,
+            CONFIG.hang_timeout_max_s
+        )
+        if has_timeout and not item.get_closest_marker("timeout"):
+            item.add_marker(pytest.mark.timeout(item.hang_limit + CONFIG.hang_grace_s))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--stream-report", metavar="DIR", default=None,
+        help="Stream results to DIR/results.jsonl and write a lazy-loading DIR/index.html"
+    )
+    parser.addoption(
+        "--progress-file", metavar="PATH", default=None,
+        help="Keep a live JSON status (per-worker progress, ETA, stuck tests) at PATH"
+    )
 
 
 def pytest_configure(config):
     """Configure pytest"""
+    report_dir = config.getoption("--stream-report")
+    if report_dir and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(StreamReport(report_dir), "stream_report")
+    progress_file = config.getoption("--progress-file")
+    if progress_file and not hasattr(config, "workerinput"):
+        history = DurationHistory(CONFIG.duration_history_path)
+        config.pluginmanager.register(ProgressTracker(progress_file, history), "progress")
     config.addinivalue_line(
         "markers", "smoke: mark test as smoke test"
     )
@@ -0,0 +1,238 @@
+"""Reproducible synthetic product catalogs for scale testing
+
+    python -m tests.fixtures.catalog_generator --size 10k --out tests/reports/catalog-10k
+    python -m tests.fixtures.catalog_generator --size 10k --out tests/reports/catalog-10k --load
+
+Distributions follow what the production catalog looks like: category
+shares are skewed towards Electronics/Fashion, prices are log-normal per
+category, review counts follow a power law (most products have none, a few
+have thousands) and a handful of vendors own most of the SKUs.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import re
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+
+CATALOG_SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+DEFAULT_SEED = 42
+ASSET_BASE_URL = os.getenv("ASSET_BASE_URL", "http://localhost:8099")
+
+# name -> (share of catalog, median price in KES, log-normal sigma, brands, nouns)
+CATEGORIES = {
+    "Electronics": (0.22, 15000, 1.0, ["Samsung", "Xiaomi", "Tecno", "HP", "Lenovo", "Sony"],
+                    ["Smartphone", "Laptop", "Earbuds", "Smart TV", "Power Bank", "Speaker"]),
+    "Fashion": (0.18, 1800, 0.7, ["Bata", "Adidas", "Nike", "Zara", "Safari Wear"],
+                ["T-Shirt", "Sneakers", "Dress", "Jacket", "Handbag", "Jeans"]),
+    "Groceries": (0.12, 350, 0.6, ["Brookside", "Kabras", "Pembe", "Ketepa", "Daawat"],
+                  ["Milk 1L", "Sugar 2kg", "Maize Flour", "Tea Leaves", "Rice 5kg"]),
+    "Home & Kitchen": (0.11, 3500, 0.9, ["Ramtons", "Sayona", "Von", "Nunix"],
+                       ["Blender", "Cookware Set", "Kettle", "Microwave", "Table Lamp"]),
+    "Health & Beauty": (0.09, 900, 0.7, ["Nivea", "Dove", "Garnier", "Vaseline"],
+                        ["Body Lotion", "Shampoo", "Face Wash", "Hair Oil", "Perfume"]),
+    "Baby & Kids": (0.07, 1500, 0.8, ["Pampers", "Huggies", "Fisher-Price", "Lego"],
+                    ["Diapers", "Baby Wipes", "Toy Car", "Building Blocks", "Stroller"]),
+    "Sports & Outdoors": (0.06, 2500, 0.9, ["Puma", "Decathlon", "Wilson", "Coleman"],
+                          ["Football", "Yoga Mat", "Dumbbells", "Tent", "Water Bottle"]),
+    "Automotive": (0.05, 2200, 0.9, ["Total", "Shell", "Bosch", "Michelin"],
+                   ["Motor Oil", "Car Charger", "Wiper Blades", "Tyre Inflator"]),
+    "Books & Stationery": (0.06, 650, 0.6, ["Longhorn", "Kasuku", "Bic", "Oxford"],
+                           ["Exercise Book", "Novel", "Pen Set", "Textbook", "Calculator"]),
+    "Tools & Industrial": (0.04, 4200, 1.0, ["Bosch", "Makita", "Stanley", "Ingco"],
+                           ["Drill", "Tool Kit", "Angle Grinder", "Safety Boots"]),
+}
+
+ADJECTIVES = ["Classic", "Premium", "Compact", "Pro", "Eco", "Deluxe", "Essential", "Ultra", "Smart", "Lite"]
+STATUS_WEIGHTS = {"active": 0.95, "pending_approval": 0.03, "draft": 0.02}
+
+# P(reviews >= k) ~ (k + 1) ** -REVIEW_ALPHA
+REVIEW_ALPHA = 1.1
+MAX_REVIEWS = 5000
+OUT_OF_STOCK_SHARE = 0.08
+
+
+def parse_size(size: Union[int, str]) -> int:
+    """Accept 1000, "1000", "1k", "10k", "100k", "500k\""""
+    if isinstance(size, int):
+        return size
+    size = size.lower()
+    if size in CATALOG_SIZES:
+        return CATALOG_SIZES[size]
+    return int(float(size[:-1]) * 1000) if size.endswith("k") else int(size)
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+class CatalogGenerator:
+    """Generates categories, vendors and products deterministically from a seed
+
+    Each entity type draws from its own random stream, so products are the
+    same whether or not vendors were generated first.
+    """
+
+    def __init__(
+        self,
+        size: Union[int, str] = "1k",
+        seed: int = DEFAULT_SEED,
+        asset_base_url: str = ASSET_BASE_URL,
+        vendor_count: Optional[int] = None
+    ):
+        self.size = parse_size(size)
+        self.seed = seed
+        self.asset_base_url = asset_base_url.rstrip("/")
+        self.vendor_count = vendor_count or max(5, self.size // 200)
+        self.epoch = datetime(2025, 1, 1)
+
+    def _rng(self, stream: str) -> random.Random:
+        return random.Random(f"{self.seed}:{stream}")
+
+    # ==================== Entities ====================
+    def categories(self) -> List[dict]:
+        """The app's category documents"""
+        return [
+            {"id": _slug(name), "name": name, "description": f"Synthetic {name} catalog"}
+            for name in CATEGORIES
+        ]
+
+    def vendors(self) -> List[dict]:
+        """Vendor profile documents for the "users" collection"""
+        rng = self._rng("vendors")
+        return [
+            {
+                "uid": f"syn-vendor-{self.seed}-{index:04d}",
+                "email": f"vendor{index:04d}@catalog.zilacart.test",
+                "fullName": f"{rng.choice(ADJECTIVES)} Traders {index:04d}",
+                "storeName": f"Store {index:04d}",
+                "role": "vendor",
+                "status": "active",
+            }
+            for index in range(self.vendor_count)
+        ]
+
+    def products(self) -> Iterator[dict]:
+        """Product documents, generated lazily"""
+        rng = self._rng("products")
+        names = list(CATEGORIES)
+        shares = [CATEGORIES[name][0] for name in names]
+        # Zipf-like vendor shares: vendor i owns ~1/(i+1) of the SKUs
+        vendor_ids = [vendor["uid"] for vendor in self.vendors()]
+        vendor_weights = [1 / (i + 1) for i in range(len(vendor_ids))]
+        statuses, status_weights = zip(*STATUS_WEIGHTS.items())
+
+        for index in range(self.size):
+            category = rng.choices(names, shares)[0]
+            _, median, sigma, brands, nouns = CATEGORIES[category]
+            brand = rng.choice(brands)
+            product_id = f"syn-{self.seed}-{index:06d}"
+            price = max(49, int(round(rng.lognormvariate(math.log(median), sigma), -1)) - 1)
+            reviews = min(int(rng.paretovariate(REVIEW_ALPHA)) - 1, MAX_REVIEWS)
+            rating = round(min(5.0, max(1.0, rng.gauss(4.2, 0.5))), 1) if reviews else None
+            in_stock = rng.random() >= OUT_OF_STOCK_SHARE
+            extra_images = rng.randint(0, 3)
+            yield {
+                "id": product_id,
+                "name": f"{rng.choice(ADJECTIVES)} {brand} {rng.choice(nouns)} {rng.randint(100, 999)}",
+                "description": f"{brand} {category.lower()} item generated for scale testing.",
+                "price": price,
+                "category": category,
+                "brand": brand,
+                "stock": int(rng.expovariate(1 / 40)) + 1 if in_stock else 0,
+                "status": rng.choices(statuses, status_weights)[0],
+                "vendorId": rng.choices(vendor_ids, vendor_weights)[0],
+                "sku": f"SYN-{_slug(category)[:4].upper()}-{index:06d}",
+                "imageUrl": self.image_url(category, product_id),
+                "additionalImageUrls": [self.image_url(category, product_id, n) for n in range(1, extra_images + 1)],
+                "rating": rating,
+                "reviews": reviews,
+                "dataAiHint": category.lower().split(" ")[0],
+                "dateAdded": (self.epoch + timedelta(minutes=rng.randint(0, 730 * 24 * 60))).isoformat(),
+            }
+
+    def image_url(self, category: str, product_id: str, variant: int = 0) -> str:
+        """Image on the local asset server (see tests/utils/asset_server.py)"""
+        return f"{self.asset_base_url}/assets/products/{_slug(category)}/{product_id}-{variant}.png"
+
+    # ==================== Output ====================
+    def write_jsonl(self, directory: str) -> Dict[str, str]:
+        """Write one JSONL file per collection; returns collection -> path"""
+        os.makedirs(directory, exist_ok=True)
+        datasets = {"categories": self.categories(), "users": self.vendors(), "products": self.products()}
+        paths = {}
+        for collection, docs in datasets.items():
+            path = os.path.join(directory, f"{collection}.jsonl")
+            with open(path, "w") as f:
+                for doc in docs:
+                    f.write(json.dumps(doc, separators=(",", ":")) + "\n")
+            paths[collection] = path
+        with open(os.path.join(directory, "manifest.json"), "w") as f:
+            json.dump({"size": self.size, "seed": self.seed, "vendors": self.vendor_count,
+                       "asset_base_url": self.asset_base_url}, f, indent=2)
+        return paths
+
+
+# ==================== Loading ====================
+ID_FIELDS = {"categories": "id", "users": "uid", "products": "id"}
+DATETIME_FIELDS = ("dateAdded",)
+
+
+def read_jsonl(path: str, chunk_size: int = 5000) -> Iterator[List[dict]]:
+    """Stream a JSONL file in chunks, restoring datetime fields"""
+    chunk = []
+    with open(path) as f:
+        for line in f:
+            doc = json.loads(line)
+            for name in DATETIME_FIELDS:
+                if isinstance(doc.get(name), str):
+                    doc[name] = datetime.fromisoformat(doc[name])
+            chunk.append(doc)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def load_catalog(seeder, directory: str, collections: Sequence[str] = ("categories", "users", "products"),
+                 chunk_size: int = 5000) -> Dict[str, int]:
+    """Bulk-load a generated catalog through FirestoreSeeder; returns collection -> documents written"""
+    written = {}
+    for collection in collections:
+        path = os.path.join(directory, f"{collection}.jsonl")
+        written[collection] = 0
+        for chunk in read_jsonl(path, chunk_size):
+            written[collection] += seeder.seed(collection, chunk, id_field=ID_FIELDS[collection]).written
+    return written
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic product catalog")
+    parser.add_argument("--size", default="1k", help="1k, 10k, 100k or a product count")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--out", help="Output directory (default: tests/reports/catalog-<size>-<seed>)")
+    parser.add_argument("--asset-base-url", default=ASSET_BASE_URL)
+    parser.add_argument("--load", action="store_true",
+                        help="Load into Firestore (the emulator when FIRESTORE_EMULATOR_HOST is set)")
+    parser.add_argument("--service-account", default=None)
+    parser.add_argument("--project-id", default=os.getenv("GCLOUD_PROJECT"))
+    args = parser.parse_args(argv)
+
+    generator = CatalogGenerator(args.size, args.seed, args.asset_base_url)
+    out = args.out or os.path.join("tests", "reports", f"catalog-{generator.size}-{generator.seed}")
+    paths = generator.write_jsonl(out)
+    print(f"Wrote {generator.size} products, {generator.vendor_count} vendors to {out}")
+
+    if args.load:
+        from tests.utils.firestore_seeder import FirestoreSeeder
+        seeder = FirestoreSeeder.create(args.service_account, args.project_id)
+        for collection, count in load_catalog(seeder, out, list(paths)).items():
+            print(f"Loaded {collection}: {count} written")
+
+
+if __name__ == "__main__":
+    main()
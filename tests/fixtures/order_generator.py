@@ -0,0 +1,166 @@
+"""Reproducible synthetic order history for analytics benchmarks
+
+    python -m tests.fixtures.order_generator --orders 100k --products 10k --out tests/reports/orders-100k
+
+Orders reference products from CatalogGenerator (same seed), so vendor IDs,
+prices and names line up with a generated catalog. Order volume grows over
+time, has a weekly rhythm and peaks in the last days of each month.
+"""
+import argparse
+import json
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Union
+
+from tests.fixtures.catalog_generator import DEFAULT_SEED, CatalogGenerator, parse_size
+
+
+STATUS_WEIGHTS = {
+    "delivered": 0.55, "shipped": 0.1, "out_for_delivery": 0.04, "processing": 0.12,
+    "pending": 0.08, "cancelled": 0.07, "refunded": 0.03, "partially_refunded": 0.01,
+}
+PAYMENT_METHODS = {"paypal": 0.45, "mpesa": 0.4, "card": 0.15}
+CITIES = ["Nairobi", "Mombasa", "Kisumu", "Nakuru", "Eldoret", "Thika"]
+MONTH_END_DAYS = 3
+MONTH_END_BOOST = 3.0
+WEEKEND_BOOST = 1.4
+SHIPPING_COST = 250
+TAX_RATE = 0.16
+
+
+def _day_weight(day: datetime, index: int, days: int) -> float:
+    """Relative order volume for a day: growth trend, weekends and month-end peaks"""
+    weight = 0.5 + index / days
+    if day.weekday() >= 5:
+        weight *= WEEKEND_BOOST
+    if (day + timedelta(days=MONTH_END_DAYS)).month != day.month:
+        weight *= MONTH_END_BOOST
+    return weight
+
+
+class OrderGenerator:
+    """Generates orders over the days before end_date from a fixed seed
+
+    end_date defaults to today (UTC) so that the analytics endpoint's default
+    "last 30 days" window always contains data.
+    """
+
+    def __init__(
+        self,
+        size: Union[int, str] = "10k",
+        catalog: Optional[CatalogGenerator] = None,
+        seed: int = DEFAULT_SEED,
+        days: int = 365,
+        customer_count: Optional[int] = None,
+        end_date: Optional[datetime] = None
+    ):
+        self.size = parse_size(size)
+        self.catalog = catalog or CatalogGenerator(1_000, seed)
+        self.seed = seed
+        self.days = days
+        self.customer_count = customer_count or max(100, self.size // 5)
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.end_date = end_date or today + timedelta(days=1)
+        self.start_date = self.end_date - timedelta(days=days)
+
+    def orders(self) -> Iterator[dict]:
+        """Order documents, generated lazily"""
+        rng = random.Random(f"{self.seed}:orders")
+        products = [p for p in self.catalog.products() if p["status"] == "active"]
+        # Popular products sell far more often (Zipf-like)
+        product_weights = [1 / (rank + 1) ** 0.8 for rank in range(len(products))]
+        rng.shuffle(product_weights)
+        days = [self.start_date + timedelta(days=i) for i in range(self.days)]
+        day_weights = [_day_weight(day, i, self.days) for i, day in enumerate(days)]
+        statuses, status_weights = zip(*STATUS_WEIGHTS.items())
+        methods, method_weights = zip(*PAYMENT_METHODS.items())
+
+        for index in range(self.size):
+            created = rng.choices(days, day_weights)[0] + timedelta(seconds=rng.randint(0, 86399))
+            items = []
+            for product in {p["id"]: p for p in rng.choices(products, product_weights, k=rng.randint(1, 4))}.values():
+                items.append({
+                    "productId": product["id"],
+                    "name": product["name"],
+                    "quantity": rng.choices((1, 2, 3, 5), (0.7, 0.2, 0.07, 0.03))[0],
+                    "price": product["price"],
+                    "imageUrl": product["imageUrl"],
+                    "vendorId": product["vendorId"],
+                })
+            subtotal = sum(item["price"] * item["quantity"] for item in items)
+            tax = round(subtotal * TAX_RATE, 2)
+            status = rng.choices(statuses, status_weights)[0]
+            customer = rng.randrange(self.customer_count)
+            yield {
+                "id": f"syn-order-{self.seed}-{index:07d}",
+                "userId": f"syn-customer-{self.seed}-{customer:06d}",
+                "userFullName": f"Customer {customer:06d}",
+                "userEmail": f"customer{customer:06d}@orders.zilacart.test",
+                "items": items,
+                "vendorIds": sorted({item["vendorId"] for item in items}),
+                "shippingAddress": {
+                    "fullName": f"Customer {customer:06d}",
+                    "address": f"{rng.randint(1, 999)} Moi Avenue",
+                    "city": rng.choice(CITIES),
+                    "phone": f"+2547{rng.randint(10000000, 99999999)}",
+                },
+                "paymentMethod": rng.choices(methods, method_weights)[0],
+                "status": status,
+                "statusHistory": [{"status": status, "timestamp": created.isoformat()}],
+                "subtotal": subtotal,
+                "shippingCost": SHIPPING_COST,
+                "taxAmount": tax,
+                "totalAmount": round(subtotal + SHIPPING_COST + tax, 2),
+                "createdAt": created.isoformat(),
+                "updatedAt": created.isoformat(),
+            }
+
+    def write_jsonl(self, directory: str) -> str:
+        """Write orders.jsonl; returns its path"""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, "orders.jsonl")
+        with open(path, "w") as f:
+            for order in self.orders():
+                f.write(json.dumps(order, separators=(",", ":")) + "\n")
+        return path
+
+
+def to_firestore(order: dict) -> dict:
+    """Turn ISO timestamps back into datetimes so the app sees Firestore Timestamps"""
+    order = dict(order)
+    for name in ("createdAt", "updatedAt"):
+        order[name] = datetime.fromisoformat(order[name])
+    order["statusHistory"] = [dict(entry, timestamp=datetime.fromisoformat(entry["timestamp"]))
+                              for entry in order["statusHistory"]]
+    return order
+
+
+def load_orders(seeder, orders: Iterable[dict], chunk_size: int = 5000) -> int:
+    """Bulk-write generated orders in chunks (orders may be a generator); returns documents written"""
+    written = 0
+    orders = iter(orders)
+    while True:
+        chunk = [to_firestore(order) for order in islice(orders, chunk_size)]
+        if not chunk:
+            return written
+        written += seeder.seed("orders", chunk, id_field="id", timestamps=False).written
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Generate synthetic orders")
+    parser.add_argument("--orders", default="10k", help="10k, 100k, 500k or an order count")
+    parser.add_argument("--products", default="1k", help="Size of the catalog the orders reference")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--out", help="Output directory (default: tests/reports/orders-<size>-<seed>)")
+    args = parser.parse_args(argv)
+
+    generator = OrderGenerator(args.orders, CatalogGenerator(args.products, args.seed), args.seed, args.days)
+    out = args.out or os.path.join("tests", "reports", f"orders-{generator.size}-{generator.seed}")
+    print(f"Wrote {generator.size} orders over {generator.days} days to {generator.write_jsonl(out)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,64 @@ TEST_PRODUCTS = {
 }
 
 
+# Documents seeded into the Firestore "products" collection (see tests/utils/firestore_seeder.py)
+SEED_PRODUCTS = [
+    {
+        "name": "Premium Laptop",
+        "description": "High-performance laptop perfect for development",
+        "price": 1299.99,
+        "category": "Electronics",
+        "stock": 50,
+        "status": "active",
+        "vendorId": "vendor_user_id_1",
+        "imageUrl": "https://via.placeholder.com/300x300?text=Laptop",
+        "rating": 4.8,
+        "reviews": 42,
+    },
+    {
+        "name": "Smartphone Pro",
+        "description": "Latest smartphone with advanced features",
+        "price": 999.99,
+        "category": "Electronics",
+        "stock": 100,
+        "status": "active",
+        "vendorId": "vendor_user_id_1",
+        "imageUrl": "https://via.placeholder.com/300x300?text=Phone",
+        "rating": 4.6,
+        "reviews": 187,
+    },
+    {
+        "name": "Wireless Headphones",
+        "description": "Premium noise-cancelling headphones",
+        "price": 249.99,
+        "category": "Electronics",
+        "stock": 75,
+        "status": "active",
+        "vendorId": "vendor_user_id_1",
+        "imageUrl": "https://via.placeholder.com/300x300?text=Headphones",
+        "rating": 4.5,
+        "reviews": 93,
+    },
+]
+
+# Single product used by setup_test_product.py
+E2E_SEED_PRODUCT = {
+    "name": "E2E Test Product",
+    "description": "Test product for E2E testing",
+    "price": 99.99,
+    "category": "Electronics",
+    "stock": 100,
+    "status": "active",
+    "vendorId": "vendor_user_id_1",
+    "imageUrl": "https://via.placeholder.com/300x300?text=Test+Product",
+    "rating": 4.5,
+    "reviews": 10,
+}
+
+# Natural key used to derive deterministic document IDs for seeded products
+SEED_PRODUCT_KEY = ["name", "vendorId"]
+
+
 def get_product(product_type: str = "laptop") -> dict:
     """Get product fixture by type"""
     return TEST_PRODUCTS.get(product_type, TEST_PRODUCTS["laptop"])
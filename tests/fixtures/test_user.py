@@ -22,6 +22,32 @@ TEST_USERS = {
 }
 
 
+# Firebase Auth accounts (and Firestore profiles) created by tests/setup_test_accounts.py
+SEED_ACCOUNTS = [
+    {
+        "email": "customer1@zilacart.com",
+        "password": "password123",
+        "displayName": "Test Customer",
+        "role": "customer",
+        "status": "active"
+    },
+    {
+        "email": "vendor1@zilacart.com",
+        "password": "password123",
+        "displayName": "Test Vendor",
+        "role": "vendor",
+        "status": "active"
+    },
+    {
+        "email": "admin@zilacart.com",
+        "password": "password123",
+        "displayName": "Test Admin",
+        "role": "admin",
+        "status": "active"
+    }
+]
+
+
 def get_user(user_type: str = "standard_user") -> dict:
     """Get user fixture by type"""
     return TEST_USERS.get(user_type, TEST_USERS["standard_user"])
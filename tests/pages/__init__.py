@@ -1,6 +1,8 @@
 # Page objects
 from .base_page import BasePage
 from .checkout_page import CheckoutPage
-from .product_details_page import ProductDetailsPage
+from .login_page import LoginPage
+from .product_details_page import ProductDetailsPage, ProductSnapshot, ButtonState
+from .products_page import ProductsPage
 
-__all__ = ["BasePage", "CheckoutPage", "ProductDetailsPage"]
+__all__ = ["BasePage", "CheckoutPage", "LoginPage", "ProductDetailsPage", "ProductSnapshot", "ButtonState", "ProductsPage"]
@@ -2,10 +2,14 @@
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
-from typing import Optional, List
+from typing import Optional, List, Dict, Sequence
+from tests.config import CONFIG
+from tests.utils.element_extractor import ElementExtractor
+from tests.utils.timeout_advisor import TimeoutAdvisor, locator_key
 from tests.utils.wait_helper import WaitHelper
 from tests.utils.logger import Logger
 import logging
+import time
 
 
 class BasePage:
@@ -46,14 +50,36 @@ class BasePage:
         return self.driver.current_url
     
     # ==================== Waits ====================
+    def _timed_wait(self, wait_fn, locator: tuple, timeout: Optional[float]):
+        """Run an element wait, recording its duration for the timeout advisor
+        
+        Without an explicit timeout the wait gets CONFIG.element_timeout, or
+        with ADAPTIVE_TIMEOUTS on the locator's learned budget, and fails when
+        the budget runs out. After a few misses in a row the advisor hands out
+        the configured timeout once, so a locator that got slower can record
+        its real duration.
+        """
+        advisor = TimeoutAdvisor.get_advisor()
+        key = locator_key(self.__class__.__name__, locator)
+        configured = timeout or CONFIG.element_timeout
+        budget = configured if timeout else advisor.timeout(key, configured)
+        start = time.perf_counter()
+        result = wait_fn(self.driver, locator, budget)
+        duration = time.perf_counter() - start
+        over_budget = not result and budget < configured
+        if over_budget:
+            self.logger.warning(f"{locator} not found within its adaptive budget of {budget:.1f}s "
+                                f"(configured {configured}s)")
+        advisor.record(key, duration, configured, found=bool(result), over_budget=over_budget)
+        return result
+    
     def wait_for_element(
         self,
         locator: tuple,
         timeout: int = None
     ) -> Optional[WebElement]:
         """Wait for element to be visible"""
-        timeout = timeout or 20
-        return self.wait.wait_for_element_visible(self.driver, locator, timeout)
+        return self._timed_wait(self.wait.wait_for_element_visible, locator, timeout)
     
     def wait_for_elements(
         self,
@@ -61,8 +87,7 @@ class BasePage:
         timeout: int = None
     ) -> List[WebElement]:
         """Wait for multiple elements to be visible"""
-        timeout = timeout or 20
-        return self.wait.wait_for_elements_visible(self.driver, locator, timeout)
+        return self._timed_wait(self.wait.wait_for_elements_visible, locator, timeout)
     
     def wait_for_clickable(
         self,
@@ -70,8 +95,7 @@ class BasePage:
         timeout: int = None
     ) -> Optional[WebElement]:
         """Wait for element to be clickable"""
-        timeout = timeout or 20
-        return self.wait.wait_for_element_clickable(self.driver, locator, timeout)
+        return self._timed_wait(self.wait.wait_for_element_clickable, locator, timeout)
     
     def wait_for_url_contains(self, url_fragment: str, timeout: int = 20) -> bool:
         """Wait for URL to contain fragment"""
@@ -81,8 +105,17 @@ class BasePage:
         """Wait for element to be invisible"""
         return self.wait.wait_for_element_invisible(self.driver, locator, timeout)
     
+    def wait_until_settled(self, quiet_ms: int = None, timeout: int = None) -> bool:
+        """Wait for hydration plus a quiet DOM (see WaitHelper.wait_for_page_settled)"""
+        quiet_ms = quiet_ms or CONFIG.settle_quiet_ms
+        timeout = timeout or CONFIG.settle_timeout
+        settled = self.wait.wait_for_page_settled(self.driver, quiet_ms, timeout)
+        if not settled:
+            self.logger.warning(f"Page did not settle within {timeout}s; answering with current DOM")
+        return settled
+    
     # ==================== Element Interactions ====================
-    def click(self, locator: tuple, timeout: int = 20) -> bool:
+    def click(self, locator: tuple, timeout: int = None) -> bool:
         """Click element safely"""
         try:
             element = self.wait_for_clickable(locator, timeout)
@@ -95,7 +128,7 @@ class BasePage:
             self.logger.error(f"Failed to click element {locator}: {e}")
             return False
     
-    def type_text(self, locator: tuple, text: str, timeout: int = 20) -> bool:
+    def type_text(self, locator: tuple, text: str, timeout: int = None) -> bool:
         """Type text into element"""
         try:
             element = self.wait_for_element(locator, timeout)
@@ -109,7 +142,7 @@ class BasePage:
             self.logger.error(f"Failed to type text into {locator}: {e}")
             return False
     
-    def get_text(self, locator: tuple, timeout: int = 20) -> Optional[str]:
+    def get_text(self, locator: tuple, timeout: int = None) -> Optional[str]:
         """Get element text"""
         try:
             element = self.wait_for_element(locator, timeout)
@@ -122,7 +155,7 @@ class BasePage:
             self.logger.error(f"Failed to get text from {locator}: {e}")
             return None
     
-    def get_attribute(self, locator: tuple, attribute: str, timeout: int = 20) -> Optional[str]:
+    def get_attribute(self, locator: tuple, attribute: str, timeout: int = None) -> Optional[str]:
         """Get element attribute"""
         try:
             element = self.wait_for_element(locator, timeout)
@@ -140,19 +173,44 @@ class BasePage:
         element = self.wait_for_element(locator, timeout)
         return element is not None
     
+    def count_elements(self, locator: tuple, visible_only: bool = False) -> int:
+        """Count matching elements once the page has settled"""
+        self.wait_until_settled()
+        rows = ElementExtractor.extract(self.driver, locator, ["visible"])
+        return sum(1 for row in rows if row["visible"] or not visible_only)
+    
     def is_element_present(self, locator: tuple) -> bool:
-        """Check if element is present in DOM"""
-        try:
-            self.driver.find_element(*locator)
-            return True
-        except:
-            return False
+        """Check if element is present in DOM once the page has settled"""
+        return self.count_elements(locator) > 0
+    
+    def is_element_absent(self, locator: tuple, visible_only: bool = False) -> bool:
+        """Check that no (visible) element matches once the page has settled
+        
+        Unlike is_element_visible this never waits for the element itself,
+        so the expected "not there" outcome costs only the settle time.
+        """
+        return self.count_elements(locator, visible_only) == 0
     
     # ==================== JavaScript ====================
     def execute_script(self, script: str, *args):
         """Execute JavaScript"""
         return self.driver.execute_script(script, *args)
     
+    def extract(
+        self,
+        locator: tuple,
+        fields: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """Get text/attributes/styles/boxes for all matching elements in one call
+        
+        Fields: text, tag, visible, enabled, rect, attr:<name>, prop:<name>,
+        style:<property>, count:<css>, descendants:<css>@<attr>.
+        """
+        rows = ElementExtractor.extract(self.driver, locator, fields, limit)
+        self.logger.info(f"Extracted {len(rows)} element(s) from {locator}")
+        return rows
+    
     def scroll_to_element(self, locator: tuple) -> bool:
         """Scroll to element"""
         try:
@@ -145,5 +145,4 @@ class CheckoutPage(BasePage):
     
     def get_cart_items_count(self) -> int:
         """Get number of cart items displayed"""
-        items = self.wait_for_elements(self.CART_ITEMS)
-        return len(items)
+        return self.count_elements(self.CART_ITEMS, visible_only=True)
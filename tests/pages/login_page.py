@@ -0,0 +1,32 @@
+"""Login Page Object"""
+from selenium.webdriver.common.by import By
+from .base_page import BasePage
+
+
+class LoginPage(BasePage):
+    """Login (/auth/login) page object"""
+
+    # ==================== Locators ====================
+    EMAIL_INPUT = (By.ID, "email")
+    PASSWORD_INPUT = (By.ID, "password")
+    SUBMIT_BUTTON = (By.CSS_SELECTOR, "form button[type='submit']")
+
+    # ==================== Navigation ====================
+    def navigate_to_login(self):
+        """Navigate to the login page"""
+        self.navigate_to_page("/auth/login")
+
+    # ==================== Actions ====================
+    def log_in(self, email: str, password: str, timeout: int = 20) -> bool:
+        """Sign in and wait for the app to leave the login page (it redirects by role)"""
+        self.navigate_to_login()
+        if not (self.type_text(self.EMAIL_INPUT, email) and self.type_text(self.PASSWORD_INPUT, password)):
+            return False
+        if not self.click(self.SUBMIT_BUTTON):
+            return False
+        signed_in = self.wait.wait_for_condition(
+            self.driver, lambda driver: "/auth/login" not in driver.current_url, timeout
+        )
+        if not signed_in:
+            self.logger.warning(f"Still on the login page {timeout}s after signing in as {email}")
+        return signed_in
@@ -1,8 +1,59 @@
 """Product Details Page Object"""
+from dataclasses import dataclass, field
+from typing import List, Optional
 from selenium.webdriver.common.by import By
+from tests.utils.element_extractor import ElementExtractor
 from .base_page import BasePage
 
 
+BUTTON_FIELDS = ["text", "visible", "enabled", "attr:aria-label", "descendants:svg@class"]
+
+
+@dataclass
+class ButtonState:
+    """State of a PDP action button"""
+    text: str = ""
+    visible: bool = False
+    enabled: bool = False
+    aria_label: Optional[str] = None
+    icon_classes: List[str] = field(default_factory=list)
+    
+    @property
+    def has_icon(self) -> bool:
+        """Button renders at least one SVG icon"""
+        return len(self.icon_classes) > 0
+    
+    @classmethod
+    def from_row(cls, row: Optional[dict]) -> Optional["ButtonState"]:
+        """Build from an ElementExtractor row (None when the button is absent)"""
+        if row is None:
+            return None
+        return cls(
+            text=row["text"],
+            visible=row["visible"],
+            enabled=row["enabled"],
+            aria_label=row["attr:aria-label"],
+            icon_classes=[cls_name or "" for cls_name in row["descendants:svg@class"]],
+        )
+
+
+@dataclass
+class ProductSnapshot:
+    """Full PDP state captured in a single in-page evaluation"""
+    url: str
+    title: Optional[str] = None
+    price: Optional[str] = None
+    rating: Optional[str] = None
+    description: Optional[str] = None
+    stock_text: Optional[str] = None
+    in_stock: bool = True
+    reviews_count: int = 0
+    quantity: Optional[str] = None
+    add_to_cart: Optional[ButtonState] = None
+    wishlist: Optional[ButtonState] = None
+    buy_now: Optional[ButtonState] = None
+
+
 class ProductDetailsPage(BasePage):
     """Product Details Page object"""
     
@@ -16,7 +67,11 @@ class ProductDetailsPage(BasePage):
     
     # Action buttons
     ADD_TO_CART_BUTTON = (By.XPATH, "//button[contains(text(), 'Add to Cart') or contains(text(), 'Add To Cart')]")
-    WISHLIST_BUTTON = (By.XPATH, "//button[contains(@aria-label, 'wishlist') or contains(@class, 'wishlist')]")
+    WISHLIST_BUTTON = (By.XPATH, "//button[contains(@aria-label, 'Wishlist') or contains(@aria-label, 'wishlist') "
+                                 "or contains(@class, 'wishlist')]")
+    # Toggles labelled by state; only signed-in users flip them (guests get a "Login Required" toast)
+    CART_TOGGLE = (By.XPATH, "//button[@aria-label='Add to Cart' or @aria-label='Remove from Cart']")
+    WISHLIST_TOGGLE = (By.XPATH, "//button[@aria-label='Add to Wishlist' or @aria-label='Remove from Wishlist']")
     BUY_NOW_BUTTON = (By.XPATH, "//button[contains(text(), 'Buy Now')]")
     
     # Quantity controls
@@ -56,6 +111,49 @@ class ProductDetailsPage(BasePage):
         """Get product description"""
         return self.get_text(self.PRODUCT_DESCRIPTION)
     
+    def snapshot(self, timeout: int = None) -> ProductSnapshot:
+        """Capture title, price, rating, stock, reviews, buttons and quantity at once
+        
+        Waits once for the product title, then reads everything else with a
+        single execute_script call instead of one wait per getter.
+        """
+        self.wait_for_element(self.PRODUCT_TITLE, timeout)
+        
+        data = ElementExtractor.extract_many(self.driver, {
+            "title": (self.PRODUCT_TITLE, ["text"], 1),
+            "price": (self.PRODUCT_PRICE, ["text"], 1),
+            "rating": (self.PRODUCT_RATING, ["text"], 1),
+            "description": (self.PRODUCT_DESCRIPTION, ["text"], 1),
+            "stock": (self.STOCK_INDICATOR, ["text"], 1),
+            "out_of_stock": (self.OUT_OF_STOCK_TEXT, ["visible"], 1),
+            "reviews": (self.REVIEW_ITEMS, ["visible"]),
+            "quantity": (self.QUANTITY_INPUT, ["prop:value"], 1),
+            "add_to_cart": (self.ADD_TO_CART_BUTTON, BUTTON_FIELDS, 1),
+            "wishlist": (self.WISHLIST_BUTTON, BUTTON_FIELDS, 1),
+            "buy_now": (self.BUY_NOW_BUTTON, BUTTON_FIELDS, 1),
+        })
+        
+        def value(name: str, key: str):
+            rows = data[name]
+            return rows[0][key] if rows else None
+        
+        snapshot = ProductSnapshot(
+            url=self.get_current_url(),
+            title=value("title", "text"),
+            price=value("price", "text"),
+            rating=value("rating", "text"),
+            description=value("description", "text"),
+            stock_text=value("stock", "text"),
+            in_stock=not value("out_of_stock", "visible"),
+            reviews_count=sum(1 for row in data["reviews"] if row["visible"]),
+            quantity=value("quantity", "prop:value"),
+            add_to_cart=ButtonState.from_row(next(iter(data["add_to_cart"]), None)),
+            wishlist=ButtonState.from_row(next(iter(data["wishlist"]), None)),
+            buy_now=ButtonState.from_row(next(iter(data["buy_now"]), None)),
+        )
+        self.logger.info(f"PDP snapshot: {snapshot.title} at {snapshot.price}, in_stock={snapshot.in_stock}")
+        return snapshot
+    
     # ==================== Quantity ====================
     def set_quantity(self, quantity: int) -> bool:
         """Set product quantity"""
@@ -91,6 +189,39 @@ class ProductDetailsPage(BasePage):
         self.logger.info("Clicking Wishlist button...")
         return self.click(self.WISHLIST_BUTTON)
     
+    def _toggle(self, locator: tuple, timeout: int = 10) -> bool:
+        """Click a state toggle and wait for its aria-label to flip"""
+        before = self.get_attribute(locator, "aria-label")
+        if before is None or not self.click(locator):
+            return False
+        flipped = self.wait.wait_for_condition(
+            self.driver,
+            lambda driver: any(el.get_attribute("aria-label") not in (None, before)
+                               for el in driver.find_elements(*locator)),
+            timeout
+        )
+        if not flipped:
+            self.logger.warning(f"{locator} still '{before}' {timeout}s after clicking it")
+        return flipped
+    
+    def is_in_cart(self) -> bool:
+        """Whether the cart toggle offers removal"""
+        return self.get_attribute(self.CART_TOGGLE, "aria-label") == "Remove from Cart"
+    
+    def toggle_cart(self, timeout: int = 10) -> bool:
+        """Add the product to the cart or remove it; True once the toggle reflects the change"""
+        self.logger.info("Toggling cart...")
+        return self._toggle(self.CART_TOGGLE, timeout)
+    
+    def is_in_wishlist(self) -> bool:
+        """Whether the wishlist toggle offers removal"""
+        return self.get_attribute(self.WISHLIST_TOGGLE, "aria-label") == "Remove from Wishlist"
+    
+    def toggle_wishlist(self, timeout: int = 10) -> bool:
+        """Add the product to the wishlist or remove it; True once the toggle reflects the change"""
+        self.logger.info("Toggling wishlist...")
+        return self._toggle(self.WISHLIST_TOGGLE, timeout)
+    
     def click_buy_now(self) -> bool:
         """Click Buy Now button"""
         self.logger.info("Clicking Buy Now...")
@@ -99,14 +230,12 @@ class ProductDetailsPage(BasePage):
     # ==================== Stock ====================
     def is_in_stock(self) -> bool:
         """Check if product is in stock"""
-        out_of_stock = self.is_element_visible(self.OUT_OF_STOCK_TEXT, timeout=3)
-        return not out_of_stock
+        return self.is_element_absent(self.OUT_OF_STOCK_TEXT, visible_only=True)
     
     # ==================== Reviews ====================
     def get_reviews_count(self) -> int:
         """Get number of reviews"""
-        reviews = self.wait_for_elements(self.REVIEW_ITEMS)
-        return len(reviews)
+        return self.count_elements(self.REVIEW_ITEMS, visible_only=True)
     
     def scroll_to_reviews(self) -> bool:
         """Scroll to reviews section"""
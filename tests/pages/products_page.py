@@ -0,0 +1,51 @@
+"""Product Listing Page Object"""
+from typing import Dict, List, Optional
+from selenium.webdriver.common.by import By
+from tests.utils.page_metrics import PageMetrics
+from .base_page import BasePage
+
+
+class ProductsPage(BasePage):
+    """Product listing (/products) page object"""
+
+    # ==================== Locators ====================
+    PRODUCT_CARDS = (By.CSS_SELECTOR, "a[href^='/products/']")
+    PAGINATION_LINKS = (By.CSS_SELECTOR, "nav[aria-label='pagination'] a")
+    NO_PRODUCTS_TEXT = (By.XPATH, "//p[contains(text(), 'No Products Found')]")
+
+    # ==================== Navigation ====================
+    def navigate_to_products(self, query: str = ""):
+        """Navigate to the listing, optionally with a query string"""
+        self.navigate_to_page(f"/products{'?' + query if query else ''}")
+
+    def wait_for_products(self, timeout: int = 30) -> bool:
+        """Wait for product cards or the empty state (one condition), then for rendering to settle"""
+        loaded = self.wait.wait_for_condition(
+            self.driver,
+            lambda driver: driver.find_elements(*self.PRODUCT_CARDS) or driver.find_elements(*self.NO_PRODUCTS_TEXT),
+            timeout
+        )
+        return loaded and self.wait_until_settled()
+
+    def open_product(self, index: int = 0) -> bool:
+        """Click a product card (client-side navigation, the page is not reloaded)"""
+        cards = self.wait_for_elements(self.PRODUCT_CARDS)
+        if index >= len(cards):
+            return False
+        cards[index].click()
+        return self.wait_for_url_contains("/products/")
+
+    # ==================== Content ====================
+    def get_product_links(self) -> List[str]:
+        """Absolute URLs of the product cards on the current page"""
+        rows = self.extract(self.PRODUCT_CARDS, ["prop:href"])
+        return list(dict.fromkeys(row["prop:href"] for row in rows if row["prop:href"]))
+
+    def get_product_count(self) -> int:
+        """Number of distinct products shown"""
+        return len(self.get_product_links())
+
+    # ==================== Performance ====================
+    def get_performance_metrics(self) -> Dict[str, Optional[float]]:
+        """LCP, paint/navigation timings and DOM node count for the loaded listing"""
+        return PageMetrics.collect(self.driver)
@@ -0,0 +1 @@
+# Performance benchmarks (opt-in: RUN_BENCHMARKS=true)
@@ -0,0 +1,126 @@
+"""Weighted storefront journeys for the browser farm, built on the page objects
+
+    python -m tests.perf.journeys --browsers 8 --duration 300
+
+Each journey mirrors a functional flow (listing, PDP, add to cart,
+checkout) so the load numbers come from the same page objects the e2e
+suites use. Steps raise StepError when the page object reports failure.
+The app sends anonymous shoppers to the login page on add to cart and
+checkout, so those journeys first sign the browser in with the worker's
+account (once per browser, timed as the "sign_in" step).
+"""
+import argparse
+from typing import List, Optional
+
+from tests.config import CONFIG
+from tests.fixtures.test_data import get_valid_address
+from tests.pages.checkout_page import CheckoutPage
+from tests.pages.login_page import LoginPage
+from tests.pages.product_details_page import ProductDetailsPage
+from tests.pages.products_page import ProductsPage
+from tests.utils.browser_farm import BrowserFarm, JourneySession, Journeys
+
+
+class StepError(Exception):
+    """A page object reported that a step did not happen"""
+
+
+def _require(ok, what: str):
+    if not ok:
+        raise StepError(what)
+    return ok
+
+
+def _browse(session: JourneySession) -> List[str]:
+    """Open the listing and return its product URLs"""
+    listing = ProductsPage(session.driver, session.base_url)
+    with session.step("listing"):
+        listing.navigate_to_products()
+        _require(listing.wait_for_products(), "product listing did not render")
+        links = _require(listing.get_product_links(), "no products listed")
+    return links
+
+
+def _view_product(session: JourneySession, url: str) -> ProductDetailsPage:
+    pdp = ProductDetailsPage(session.driver, session.base_url)
+    with session.step("pdp"):
+        pdp.navigate_to_url(url)
+        _require(pdp.snapshot().title, "product title did not render")
+    return pdp
+
+
+def _sign_in(session: JourneySession):
+    """Sign the browser in with the worker's account unless it already is"""
+    if session.signed_in:
+        return
+    with session.step("sign_in"):
+        _require(session.account, "no farm account configured")
+        _require(LoginPage(session.driver, session.base_url).log_in(session.account["email"],
+                                                                     session.account["password"]),
+                 f"could not sign in as {session.account['email']}")
+    session.signed_in = True
+
+
+def _add_to_cart(session: JourneySession, pdp: ProductDetailsPage):
+    with session.step("add_to_cart"):
+        _require(pdp.click_add_to_cart(), "add to cart failed")
+
+
+def browse(session: JourneySession):
+    """Window shopping: listing then one product"""
+    _view_product(session, session.rng.choice(_browse(session)))
+
+
+def compare(session: JourneySession):
+    """Listing then two or three products"""
+    links = _browse(session)
+    for url in session.rng.sample(links, min(len(links), session.rng.randint(2, 3))):
+        _view_product(session, url)
+
+
+def add_to_cart(session: JourneySession):
+    """Listing, product, add to cart"""
+    _sign_in(session)
+    _add_to_cart(session, _view_product(session, session.rng.choice(_browse(session))))
+
+
+def checkout(session: JourneySession):
+    """Listing, product, add to cart, then the checkout form up to payment selection"""
+    _sign_in(session)
+    _add_to_cart(session, _view_product(session, session.rng.choice(_browse(session))))
+    page = CheckoutPage(session.driver, session.base_url)
+    with session.step("checkout_load"):
+        page.navigate_to_checkout()
+        _require(page.assert_checkout_page_loaded(), "checkout did not render")
+    with session.step("checkout_form"):
+        address = get_valid_address()
+        _require(page.fill_address_form(**address), "address form could not be filled")
+        _require(page.select_paypal_payment(), "PayPal option not selectable")
+
+
+# Traffic mix of a typical storefront: most visits browse, few reach checkout
+JOURNEYS: Journeys = {
+    "browse": (0.5, browse),
+    "compare": (0.2, compare),
+    "add_to_cart": (0.2, add_to_cart),
+    "checkout": (0.1, checkout),
+}
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run synthetic storefront users in headless browsers")
+    parser.add_argument("--base-url", default=CONFIG.base_url)
+    parser.add_argument("--browsers", type=int, default=CONFIG.farm_browsers, help="0 = size to this machine")
+    parser.add_argument("--duration", type=float, default=CONFIG.farm_duration_s, help="Seconds")
+    parser.add_argument("--bucket", type=float, default=CONFIG.farm_bucket_s, help="Timeline bucket in seconds")
+    args = parser.parse_args(argv)
+
+    accounts = [{"email": CONFIG.test_email, "password": CONFIG.test_password}]
+    report = BrowserFarm(JOURNEYS, args.base_url, args.browsers, args.duration, CONFIG.browser.value,
+                         accounts=accounts).run(args.bucket)
+    print(report.format_table())
+    print(f"Report: {report.write(CONFIG.benchmark_dir)}")
+
+
+if __name__ == "__main__":
+    main()
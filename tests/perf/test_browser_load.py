@@ -0,0 +1,53 @@
+"""Browser-level load: concurrent headless users running weighted storefront journeys
+
+Catches what API benchmarks miss - client rendering, hydration and the
+Firebase client SDK's own traffic - using the e2e page objects.
+"""
+from typing import List
+
+import pytest
+
+from tests.config import CONFIG
+from tests.perf.journeys import JOURNEYS
+from tests.utils.browser_farm import BrowserFarm, default_browser_count
+from tests.utils.navigation import wait_for_http_ready
+
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.slow,
+    pytest.mark.skipif(not CONFIG.run_benchmarks, reason="Benchmarks disabled (set RUN_BENCHMARKS=true)"),
+]
+
+PASSWORD = "Farm@12345"
+
+
+def farm_accounts(config, request, browsers: int) -> List[dict]:
+    """One seeded customer per browser on the emulator, else the configured test account for all"""
+    if not config.use_firebase_emulator:
+        return [{"email": config.test_email, "password": config.test_password}]
+    accounts = [{"email": f"farm-customer-{i:03d}@zilacart.test", "password": PASSWORD, "role": "customer",
+                 "status": "active"} for i in range(browsers)]
+    request.getfixturevalue("firebase_emulator").seeder.seed_users(accounts)
+    return accounts
+
+
+def test_browser_farm_load(config, request):
+    """Synthetic users complete their journeys with a low error rate for the whole run"""
+    wait_for_http_ready(f"{config.base_url}/products")
+    browsers = config.farm_browsers or default_browser_count()
+    farm = BrowserFarm(JOURNEYS, config.base_url, browsers, config.farm_duration_s, config.browser.value,
+                       accounts=farm_accounts(config, request, browsers))
+    report = farm.run(config.farm_bucket_s)
+    path = report.write(config.benchmark_dir)
+    print(f"\n{report.format_table()}\nReport: {path}")
+
+    problems = []
+    if report.error_rate() > config.farm_max_error_rate:
+        problems.append(f"Error rate {report.error_rate():.1%} > {config.farm_max_error_rate:.1%}: {report.errors(5)}")
+    # Errors concentrated late in the run point at degradation under sustained load
+    for bucket in report.timeline():
+        for step, summary in bucket["steps"].items():
+            if summary["count"] >= 10 and summary["error_rate"] > config.farm_max_error_rate * 2:
+                problems.append(f"{step} at {bucket['start_s']:.0f}s: {summary['error_rate']:.1%} errors")
+    assert not problems, "Browser farm issues:\n" + "\n".join(problems)
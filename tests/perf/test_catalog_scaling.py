@@ -0,0 +1,82 @@
+"""Catalog-size scaling benchmark for /api/products, /api/categories and the /products listing
+
+Seeds growing synthetic catalogs into the Firestore emulator and measures
+server response times plus browser LCP and DOM size at each size. The app
+under test must read the same emulator: start it with
+FIRESTORE_EMULATOR_HOST=127.0.0.1:8080 GCLOUD_PROJECT=demo-zilacart.
+"""
+from itertools import islice
+
+import pytest
+import requests
+
+from tests.config import CONFIG
+from tests.fixtures.catalog_generator import CatalogGenerator
+from tests.pages.products_page import ProductsPage
+from tests.utils.benchmark import ScalingReport, time_request
+from tests.utils.navigation import wait_for_http_ready
+
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(not CONFIG.run_benchmarks, reason="Benchmarks disabled (set RUN_BENCHMARKS=true)"),
+]
+
+# Vendor count is fixed so every catalog is a prefix of the largest one and
+# each step only seeds the new products.
+VENDOR_COUNT = 50
+SEED_CHUNK = 5000
+
+
+def seed_products(seeder, products):
+    """Bulk-write products in chunks; returns how many are active"""
+    for start in range(0, len(products), SEED_CHUNK):
+        seeder.seed("products", products[start:start + SEED_CHUNK], id_field="id")
+    return sum(1 for product in products if product["status"] == "active")
+
+
+def test_catalog_scaling(config, firebase_emulator, driver):
+    """Listing cost should grow at most linearly with catalog size"""
+    sizes = sorted(config.catalog_benchmark_sizes)
+    products_url = f"{config.api_base_url}/products"
+    categories_url = f"{config.api_base_url}/categories"
+    wait_for_http_ready(f"{products_url}?limit=1")
+
+    generator = CatalogGenerator(sizes[-1], vendor_count=VENDOR_COUNT)
+    catalog = generator.products()
+    seeder = firebase_emulator.seeder
+    firebase_emulator.clear_firestore()
+    seeder.seed("categories", generator.categories(), id_field="id")
+
+    session = requests.Session()
+    page = ProductsPage(driver, config.base_url)
+    report = ScalingReport("catalog_scaling")
+    seeded = active = 0
+
+    for size in sizes:
+        active += seed_products(seeder, list(islice(catalog, size - seeded)))
+        seeded = size
+
+        total = session.get(products_url, params={"limit": 1}, timeout=60).json().get("totalProducts")
+        if total != active:
+            pytest.skip(f"App reports {total} active products, emulator has {active}: "
+                        f"the app server is not reading the emulator")
+
+        report.add(size, "api_products_ms", time_request(session, products_url, config.benchmark_repeats, timeout=120))
+        report.add(size, "api_categories_ms", time_request(session, categories_url, config.benchmark_repeats, timeout=60))
+
+        lcp, dom_nodes = [], []
+        for _ in range(config.benchmark_repeats):
+            page.navigate_to_products()
+            assert page.wait_for_products(timeout=120), f"Listing did not render with {size} products"
+            metrics = page.get_performance_metrics()
+            lcp.append(metrics["lcp_ms"])
+            dom_nodes.append(metrics["dom_nodes"])
+        report.add(size, "listing_lcp_ms", lcp)
+        report.add(size, "listing_dom_nodes", dom_nodes)
+
+    path = report.write(config.benchmark_dir)
+    print(f"\n{report.format_table(config.benchmark_max_exponent)}\nReport: {path}")
+
+    flagged = report.superlinear(config.benchmark_max_exponent)
+    assert not flagged, f"Super-linear growth with catalog size (exponent > {config.benchmark_max_exponent}): {flagged}"
@@ -0,0 +1,192 @@
+"""Flash-sale stress test: many customers buying the same low-stock product at once
+
+Every customer saves a cart, reads it back and places an order through the
+API at the same instant; some re-submit the order with the same idempotency
+key the way a double-clicking shopper does. Optional headless browsers load
+the product page during the sale. Afterwards the Firestore state is checked
+for oversold stock, duplicate orders and inconsistent totals.
+
+Like the other benchmarks this needs the app to run against the emulators
+(FIRESTORE_EMULATOR_HOST / FIREBASE_AUTH_EMULATOR_HOST / GCLOUD_PROJECT).
+"""
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tests.config import CONFIG
+from tests.pages.product_details_page import ProductDetailsPage
+from tests.utils.api_client import APIClient
+from tests.utils.benchmark import ScalingReport
+from tests.utils.browser_helper import BrowserHelper
+from tests.utils.navigation import wait_for_http_ready
+
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.slow,
+    pytest.mark.skipif(not CONFIG.run_benchmarks, reason="Benchmarks disabled (set RUN_BENCHMARKS=true)"),
+]
+
+PASSWORD = "Stress@12345"
+# Every DUPLICATE_EVERY-th customer submits its order twice concurrently with one idempotency key
+DUPLICATE_EVERY = 5
+SHIPPING_ADDRESS = {"fullName": "Flash Sale", "address": "1 Moi Avenue", "city": "Nairobi", "phone": "+254700000000"}
+
+HOT_PRODUCT = {"id": "stress-hot-item", "name": "Flash Sale Phone", "price": 9999, "category": "Electronics",
+               "status": "active", "vendorId": "stress-vendor", "imageUrl": ""}
+FILLER_PRODUCT = {"id": "stress-filler", "name": "Phone Case", "price": 499, "category": "Electronics",
+                  "status": "active", "vendorId": "stress-vendor", "imageUrl": "", "stock": 100_000}
+
+
+class Timings:
+    """Thread-safe latency samples per step"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = defaultdict(list)
+
+    def timed(self, step: str, func, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.samples[step].append((time.perf_counter() - start) * 1000)
+
+
+def cart_total(cart: dict) -> float:
+    return sum(item["price"] * item["quantity"] for item in cart.get("items", []))
+
+
+def shop(config, token: str, index: int, barrier: threading.Barrier, timings: Timings) -> dict:
+    """One customer's flash-sale checkout; returns what happened"""
+    client = APIClient(config.api_base_url, timeout=120)
+    client.session.headers["Authorization"] = f"Bearer {token}"
+    items = [{"productId": HOT_PRODUCT["id"], "quantity": 1}, {"productId": FILLER_PRODUCT["id"], "quantity": 1}]
+    outcome = {"index": index, "problems": []}
+    try:
+        barrier.wait()
+        saved = timings.timed("cart_save", client.post, "/cart", json={"items": items})
+        cart = timings.timed("cart_get", client.get, "/cart").json()
+        expected = HOT_PRODUCT["price"] + FILLER_PRODUCT["price"]
+        if saved.status_code != 200 or cart_total(cart) != expected:
+            outcome["problems"].append(f"cart total {cart_total(cart)} != {expected} (save HTTP {saved.status_code})")
+        outcome["cart_total"] = cart_total(cart)
+
+        order = {"items": items, "shippingAddress": SHIPPING_ADDRESS, "paymentMethod": "paypal"}
+        headers = {"X-Idempotency-Key": str(uuid.uuid4())}
+        submissions = 2 if index % DUPLICATE_EVERY == 0 else 1
+        with ThreadPoolExecutor(max_workers=submissions) as pool:
+            responses = list(pool.map(
+                lambda _: timings.timed("order_create", client.post, "/orders", json=order, headers=headers),
+                range(submissions)
+            ))
+        outcome["order_ids"] = {r.json().get("id") for r in responses if r.status_code == 201}
+        outcome["statuses"] = [r.status_code for r in responses]
+    except Exception as e:
+        outcome["problems"].append(f"{type(e).__name__}: {e}")
+    finally:
+        client.close()
+    return outcome
+
+
+def watch_product_page(config, product_id: str, stop: threading.Event, timings: Timings):
+    """Reload the hot product's page in a headless browser until the sale ends"""
+    driver = BrowserHelper.get_driver(config.browser.value, headless=True)
+    if driver is None:
+        return
+    try:
+        page = ProductDetailsPage(driver, config.base_url)
+        while not stop.is_set():
+            timings.timed("pdp_load", lambda: (page.navigate_to_product(product_id), page.snapshot()))
+    finally:
+        BrowserHelper.close_driver(driver)
+
+
+def verify_state(db, stock: int, outcomes: list, customer_uids: dict) -> list:
+    """Invariants that must hold after the sale"""
+    problems = []
+    hot = db.collection("products").document(HOT_PRODUCT["id"]).get().to_dict()
+    orders = [dict(doc.to_dict(), id=doc.id) for doc in db.collection("orders").stream()]
+    sold = sum(item["quantity"] for order in orders for item in order["items"] if item["productId"] == HOT_PRODUCT["id"])
+
+    if hot["stock"] < 0:
+        problems.append(f"Stock went negative: {hot['stock']}")
+    if sold > stock:
+        problems.append(f"Oversold: {sold} units sold from stock of {stock}")
+    if hot["stock"] != stock - sold:
+        problems.append(f"Stock drift: {hot['stock']} left but {stock} - {sold} sold = {stock - sold}")
+
+    per_customer = defaultdict(list)
+    for order in orders:
+        per_customer[order["userId"]].append(order["id"])
+        subtotal = sum(item["price"] * item["quantity"] for item in order["items"])
+        expected_total = subtotal - order.get("discountAmount", 0) + order["taxAmount"] + order["shippingCost"]
+        if abs(subtotal - order["subtotal"]) > 0.01 or abs(expected_total - order["totalAmount"]) > 0.01:
+            problems.append(f"Order {order['id']} totals inconsistent: {order['subtotal']}/{order['totalAmount']}")
+    duplicates = {uid: ids for uid, ids in per_customer.items() if len(ids) > 1}
+    if duplicates:
+        names = {uid: email for email, uid in customer_uids.items()}
+        problems.append(f"{len(duplicates)} customer(s) got duplicate orders for one checkout: "
+                        f"{[names.get(uid, uid) for uid in list(duplicates)[:5]]}")
+
+    captures = defaultdict(list)
+    for order in orders:
+        capture_id = (order.get("paymentDetails") or {}).get("paypalCaptureId")
+        if capture_id:
+            captures[capture_id].append(order["id"])
+    double_captured = {capture: ids for capture, ids in captures.items() if len(ids) > 1}
+    if double_captured:
+        problems.append(f"PayPal captures attached to several orders: {double_captured}")
+
+    for outcome in outcomes:
+        problems.extend(f"customer {outcome['index']}: {problem}" for problem in outcome["problems"])
+    return problems
+
+
+def test_flash_sale_checkout(config, firebase_emulator):
+    """Concurrent checkouts never oversell, duplicate orders or corrupt totals"""
+    wait_for_http_ready(f"{config.api_base_url}/products?limit=1")
+    firebase_emulator.clear_firestore()
+    seeder = firebase_emulator.seeder
+    seeder.seed("products", [dict(HOT_PRODUCT, stock=config.stress_stock), FILLER_PRODUCT], id_field="id")
+    accounts = [{"email": f"stress-customer-{i:04d}@zilacart.test", "password": PASSWORD, "role": "customer"}
+                for i in range(config.stress_customers)]
+    customer_uids = seeder.seed_users(accounts)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        tokens = list(pool.map(lambda account: firebase_emulator.sign_in(account["email"], PASSWORD), accounts))
+
+    timings = Timings()
+    barrier = threading.Barrier(config.stress_customers)
+    stop = threading.Event()
+    watchers = [threading.Thread(target=watch_product_page, args=(config, HOT_PRODUCT["id"], stop, timings))
+                for _ in range(config.stress_browsers)]
+    for watcher in watchers:
+        watcher.start()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=config.stress_customers) as pool:
+        outcomes = list(pool.map(lambda args: shop(config, *args, barrier, timings),
+                                 [(token, i) for i, token in enumerate(tokens)]))
+    wall_seconds = time.perf_counter() - start
+    stop.set()
+    for watcher in watchers:
+        watcher.join()
+
+    successful = sum(1 for outcome in outcomes if outcome.get("order_ids"))
+    report = ScalingReport("checkout_contention")
+    for step, samples in timings.samples.items():
+        report.add(config.stress_customers, f"{step}_ms", samples)
+    path = report.write(config.benchmark_dir)
+    print(f"\n{report.format_percentiles(config.stress_customers)}")
+    print(f"{successful} order(s) from {config.stress_customers} customers for {config.stress_stock} units "
+          f"in {wall_seconds:.2f}s ({successful / wall_seconds:.1f} orders/s)\nReport: {path}")
+
+    problems = verify_state(seeder.db, config.stress_stock, outcomes, customer_uids)
+    if successful < min(config.stress_stock, config.stress_customers):
+        problems.append(f"Only {successful} orders succeeded although {config.stress_stock} units were available")
+    assert not problems, "Checkout contention issues:\n" + "\n".join(problems)
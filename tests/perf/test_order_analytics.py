@@ -0,0 +1,119 @@
+"""Order analytics (/api/orders/analytics) benchmark over high-volume order history
+
+Seeds growing order histories into the Firestore/Auth emulators and calls
+the analytics endpoint as admin and as vendors with several date filters at
+controlled concurrency. The app under test must use the same emulators:
+start it with FIRESTORE_EMULATOR_HOST=127.0.0.1:8080
+FIREBASE_AUTH_EMULATOR_HOST=127.0.0.1:9099 GCLOUD_PROJECT=demo-zilacart.
+"""
+import threading
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+import pytest
+import requests
+
+from tests.config import CONFIG
+from tests.fixtures.catalog_generator import CatalogGenerator
+from tests.fixtures.order_generator import OrderGenerator, load_orders
+from tests.utils.benchmark import ScalingReport, run_concurrent
+from tests.utils.navigation import wait_for_http_ready
+from tests.utils.stats import percentile
+
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(not CONFIG.run_benchmarks, reason="Benchmarks disabled (set RUN_BENCHMARKS=true)"),
+]
+
+VENDOR_COUNT = 50
+# Fixed so every order history is a prefix of the largest one
+CUSTOMER_COUNT = 20_000
+PASSWORD = "Bench@12345"
+
+
+def estimated_reads(body: dict) -> int:
+    """Firestore document reads the handler performs for one request
+
+    The emulator exposes no per-request read counter, so this mirrors the
+    route: the profile lookup, one read per matched order (a query with no
+    results still bills one) and the top-product name lookup.
+    """
+    return 1 + max(body.get("totalOrders", 0), 1) + len(body.get("topProducts", []))
+
+
+def scenarios(now: datetime) -> dict:
+    """Scenario name -> (account, query params)"""
+    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    last_month_end = month_start - timedelta(seconds=1)
+    return {
+        "admin_last_30d": ("admin", {}),
+        "admin_month_to_date": ("admin", {"startDate": month_start.isoformat()}),
+        "admin_month_end": ("admin", {"startDate": (month_start - timedelta(days=3)).isoformat(),
+                                      "endDate": last_month_end.isoformat()}),
+        "admin_last_365d": ("admin", {"startDate": (now - timedelta(days=365)).isoformat()}),
+        "vendor_top_30d": ("top", {}),
+        "vendor_tail_30d": ("tail", {}),
+    }
+
+
+def test_order_analytics(config, firebase_emulator):
+    """Analytics latency stays within budget and grows at most linearly with order volume"""
+    analytics_url = f"{config.api_base_url}/orders/analytics"
+    wait_for_http_ready(analytics_url)
+
+    catalog = CatalogGenerator("1k", vendor_count=VENDOR_COUNT)
+    vendor_ids = [vendor["uid"] for vendor in catalog.vendors()]
+    # The busiest and the quietest vendor in the generated catalog
+    accounts = {
+        "admin": {"email": "bench-admin@zilacart.test", "role": "admin"},
+        "top": {"uid": vendor_ids[0], "email": "bench-vendor-top@zilacart.test", "role": "vendor"},
+        "tail": {"uid": vendor_ids[-1], "email": "bench-vendor-tail@zilacart.test", "role": "vendor"},
+    }
+    firebase_emulator.clear_firestore()
+    seeder = firebase_emulator.seeder
+    seeder.seed("products", list(catalog.products()), id_field="id")
+    seeder.seed_users([dict(account, password=PASSWORD) for account in accounts.values()])
+
+    sizes = sorted(config.order_benchmark_sizes)
+    orders = OrderGenerator(sizes[-1], catalog, customer_count=CUSTOMER_COUNT).orders()
+    report = ScalingReport("order_analytics")
+    local = threading.local()
+    problems = []
+    seeded = 0
+
+    for size in sizes:
+        load_orders(seeder, islice(orders, size - seeded))
+        seeded = size
+        tokens = {name: firebase_emulator.sign_in(account["email"], PASSWORD) for name, account in accounts.items()}
+
+        for scenario, (account, params) in scenarios(datetime.now(timezone.utc)).items():
+            def call():
+                if not hasattr(local, "session"):
+                    local.session = requests.Session()
+                response = local.session.get(analytics_url, params=params, timeout=120,
+                                             headers={"Authorization": f"Bearer {tokens[account]}"})
+                response.raise_for_status()
+                return estimated_reads(response.json())
+
+            for concurrency in config.order_benchmark_concurrency:
+                total = max(config.benchmark_repeats, concurrency * 2)
+                latencies, reads, errors = run_concurrent(call, total, concurrency)
+                report.add(size, f"{scenario}@c{concurrency}_ms", latencies)
+                if concurrency == config.order_benchmark_concurrency[0]:
+                    report.add(size, f"{scenario}_reads", reads)
+                if errors:
+                    problems.append(f"{scenario} size={size} c={concurrency}: {len(errors)}/{total} failed ({errors[0]})")
+                p95 = percentile(latencies, 95)
+                if latencies and p95 > config.order_analytics_p95_budget_ms:
+                    problems.append(f"{scenario} size={size} c={concurrency}: p95 {p95:.0f}ms "
+                                    f"> {config.order_analytics_p95_budget_ms}ms")
+        print(f"\n{report.format_percentiles(size)}")
+
+    path = report.write(config.benchmark_dir)
+    print(f"\n{report.format_table(config.benchmark_max_exponent)}\nReport: {path}")
+
+    flagged = report.superlinear(config.benchmark_max_exponent)
+    if flagged:
+        problems.append(f"Super-linear growth with order volume: {flagged}")
+    assert not problems, "Order analytics benchmark issues:\n" + "\n".join(problems)
@@ -0,0 +1,101 @@
+"""PayPal webhook flood: duplicate, out-of-order and burst deliveries against /api/webhooks/paypal
+
+Seeds pending PayPal orders, replays a synthetic event stream at each rate
+in WEBHOOK_RATES (0 = everything at once, the way PayPal flushes retries
+after an outage) and then checks every order ended in the status its
+events imply, with no side effect applied twice.
+
+Like the other benchmarks this needs the app to run against the emulators
+(FIRESTORE_EMULATOR_HOST / GCLOUD_PROJECT).
+"""
+import pytest
+
+from tests.config import CONFIG
+from tests.fixtures.order_generator import OrderGenerator, load_orders
+from tests.utils.benchmark import ScalingReport
+from tests.utils.navigation import wait_for_http_ready
+from tests.utils.paypal_webhooks import (
+    EXPECTED_STATUS, VerificationServer, WebhookReplayer, WebhookSigner, event_stream, pending_order
+)
+from tests.utils.stats import percentile
+
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(not CONFIG.run_benchmarks, reason="Benchmarks disabled (set RUN_BENCHMARKS=true)"),
+]
+
+DENIED_NOTE = "Payment denied by PayPal"
+
+
+def verify_orders(db, scenarios: dict) -> list:
+    """Final status per order matches its scenario and no event took effect twice"""
+    problems = []
+    wrong, repeated = [], []
+    for doc in db.collection("orders").stream():
+        order = doc.to_dict()
+        expected = EXPECTED_STATUS[scenarios[doc.id]]
+        if order["status"] != expected:
+            wrong.append(f"{doc.id}: {order['status']} (expected {expected})")
+        denials = sum(1 for entry in order.get("statusHistory", []) if entry.get("note") == DENIED_NOTE)
+        if denials > 1:
+            repeated.append(f"{doc.id}: {denials} denial entries in statusHistory")
+    if wrong:
+        problems.append(f"{len(wrong)} order(s) ended in the wrong status: {wrong[:5]}")
+    if repeated:
+        problems.append(f"{len(repeated)} duplicate deliveries applied twice: {repeated[:5]}")
+    return problems
+
+
+def test_paypal_webhook_flood(config, firebase_emulator):
+    """Webhook bursts with duplicates and reordering stay fast and apply each event exactly once"""
+    url = f"{config.api_base_url}/webhooks/paypal"
+    wait_for_http_ready(config.base_url)
+
+    signer = WebhookSigner()
+    stand_in = VerificationServer(signer).start()
+    orders = list(OrderGenerator(config.webhook_orders).orders())
+    stream = event_stream(orders, duplicate_rate=config.webhook_duplicate_rate,
+                          reorder_rate=config.webhook_reorder_rate)
+    try:
+        # The deliveries must pass PayPal-style verification before the app sees them, and only they may
+        delivery = stream.deliveries[0]
+        headers = signer.headers(signer.body(delivery))
+        assert stand_in.verify(delivery, headers), "Stand-in rejected a signed delivery"
+        tampered = {**delivery, "summary": f"{delivery.get('summary', '')} (tampered)"}
+        assert not stand_in.verify(tampered, headers), "Stand-in accepted a delivery whose body was modified"
+        assert not stand_in.verify(delivery, headers, webhook_id="WH-SOMEONE-ELSE"), \
+            "Stand-in accepted a delivery for another webhook ID"
+    finally:
+        stand_in.stop()
+
+    seeder = firebase_emulator.seeder
+    pending = [pending_order(order, stream.scenarios[order["id"]]) for order in orders]
+    report = ScalingReport("paypal_webhooks")
+    problems = []
+    print(f"\n{len(stream.deliveries)} deliveries for {len(orders)} orders: "
+          f"{stream.duplicates} duplicates, {stream.reordered} refunds before their capture")
+
+    for rate in config.webhook_rates:
+        firebase_emulator.clear_firestore()
+        load_orders(seeder, pending)
+        label = f"{rate:g}/s" if rate else "burst"
+        result = WebhookReplayer(url, signer, rate, config.webhook_concurrency).replay(stream.deliveries)
+
+        # Every rate replays the same deliveries, so rows are keyed by the rate label
+        report.add(len(stream.deliveries), f"{label} delivery_ms", result.latencies_ms)
+        report.add(len(stream.deliveries), f"{label} throughput_per_s", [result.throughput])
+        print(f"{label}: {result.throughput:.1f} deliveries/s over {result.wall_seconds:.2f}s, "
+              f"HTTP {result.status_codes}")
+
+        if result.errors:
+            problems.append(f"{label}: {len(result.errors)} failed deliveries ({result.errors[0]})")
+        p95 = percentile(result.latencies_ms, 95)
+        if result.latencies_ms and p95 > config.webhook_p95_budget_ms:
+            problems.append(f"{label}: p95 {p95:.0f}ms > {config.webhook_p95_budget_ms}ms")
+        problems.extend(f"{label}: {problem}" for problem in verify_orders(seeder.db, stream.scenarios))
+
+    path = report.write(config.benchmark_dir)
+    print(report.format_percentiles(len(stream.deliveries)))
+    print(f"Report: {path}")
+    assert not problems, "PayPal webhook issues:\n" + "\n".join(problems)
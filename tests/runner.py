@@ -3,6 +3,7 @@ import subprocess
 import json
 import sys
 import os
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -36,20 +37,46 @@ class TestRunner:
             except:
                 print("⚠️ Parallel execution requires pytest-xdist")
         
-        # Add report file
+        # Streamed report: results.jsonl while running, index.html at the end
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_file = os.path.join(self.reports_dir, f"report_{timestamp}.html")
-        cmd.extend(["--html", report_file, "--self-contained-html"])
+        report_dir = os.path.join(self.reports_dir, f"run_{timestamp}")
+        report_file = os.path.join(report_dir, "index.html")
+        cmd.extend(["--stream-report", report_dir])
+        status_file = os.path.join(report_dir, "status.json")
+        cmd.extend(["--progress-file", status_file])
         
         print(f"🚀 Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd)
+        process = subprocess.Popen(cmd)
+        self.watch_progress(process, status_file)
         
-        if result.returncode == 0:
+        if process.returncode == 0:
             print(f"✅ Tests passed! Report: {report_file}")
         else:
             print(f"❌ Tests failed!")
         
-        return result.returncode
+        return process.returncode
+    
+    def watch_progress(self, process: subprocess.Popen, status_file: str, every: float = 30, poll: float = 2):
+        """Print a progress line every `every` seconds and stuck tests as soon as they appear"""
+        if self.project_root not in sys.path:
+            sys.path.insert(0, self.project_root)
+        from tests.utils.progress import format_status
+        
+        last_line, reported = time.time(), set()
+        while process.poll() is None:
+            time.sleep(poll)
+            try:
+                with open(status_file) as f:
+                    status = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for nodeid in status["stuck"]:
+                if nodeid not in reported:
+                    reported.add(nodeid)
+                    print(f"⚠️ Stuck past its p99: {nodeid}", flush=True)
+            if time.time() - last_line >= every:
+                last_line = time.time()
+                print(f"⏳ {format_status(status)}", flush=True)
     
     def run_smoke_tests(self):
         """Run smoke tests"""
@@ -62,6 +89,62 @@ class TestRunner:
     def run_integration_tests(self):
         """Run integration tests"""
         return self.run_tests(markers="integration")
+    
+    def run_soak(self, hours: float = None):
+        """Loop the smoke/e2e journeys in long-lived browsers and fail on latency or memory drift"""
+        if self.project_root not in sys.path:
+            sys.path.insert(0, self.project_root)
+        from tests.config import CONFIG
+        from tests.utils.soak import SoakRunner
+        
+        soak = SoakRunner(CONFIG, hours or CONFIG.soak_hours, CONFIG.soak_sample_every_s,
+                          os.path.join(self.reports_dir, "soak"))
+        print(f"🚀 Soak run for {soak.hours}h against {CONFIG.base_url}")
+        path = soak.run()
+        drifts = soak.drifts(CONFIG.soak_max_latency_growth, CONFIG.soak_max_memory_growth)
+        print(soak.format_table(drifts))
+        
+        summary_path = path.replace(".jsonl", "_summary.json")
+        with open(summary_path, "w") as f:
+            json.dump({"hours": soak.hours, "iterations": len(soak.rows), "errors": soak.error_count(),
+                       "drift": [vars(d) for d in drifts], "unfitted": soak.unfitted(drifts)}, f, indent=2)
+        
+        problems = []
+        sustained = [d.metric for d in drifts if d.sustained]
+        if sustained:
+            problems.append(f"Sustained growth: {', '.join(sustained)}")
+        if soak.error_rate() > CONFIG.soak_max_error_rate:
+            problems.append(f"{soak.error_count()} of {len(soak.rows)} iterations failed "
+                            f"({soak.error_rate():.1%} > {CONFIG.soak_max_error_rate:.1%})")
+        unfitted = soak.unfitted(drifts)
+        if unfitted:
+            problems.append(f"Too few samples to check drift: {', '.join(unfitted)}")
+        if problems:
+            print("❌ " + "\n❌ ".join(problems) + f"\nSamples: {path}")
+            return 1
+        print(f"✅ No sustained drift over {len(soak.rows)} iterations ({soak.error_count()} errors). Samples: {path}")
+        return 0
+    
+    def compact_screenshots(self, max_mb: float = None):
+        """Convert stored screenshots to WebP and trim the store to its size cap"""
+        if self.project_root not in sys.path:
+            sys.path.insert(0, self.project_root)
+        from tests.config import CONFIG
+        from tests.utils.screenshot_store import ScreenshotStore
+        
+        store = ScreenshotStore(os.path.join(self.reports_dir, "screenshots"))
+        result = store.compact(max_mb or CONFIG.screenshot_retention_mb, webp=True)
+        print(f"🧹 Screenshots: {json.dumps(result)}; now {json.dumps(store.stats())}")
+        return 0
+    
+    def timeout_report(self, min_ratio: float = None):
+        """List element waits whose timeout is far above their p99 (see tests/utils/timeout_advisor.py)"""
+        if self.project_root not in sys.path:
+            sys.path.insert(0, self.project_root)
+        from tests.utils.timeout_advisor import main
+        
+        main(["--min-ratio", str(min_ratio)] if min_ratio else [])
+        return 0
 
 
 if __name__ == "__main__":
@@ -75,6 +158,12 @@ if __name__ == "__main__":
             sys.exit(runner.run_e2e_tests())
         elif cmd == "integration":
             sys.exit(runner.run_integration_tests())
+        elif cmd == "soak":
+            sys.exit(runner.run_soak(float(sys.argv[2]) if len(sys.argv) > 2 else None))
+        elif cmd == "compact-screenshots":
+            sys.exit(runner.compact_screenshots(float(sys.argv[2]) if len(sys.argv) > 2 else None))
+        elif cmd == "timeout-report":
+            sys.exit(runner.timeout_report(float(sys.argv[2]) if len(sys.argv) > 2 else None))
         else:
             sys.exit(runner.run_tests(test_path=cmd))
     else:
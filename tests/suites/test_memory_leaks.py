@@ -0,0 +1,48 @@
+"""Client memory leak checks for repeated storefront interactions"""
+import pytest
+from tests.pages import ProductDetailsPage, ProductsPage
+
+
+@pytest.mark.e2e
+@pytest.mark.slow
+class TestMemoryLeaks:
+    """Repeated client-side cycles must not keep growing the heap, DOM or listeners"""
+
+    @pytest.mark.leak_check(iterations=15)
+    def test_pdp_add_to_cart_back_cycle(self, driver, config, signed_in, leak_check):
+        """Listing -> PDP -> add to cart -> remove -> back, without page reloads"""
+        listing = ProductsPage(driver, config.base_url)
+        pdp = ProductDetailsPage(driver, config.base_url)
+        listing.navigate_to_products()
+        if not listing.wait_for_products() or not listing.get_product_count():
+            pytest.skip("No products listed")
+
+        def cycle():
+            assert listing.open_product(0), "Product card did not open the PDP"
+            pdp.snapshot()
+            # Two toggles leave the cart as it was, so every iteration does the same work
+            in_cart = pdp.is_in_cart()
+            assert pdp.toggle_cart() and pdp.is_in_cart() != in_cart, "Cart toggle did not change the cart"
+            assert pdp.toggle_cart() and pdp.is_in_cart() == in_cart, "Cart toggle did not restore the cart"
+            listing.go_back()
+            assert listing.wait_for_products(), "Listing did not render after going back"
+
+        leak_check.check(cycle)
+
+    @pytest.mark.leak_check(iterations=20, dom_nodes=5)
+    def test_wishlist_toggle_cycle(self, driver, config, signed_in, product_catalog, leak_check):
+        """Toggling the wishlist button on one PDP"""
+        product_url = product_catalog.product_url()
+        if not product_url:
+            pytest.skip("No product available")
+        pdp = ProductDetailsPage(driver, config.base_url)
+        pdp.navigate_to_url(product_url)
+        if not pdp.is_wishlist_button_visible():
+            pytest.skip("Wishlist button not rendered")
+
+        def cycle():
+            in_wishlist = pdp.is_in_wishlist()
+            assert pdp.toggle_wishlist() and pdp.is_in_wishlist() != in_wishlist, "Wishlist toggle had no effect"
+            assert pdp.toggle_wishlist() and pdp.is_in_wishlist() == in_wishlist, "Wishlist toggle did not undo"
+
+        leak_check.check(cycle)
@@ -30,15 +30,12 @@ class TestProductDetailsPage(BaseTest):
         self.log_step(1, "Navigate to product page")
         self.product_details_page.navigate_to_product(self.test_product["id"])
         
-        self.log_step(2, "Get product title")
-        title = self.product_details_page.get_product_title()
-        assert title, "Product title should be displayed"
+        self.log_step(2, "Capture product info")
+        snapshot = self.product_details_page.snapshot()
+        assert snapshot.title, "Product title should be displayed"
+        assert snapshot.price, "Product price should be displayed"
         
-        self.log_step(3, "Get product price")
-        price = self.product_details_page.get_product_price()
-        assert price, "Product price should be displayed"
-        
-        self.log_success(f"Product info displayed - {title} at {price}")
+        self.log_success(f"Product info displayed - {snapshot.title} at {snapshot.price}")
     
     @pytest.mark.smoke
     def test_add_to_cart_button_visible(self):
@@ -94,7 +91,7 @@ class TestProductDetailsPage(BaseTest):
         self.product_details_page.navigate_to_product(self.test_product["id"])
         
         self.log_step(2, "Check stock status")
-        in_stock = self.product_details_page.is_in_stock()
+        in_stock = self.product_details_page.snapshot().in_stock
         
         self.log_success(f"Product in stock: {in_stock}")
     
@@ -121,7 +118,25 @@ class TestProductDetailsPage(BaseTest):
         self.product_details_page.navigate_to_product(self.test_product["id"])
         
         self.log_step(2, "Verify all action buttons are visible")
-        assert self.product_details_page.is_add_to_cart_visible(), "Add to Cart button missing"
-        assert self.product_details_page.is_wishlist_button_visible(), "Wishlist button missing"
+        snapshot = self.product_details_page.snapshot()
+        assert snapshot.add_to_cart and snapshot.add_to_cart.visible, "Add to Cart button missing"
+        assert snapshot.wishlist and snapshot.wishlist.visible, "Wishlist button missing"
         
         self.log_success("All PDP buttons are visible and responsive")
+    
+    def test_action_button_images(self):
+        """Test action buttons are captured from a single screenshot"""
+        self.log_step(1, "Navigate to product page")
+        self.product_details_page.navigate_to_product(self.test_product["id"])
+        self.product_details_page.snapshot()
+        
+        self.log_step(2, "Crop Add to Cart, Wishlist and Buy Now from one full-page capture")
+        paths = self.take_element_screenshots({
+            "add_to_cart": self.product_details_page.ADD_TO_CART_BUTTON,
+            "wishlist": self.product_details_page.WISHLIST_BUTTON,
+            "buy_now": self.product_details_page.BUY_NOW_BUTTON,
+        }, full_page=True)
+        assert paths["add_to_cart"], "Add to Cart button was not captured"
+        assert paths["wishlist"], "Wishlist button was not captured"
+        
+        self.log_success(f"Captured {sum(1 for path in paths.values() if path)} button images")
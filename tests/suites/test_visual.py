@@ -0,0 +1,38 @@
+"""Visual regression checks against the baselines in tests/visual_baselines"""
+import pytest
+from tests.pages import ProductDetailsPage, ProductsPage
+
+
+VIEWPORTS = {"desktop": (1920, 1080), "mobile": (375, 667)}
+
+
+@pytest.mark.e2e
+@pytest.mark.visual
+class TestVisual:
+    """Screenshots per viewport; run with UPDATE_BASELINES=true after intended UI changes"""
+
+    @pytest.mark.parametrize("viewport", VIEWPORTS)
+    def test_products_listing(self, driver, config, visual, viewport):
+        """Product grid above the fold"""
+        driver.set_window_size(*VIEWPORTS[viewport])
+        listing = ProductsPage(driver, config.base_url)
+        listing.navigate_to_products()
+        if not listing.wait_for_products():
+            pytest.skip("No products listed")
+        listing.wait_until_settled()
+        visual.assert_matches("listing")
+
+    @pytest.mark.parametrize("viewport", VIEWPORTS)
+    def test_add_to_cart_button(self, driver, config, product_catalog, visual, viewport):
+        """Add to Cart button and its cart icon"""
+        product_url = product_catalog.product_url()
+        if not product_url:
+            pytest.skip("No product available")
+        driver.set_window_size(*VIEWPORTS[viewport])
+        pdp = ProductDetailsPage(driver, config.base_url)
+        pdp.navigate_to_url(product_url)
+        button = pdp.wait_for_element(pdp.ADD_TO_CART_BUTTON)
+        if button is None:
+            pytest.skip("Add to Cart button not rendered")
+        pdp.wait_until_settled()
+        visual.assert_matches("add_to_cart_button", element=button)
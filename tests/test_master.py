@@ -15,8 +15,13 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException
 import time
-import urllib.request
-import urllib.error
+
+from tests.config import CONFIG
+from tests.utils.command_metrics import CommandInstrumentation, record_test_metrics
+from tests.utils.element_extractor import ElementExtractor
+from tests.utils.implicit_wait import ImplicitWaitDetector, set_implicit_wait
+from tests.utils.navigation import safe_navigate, wait_for_document_ready, wait_for_http_ready
+from tests.utils.tracing import TraceCapture, finish_trace
 
 # ============================================================================
 # Configuration
@@ -24,74 +29,12 @@ import urllib.error
 
 BASE_URL = os.getenv("BASE_URL", "http://localhost:3000")
 HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
+# Explicit waits only by default; see tests/utils/implicit_wait.py for scoped overrides
+IMPLICIT_WAIT = float(os.getenv("IMPLICIT_WAIT", "0"))
 
 logger = logging.getLogger(__name__)
 
 
-def wait_for_document_ready(driver, timeout=20):
-    """Wait until DOM is fully loaded."""
-    WebDriverWait(driver, timeout).until(
-        lambda d: d.execute_script("return document.readyState") == "complete"
-    )
-
-
-def wait_for_http_ready(url, timeout=90, interval=2):
-    """Poll URL until HTTP endpoint responds, allowing warm-up time."""
-    deadline = time.time() + timeout
-    last_error = None
-    last_status = None
-    attempt = 0
-
-    while time.time() < deadline:
-        attempt += 1
-        try:
-            with urllib.request.urlopen(url, timeout=5) as response:
-                status = getattr(response, "status", 200)
-                last_status = status
-                if status < 500:
-                    return
-        except urllib.error.HTTPError as error:
-            status = getattr(error, "code", None)
-            if status is not None:
-                last_status = status
-                logger.info(f"HTTP readiness check reached {url} with status={status} (attempt {attempt}); treating as reachable")
-                return
-            last_error = error
-        except Exception as error:
-            last_error = error
-            logger.info(f"HTTP readiness retry for {url} (attempt {attempt}, last_status={last_status}): {error}")
-        time.sleep(interval)
-
-    raise AssertionError(
-        f"Server did not become ready at {url}: last_status={last_status}, last_error={last_error}"
-    )
-
-
-def safe_navigate(driver, url, retries=2, page_load_timeout=45):
-    """Navigate to URL with retry to handle intermittent page-load hangs."""
-    driver.set_page_load_timeout(page_load_timeout)
-    last_error = None
-
-    for attempt in range(1, retries + 1):
-        try:
-            driver.get(url)
-            return
-        except TimeoutException as error:
-            last_error = error
-            logger.warning(f"Page load timeout navigating to {url} (attempt {attempt}/{retries})")
-        except Exception as error:
-            last_error = error
-            logger.warning(f"Navigation error to {url} (attempt {attempt}/{retries}): {error}")
-
-        try:
-            driver.execute_script("window.stop();")
-        except Exception:
-            pass
-        time.sleep(2)
-
-    raise AssertionError(f"Failed to navigate to {url} after {retries} attempts: {last_error}")
-
-
 def first_matching_element(driver, selectors, timeout=5, clickable=False, visible=False):
     """Return first element matching any selector tuple in selectors."""
     for by, value in selectors:
@@ -180,11 +123,24 @@ def paypal_method_selectors():
     ]
 
 
+# Heading or Add to Cart button: the PDP has rendered product content
+PDP_READY_SELECTOR = (By.XPATH, "//h1 | //h2 | //button[contains(text(), 'Add to Cart')]")
+
+
 def resolve_product_url(driver):
     """Find a real product detail URL from the products listing page."""
     driver.get(f"{BASE_URL}/products")
     wait_for_document_ready(driver, timeout=20)
 
+    # The listing renders client-side; give product links a bounded explicit wait
+    # (implicit waits are off, so the extraction below would not wait at all).
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/products/')]"))
+        )
+    except TimeoutException:
+        logger.info("No product links rendered on /products within 10s")
+
     # Try to discover a product link from the rendered listing first.
     link_selectors = [
         "//a[contains(@href, '/products/')]",
@@ -193,9 +149,9 @@ def resolve_product_url(driver):
     ]
 
     for selector in link_selectors:
-        links = driver.find_elements(By.XPATH, selector)
+        links = ElementExtractor.extract(driver, (By.XPATH, selector), ["prop:href"])
         for link in links:
-            href = link.get_attribute("href")
+            href = link["prop:href"]
             if href and ("/products/" in href or "/product/" in href):
                 return href
 
@@ -210,16 +166,20 @@ def resolve_product_url(driver):
         wait_for_document_ready(driver, timeout=20)
 
         if "/products/" in driver.current_url:
-            has_heading = len(driver.find_elements(By.XPATH, "//h1 | //h2")) > 0
-            has_add_to_cart = len(driver.find_elements(By.XPATH, "//button[contains(text(), 'Add to Cart')]")) > 0
-            if has_heading or has_add_to_cart:
+            if first_matching_element(driver, [PDP_READY_SELECTOR], timeout=10):
                 return candidate
 
     pytest.skip("No resolvable product detail URL found for PDP tests")
 
 
+@pytest.fixture(scope="session")
+def product_url(product_catalog):
+    """PDP URL discovered once per session over HTTP (None if the API has none)"""
+    return product_catalog.product_url()
+
+
 @pytest.fixture
-def driver():
+def driver(request):
     """Create Chrome WebDriver"""
     options = Options()
     if HEADLESS:
@@ -231,6 +191,8 @@ def driver():
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
+    if CONFIG.capture_traces:
+        TraceCapture.enable(options)
     
     try:
         from webdriver_manager.chrome import ChromeDriverManager
@@ -240,10 +202,15 @@ def driver():
     except:
         web_driver = webdriver.Chrome(options=options)
     
-    web_driver.implicitly_wait(10)
+    if os.getenv("INSTRUMENT_COMMANDS", "true").lower() == "true":
+        CommandInstrumentation.attach(web_driver)
+        ImplicitWaitDetector.attach(web_driver, float(os.getenv("IMPLICIT_WAIT_WARN_MS", "500")))
+    set_implicit_wait(web_driver, IMPLICIT_WAIT)
     
     yield web_driver
     
+    record_test_metrics(request.node, web_driver)
+    finish_trace(request.node, web_driver, CONFIG)
     web_driver.quit()
 
 
@@ -364,22 +331,20 @@ class TestCheckout:
 class TestProductDetailsPage:
     """Product Details Page tests"""
     
-    def test_pdp_loads(self, driver):
+    def test_pdp_loads(self, driver, product_url):
         """Test PDP loads"""
-        product_url = resolve_product_url(driver)
-        driver.get(product_url)
+        driver.get(product_url or resolve_product_url(driver))
         wait_for_document_ready(driver, timeout=20)
 
         assert "/products/" in driver.current_url, "Should be on a product details route"
-        has_heading = len(driver.find_elements(By.XPATH, "//h1 | //h2")) > 0
-        has_add_to_cart = len(driver.find_elements(By.XPATH, "//button[contains(text(), 'Add to Cart')]")) > 0
-        assert has_heading or has_add_to_cart, "PDP should render heading or add-to-cart action"
+        assert first_matching_element(driver, [PDP_READY_SELECTOR], timeout=10), (
+            "PDP should render heading or add-to-cart action"
+        )
         print("✅ PDP loaded")
     
-    def test_add_to_cart_button_visible(self, driver):
+    def test_add_to_cart_button_visible(self, driver, product_url):
         """Test Add to Cart button is visible"""
-        product_url = resolve_product_url(driver)
-        driver.get(product_url)
+        driver.get(product_url or resolve_product_url(driver))
         wait_for_document_ready(driver, timeout=20)
         
         button = first_matching_element(
@@ -395,10 +360,9 @@ class TestProductDetailsPage:
 
         print("✅ Add to Cart button visible")
     
-    def test_wishlist_button_visible(self, driver):
+    def test_wishlist_button_visible(self, driver, product_url):
         """Test Wishlist button is visible"""
-        product_url = resolve_product_url(driver)
-        driver.get(product_url)
+        driver.get(product_url or resolve_product_url(driver))
         wait_for_document_ready(driver, timeout=20)
         
         button = first_matching_element(
@@ -414,10 +378,9 @@ class TestProductDetailsPage:
 
         print("✅ Wishlist button visible")
     
-    def test_add_to_cart_click(self, driver):
+    def test_add_to_cart_click(self, driver, product_url):
         """Test clicking Add to Cart"""
-        product_url = resolve_product_url(driver)
-        driver.get(product_url)
+        driver.get(product_url or resolve_product_url(driver))
         wait_for_document_ready(driver, timeout=20)
         
         button = first_matching_element(
@@ -3,5 +3,9 @@ from .logger import Logger
 from .wait_helper import WaitHelper
 from .screenshot import ScreenshotManager
 from .browser_helper import BrowserHelper
+from .command_metrics import CommandInstrumentation, CommandStats
+from .element_extractor import ElementExtractor
+from .implicit_wait import ImplicitWaitDetector, scoped_implicit_wait, with_implicit_wait
 
-__all__ = ["Logger", "WaitHelper", "ScreenshotManager", "BrowserHelper"]
+__all__ = ["Logger", "WaitHelper", "ScreenshotManager", "BrowserHelper", "CommandInstrumentation", "CommandStats", "ElementExtractor",
+           "ImplicitWaitDetector", "scoped_implicit_wait", "with_implicit_wait"]
@@ -0,0 +1,90 @@
+"""Local placeholder image server for synthetic catalogs
+
+    python -m tests.utils.asset_server --port 8099
+
+Any /assets/... path returns a solid-colour PNG (colour derived from the
+path), so generated catalogs get realistic image requests without depending
+on an external placeholder service.
+"""
+import argparse
+import functools
+import hashlib
+import struct
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+IMAGE_SIZE = 400
+
+
+@functools.lru_cache(maxsize=1024)
+def solid_png(rgb: bytes, size: int = IMAGE_SIZE) -> bytes:
+    """Encode a size x size PNG filled with one colour"""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    row = b"\x00" + rgb * size
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(row * size, 9))
+        + chunk(b"IEND", b"")
+    )
+
+
+class _AssetHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if not self.path.startswith("/assets/"):
+            self.send_error(404)
+            return
+        body = solid_png(hashlib.md5(self.path.encode()).digest()[:3])
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "public, max-age=86400")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AssetServer:
+    """Serves placeholder images on a background thread"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8099):
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "AssetServer":
+        self._server = ThreadingHTTPServer((self.host, self.port), _AssetHandler)
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve placeholder product images")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    args = parser.parse_args()
+    server = ThreadingHTTPServer((args.host, args.port), _AssetHandler)
+    print(f"Serving placeholder assets on http://{args.host}:{args.port}/assets/")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
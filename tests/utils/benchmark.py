@@ -0,0 +1,163 @@
+"""Scaling benchmark helpers: timed samples per input size and growth-curve fits"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tests.utils.stats import percentile, power_law_fit
+
+
+logger = logging.getLogger(__name__)
+
+
+def time_call(func: Callable, repeats: int = 5, warmup: int = 1) -> List[float]:
+    """Milliseconds per call for repeats calls, after warmup untimed calls"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def time_request(session, url: str, repeats: int = 5, warmup: int = 1, **kwargs) -> List[float]:
+    """Milliseconds per GET of url (requests session); fails on HTTP errors"""
+    def fetch():
+        response = session.get(url, **kwargs)
+        response.raise_for_status()
+        return response
+    return time_call(fetch, repeats, warmup)
+
+
+def run_concurrent(func: Callable[[], Any], total: int, concurrency: int) -> Tuple[List[float], List[Any], List[str]]:
+    """Call func total times with concurrency in flight
+
+    Returns (latencies_ms, results, errors); failed calls contribute an
+    error message instead of a latency.
+    """
+    lock = threading.Lock()
+    latencies, results, errors = [], [], []
+
+    def call(_):
+        start = time.perf_counter()
+        try:
+            result = func()
+        except Exception as e:
+            with lock:
+                errors.append(f"{type(e).__name__}: {e}")
+            return
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.append(elapsed)
+            results.append(result)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(call, range(total)))
+    return latencies, results, errors
+
+
+class ScalingReport:
+    """Collects samples of several metrics over increasing input sizes
+
+        report = ScalingReport("catalog_scaling")
+        report.add(1000, "api_products_ms", samples)
+        report.superlinear(max_exponent=1.1)   # -> metrics growing faster than linear
+
+    Each metric is summarised by its median per size and fitted as
+    value = c * size ** exponent on log-log axes. Fixed per-request overhead
+    flattens the curve at small sizes, so the exponent over the two largest
+    sizes (tail_exponent) is reported and checked as well.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.samples: Dict[str, Dict[int, List[float]]] = defaultdict(dict)
+
+    def add(self, size: int, metric: str, samples: List[float]):
+        """Record samples (or a single measurement) for metric at size"""
+        values = [float(v) for v in samples if v is not None]
+        self.samples[metric][size] = values
+        if values:
+            logger.info(f"{self.name} size={size} {metric}: p50={percentile(values, 50):.1f} "
+                        f"p95={percentile(values, 95):.1f} (n={len(values)})")
+
+    def medians(self, metric: str) -> Dict[int, float]:
+        """Median value per size"""
+        return {size: percentile(values, 50) for size, values in sorted(self.samples[metric].items()) if values}
+
+    def fit(self, metric: str) -> Dict[str, float]:
+        """Power-law fit of the medians: exponent, tail_exponent, coefficient, r_squared"""
+        medians = self.medians(metric)
+        sizes, values = list(medians), list(medians.values())
+        exponent, coefficient, r_squared = power_law_fit(sizes, values)
+        tail_exponent = power_law_fit(sizes[-2:], values[-2:])[0]
+        return {"exponent": round(exponent, 3), "tail_exponent": round(tail_exponent, 3),
+                "coefficient": coefficient, "r_squared": round(r_squared, 3)}
+
+    def superlinear(self, max_exponent: float = 1.1, min_points: int = 3) -> Dict[str, float]:
+        """Metrics whose overall or tail exponent exceeds max_exponent -> highest exponent"""
+        flagged = {}
+        for metric in self.samples:
+            if len(self.medians(metric)) < min_points:
+                continue
+            fit = self.fit(metric)
+            exponent = max(fit["exponent"], fit["tail_exponent"])
+            if exponent > max_exponent:
+                flagged[metric] = exponent
+        return flagged
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "created_at": datetime.now().isoformat(),
+            "metrics": {
+                metric: {
+                    "samples": {str(size): values for size, values in sorted(by_size.items())},
+                    "p50": {str(size): value for size, value in self.medians(metric).items()},
+                    "p95": {str(size): percentile(values, 95) for size, values in sorted(by_size.items()) if values},
+                    "p99": {str(size): percentile(values, 99) for size, values in sorted(by_size.items()) if values},
+                    "fit": self.fit(metric),
+                }
+                for metric, by_size in self.samples.items()
+            },
+        }
+
+    def write(self, directory: str) -> str:
+        """Persist the report as JSON; returns the path"""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def format_percentiles(self, size: int) -> str:
+        """p50/p95/p99/max of every metric at one size"""
+        header = f"{'metric':<36}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}{'n':>6}"
+        lines = [f"size={size}", header, "-" * len(header)]
+        for metric, by_size in self.samples.items():
+            values = by_size.get(size)
+            if values:
+                lines.append(f"{metric:<36}" + "".join(f"{percentile(values, pct):>10.1f}" for pct in (50, 95, 99))
+                             + f"{max(values):>10.1f}{len(values):>6}")
+        return "\n".join(lines)
+
+    def format_table(self, max_exponent: Optional[float] = None) -> str:
+        """Median per size for every metric, with the fitted growth exponent"""
+        sizes = sorted({size for by_size in self.samples.values() for size in by_size})
+        header = f"{'metric':<32}" + "".join(f"{size:>12}" for size in sizes) + f"{'exponent':>10}{'tail':>8}"
+        lines = [header, "-" * len(header)]
+        for metric in self.samples:
+            medians = self.medians(metric)
+            fit = self.fit(metric)
+            worst = max(fit["exponent"], fit["tail_exponent"])
+            flag = "  <- super-linear" if max_exponent is not None and worst > max_exponent else ""
+            cells = "".join(f"{medians[size]:>12.1f}" if size in medians else f"{'-':>12}" for size in sizes)
+            lines.append(f"{metric:<32}{cells}{fit['exponent']:>10.2f}{fit['tail_exponent']:>8.2f}{flag}")
+        return "\n".join(lines)
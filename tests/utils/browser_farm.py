@@ -0,0 +1,256 @@
+"""Headless browser farm: synthetic users running weighted journeys in parallel processes
+
+Each worker process owns one headless browser and keeps picking a journey
+(weighted) until the run's deadline. A journey is a plain module-level
+function taking a JourneySession; it drives page objects and wraps every
+user-visible step in session.step(name) so the step is timed and failures
+are recorded without stopping the worker.
+"""
+import json
+import logging
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from tests.utils.stats import percentile
+
+
+logger = logging.getLogger(__name__)
+
+# Rough resident memory of one headless Chrome plus its driver while rendering the storefront
+MB_PER_BROWSER = 500
+
+# Journey name -> (weight, function(session))
+Journeys = Dict[str, Tuple[float, Callable[["JourneySession"], None]]]
+
+
+@dataclass
+class StepSample:
+    """One timed step; offset_s is seconds since the farm started"""
+
+    offset_s: float
+    worker: int
+    journey: str
+    step: str
+    duration_ms: float
+    error: Optional[str] = None
+
+
+class JourneyFailed(Exception):
+    """Raised by session.step() to abandon the rest of a journey after a failed step"""
+
+
+class JourneySession:
+    """What a journey function gets: a driver, a seeded RNG, the worker's account and step timing
+
+    signed_in carries over between journeys of the same browser and is reset
+    when the browser is replaced.
+    """
+
+    def __init__(self, driver, base_url: str, rng: random.Random, worker: int, started: float,
+                 account: Optional[dict] = None, signed_in: bool = False):
+        self.driver = driver
+        self.base_url = base_url
+        self.rng = rng
+        self.worker = worker
+        self.started = started
+        self.account = account
+        self.signed_in = signed_in
+        self.journey = ""
+        self.samples: List[StepSample] = []
+
+    @contextmanager
+    def step(self, name: str):
+        """Time a step; an exception inside it is recorded and ends the journey"""
+        start = time.perf_counter()
+        offset = time.time() - self.started
+        try:
+            yield
+        except Exception as e:
+            self.samples.append(StepSample(offset, self.worker, self.journey, name,
+                                           (time.perf_counter() - start) * 1000, f"{type(e).__name__}: {e}"[:200]))
+            raise JourneyFailed(name) from e
+        self.samples.append(StepSample(offset, self.worker, self.journey, name, (time.perf_counter() - start) * 1000))
+
+
+def default_browser_count() -> int:
+    """Browsers this machine can run at once: bounded by CPU cores and available memory"""
+    cpus = os.cpu_count() or 1
+    try:
+        with open("/proc/meminfo") as f:
+            meminfo = dict(line.split(":", 1) for line in f)
+        available_mb = int(meminfo["MemAvailable"].split()[0]) // 1024
+    except (OSError, KeyError, ValueError):
+        return max(1, cpus // 2)
+    return max(1, min(cpus, available_mb // MB_PER_BROWSER))
+
+
+def _run_worker(worker: int, journeys: Journeys, base_url: str, browser: str,
+                started: float, deadline: float, seed: int, account: Optional[dict] = None) -> List[StepSample]:
+    """Process entry point: run journeys in one browser until the deadline"""
+    from tests.utils.browser_helper import BrowserHelper
+
+    rng = random.Random(f"{seed}:farm:{worker}")
+    names = list(journeys)
+    weights = [journeys[name][0] for name in names]
+    samples: List[StepSample] = []
+    driver = None
+    signed_in = False
+    try:
+        while time.time() < deadline:
+            if driver is None:
+                signed_in = False
+                driver = BrowserHelper.get_driver(browser, headless=True)
+                if driver is None:
+                    samples.append(StepSample(time.time() - started, worker, "", "browser_start", 0.0,
+                                              "Browser could not be started"))
+                    return samples
+            session = JourneySession(driver, base_url, rng, worker, started, account, signed_in)
+            session.journey = rng.choices(names, weights)[0]
+            try:
+                journeys[session.journey][1](session)
+            except JourneyFailed:
+                # A crashed browser is replaced; a failed step only ends this journey
+                try:
+                    driver.current_url
+                except Exception:
+                    BrowserHelper.close_driver(driver)
+                    driver = None
+            except Exception as e:
+                session.samples.append(StepSample(time.time() - started, worker, session.journey, "journey",
+                                                  0.0, f"{type(e).__name__}: {e}"[:200]))
+            signed_in = session.signed_in
+            samples.extend(session.samples)
+    finally:
+        if driver is not None:
+            BrowserHelper.close_driver(driver)
+    return samples
+
+
+class BrowserFarm:
+    """Runs `browsers` worker processes for `duration` seconds
+
+        farm = BrowserFarm(JOURNEYS, "http://localhost:3000", browsers=8, duration=300)
+        report = farm.run()
+        print(report.format_table())
+
+    Worker N gets accounts[N % len(accounts)] as session.account, for
+    journeys that have to sign in.
+    """
+
+    def __init__(self, journeys: Journeys, base_url: str, browsers: int = 0, duration: float = 300,
+                 browser: str = "chrome", seed: int = 42, accounts: Optional[List[dict]] = None):
+        self.journeys = journeys
+        self.accounts = accounts or []
+        self.base_url = base_url
+        self.browsers = browsers or default_browser_count()
+        self.duration = duration
+        self.browser = browser
+        self.seed = seed
+
+    def account(self, worker: int) -> Optional[dict]:
+        return self.accounts[worker % len(self.accounts)] if self.accounts else None
+
+    def run(self, bucket_seconds: float = 30) -> "FarmReport":
+        """Run every worker to the deadline and collect their samples"""
+        logger.info(f"Browser farm: {self.browsers} browser(s) for {self.duration:.0f}s against {self.base_url}")
+        started = time.time()
+        deadline = started + self.duration
+        # Fresh interpreters: forking a process that already holds driver sockets and threads is unsafe
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=self.browsers, mp_context=context) as pool:
+            futures = [pool.submit(_run_worker, worker, self.journeys, self.base_url, self.browser,
+                                   started, deadline, self.seed, self.account(worker))
+                       for worker in range(self.browsers)]
+            samples = [sample for future in futures for sample in future.result()]
+        return FarmReport(samples, self.browsers, time.time() - started, bucket_seconds)
+
+
+class FarmReport:
+    """Per-step latency percentiles and error rates, overall and per time bucket"""
+
+    def __init__(self, samples: List[StepSample], browsers: int, wall_seconds: float, bucket_seconds: float = 30):
+        self.samples = samples
+        self.browsers = browsers
+        self.wall_seconds = wall_seconds
+        self.bucket_seconds = bucket_seconds
+
+    @staticmethod
+    def _summary(samples: List[StepSample]) -> dict:
+        ok = [s.duration_ms for s in samples if s.error is None]
+        return {
+            "count": len(samples),
+            "errors": len(samples) - len(ok),
+            "error_rate": round((len(samples) - len(ok)) / len(samples), 4) if samples else 0.0,
+            "p50": percentile(ok, 50) if ok else None,
+            "p95": percentile(ok, 95) if ok else None,
+            "p99": percentile(ok, 99) if ok else None,
+        }
+
+    def _by_step(self, samples: List[StepSample]) -> Dict[str, List[StepSample]]:
+        by_step: Dict[str, List[StepSample]] = {}
+        for sample in samples:
+            by_step.setdefault(sample.step, []).append(sample)
+        return by_step
+
+    def steps(self) -> Dict[str, dict]:
+        """Step -> count, errors, error_rate, p50/p95/p99 over the whole run"""
+        return {step: self._summary(samples) for step, samples in self._by_step(self.samples).items()}
+
+    def timeline(self) -> List[dict]:
+        """Per bucket: start offset and step summaries, to see latency or errors climbing under load"""
+        buckets: Dict[int, List[StepSample]] = {}
+        for sample in self.samples:
+            buckets.setdefault(int(sample.offset_s // self.bucket_seconds), []).append(sample)
+        return [
+            {"start_s": index * self.bucket_seconds,
+             "steps": {step: self._summary(samples) for step, samples in self._by_step(buckets[index]).items()}}
+            for index in sorted(buckets)
+        ]
+
+    def error_rate(self) -> float:
+        return self._summary(self.samples)["error_rate"]
+
+    def errors(self, limit: int = 10) -> List[str]:
+        """Distinct error messages by frequency"""
+        counts: Dict[str, int] = {}
+        for sample in self.samples:
+            if sample.error:
+                key = f"{sample.step}: {sample.error}"
+                counts[key] = counts.get(key, 0) + 1
+        return [f"{count}x {key}" for key, count in sorted(counts.items(), key=lambda kv: -kv[1])[:limit]]
+
+    def to_dict(self) -> dict:
+        return {
+            "created_at": datetime.now().isoformat(),
+            "browsers": self.browsers,
+            "wall_seconds": round(self.wall_seconds, 1),
+            "bucket_seconds": self.bucket_seconds,
+            "steps": self.steps(),
+            "timeline": self.timeline(),
+            "errors": self.errors(),
+        }
+
+    def write(self, directory: str, name: str = "browser_load") -> str:
+        """Persist the report as JSON; returns the path"""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def format_table(self) -> str:
+        """Step percentiles and error rates for the whole run"""
+        header = f"{'step':<24}{'count':>8}{'err%':>8}{'p50':>10}{'p95':>10}{'p99':>10}"
+        lines = [f"{self.browsers} browser(s), {self.wall_seconds:.0f}s", header, "-" * len(header)]
+        for step, summary in self.steps().items():
+            cells = "".join(f"{summary[p]:>10.0f}" if summary[p] is not None else f"{'-':>10}"
+                            for p in ("p50", "p95", "p99"))
+            lines.append(f"{step:<24}{summary['count']:>8}{summary['error_rate'] * 100:>8.1f}{cells}")
+        return "\n".join(lines)
@@ -10,6 +10,9 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
 from typing import Optional
+from tests.utils.command_metrics import CommandInstrumentation
+from tests.utils.screencast import ScreencastRecorder
+from tests.utils.tracing import TraceCapture
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,9 +27,10 @@ class BrowserHelper:
         window_width: int = 1920,
         window_height: int = 1080,
         disable_notifications: bool = True,
-        disable_automation: bool = True
+        disable_automation: bool = True,
+        trace: bool = False
     ) -> webdriver.Chrome:
-        """Create Chrome WebDriver with best practices"""
+        """Create Chrome WebDriver with best practices (trace=True records a session trace)"""
         options = ChromeOptions()
         
         if headless:
@@ -46,6 +50,9 @@ class BrowserHelper:
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option("useAutomationExtension", False)
         
+        if trace:
+            TraceCapture.enable(options)
+        
         # Use webdriver-manager for automatic driver management
         service = ChromeService(ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=options)
@@ -96,31 +103,42 @@ class BrowserHelper:
         browser: str = "chrome",
         headless: bool = False,
         window_width: int = 1920,
-        window_height: int = 1080
+        window_height: int = 1080,
+        instrument: bool = False,
+        trace: bool = False,
+        screencast_seconds: float = 0
     ) -> Optional[webdriver.Remote]:
-        """Factory method to get appropriate driver"""
+        """Factory method to get appropriate driver
+        
+        With instrument=True every WebDriver command is timed through
+        CommandInstrumentation (see tests/utils/command_metrics.py).
+        trace=True records a Chrome performance trace (see tests/utils/tracing.py).
+        screencast_seconds > 0 keeps that many seconds of low-resolution
+        screencast in memory (Chromium only, see tests/utils/screencast.py).
+        """
         try:
             if browser.lower() == "chrome":
-                return BrowserHelper.create_chrome_driver(
+                driver = BrowserHelper.create_chrome_driver(
                     headless=headless,
                     window_width=window_width,
-                    window_height=window_height
+                    window_height=window_height,
+                    trace=trace
                 )
             elif browser.lower() == "firefox":
-                return BrowserHelper.create_firefox_driver(
+                driver = BrowserHelper.create_firefox_driver(
                     headless=headless,
                     window_width=window_width,
                     window_height=window_height
                 )
             elif browser.lower() == "edge":
-                return BrowserHelper.create_edge_driver(
+                driver = BrowserHelper.create_edge_driver(
                     headless=headless,
                     window_width=window_width,
                     window_height=window_height
                 )
             else:
                 logger.warning(f"Unsupported browser: {browser}, defaulting to Chrome")
-                return BrowserHelper.create_chrome_driver(
+                driver = BrowserHelper.create_chrome_driver(
                     headless=headless,
                     window_width=window_width,
                     window_height=window_height
@@ -128,12 +146,21 @@ class BrowserHelper:
         except Exception as e:
             logger.error(f"Failed to create {browser} driver: {e}")
             return None
+        
+        if instrument:
+            CommandInstrumentation.attach(driver)
+        if screencast_seconds and browser.lower() in ("chrome", "edge"):
+            ScreencastRecorder.attach(driver, seconds=screencast_seconds)
+        return driver
     
     @staticmethod
     def close_driver(driver):
         """Safely close driver"""
         try:
             if driver:
+                recorder = ScreencastRecorder.get(driver)
+                if recorder:
+                    recorder.stop()
                 driver.quit()
         except Exception as e:
             logger.warning(f"Error closing driver: {e}")
@@ -0,0 +1,156 @@
+"""Browser memory readings: JS heap, DOM/listener counts and Chrome process RSS"""
+import gzip
+import logging
+import os
+from typing import Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+# Chrome DevTools Performance.getMetrics name -> our key
+_CDP_METRICS = {
+    "JSHeapUsedSize": "js_heap_used_mb",
+    "JSHeapTotalSize": "js_heap_total_mb",
+    "Nodes": "dom_nodes",
+    "JSEventListeners": "listeners",
+    "Documents": "documents",
+}
+
+_FALLBACK_SCRIPT = """
+var memory = performance.memory || {};
+return {
+    js_heap_used_mb: memory.usedJSHeapSize ? memory.usedJSHeapSize / 1048576 : null,
+    js_heap_total_mb: memory.totalJSHeapSize ? memory.totalJSHeapSize / 1048576 : null,
+    dom_nodes: document.getElementsByTagName('*').length,
+    listeners: null,
+    documents: null
+};
+"""
+
+
+class BrowserMemory:
+    """Memory samples for a live driver
+
+    Chromium drivers are read through the DevTools protocol, which reports
+    exact heap sizes and listener counts; other browsers fall back to
+    performance.memory (coarse, Chrome-only) and a DOM element count.
+    """
+
+    @staticmethod
+    def sample(driver, collect_garbage: bool = False) -> Dict[str, Optional[float]]:
+        """js_heap_used_mb, js_heap_total_mb, dom_nodes, listeners, documents
+
+        collect_garbage forces a full GC first so the heap reflects
+        retained objects rather than garbage not yet collected.
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            try:
+                if collect_garbage:
+                    driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+                driver.execute_cdp_cmd("Performance.enable", {})
+                metrics = {m["name"]: m["value"] for m in driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]}
+                sample = {key: metrics.get(name) for name, key in _CDP_METRICS.items()}
+                for key in ("js_heap_used_mb", "js_heap_total_mb"):
+                    if sample[key] is not None:
+                        sample[key] = sample[key] / MB
+                return sample
+            except Exception as e:
+                logger.debug(f"CDP memory metrics unavailable: {e}")
+        return driver.execute_script(_FALLBACK_SCRIPT)
+
+    @staticmethod
+    def performance_memory_mb(driver) -> Optional[float]:
+        """performance.memory.usedJSHeapSize as the page itself reports it (Chrome only)"""
+        used = driver.execute_script("return performance.memory ? performance.memory.usedJSHeapSize : null;")
+        return used / MB if used is not None else None
+
+    @staticmethod
+    def detached_nodes(driver) -> Optional[int]:
+        """DOM nodes no longer in the document but still referenced from JS (Chrome 124+)"""
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return None
+        try:
+            return len(driver.execute_cdp_cmd("DOM.getDetachedDomNodes", {}).get("detachedNodes", []))
+        except Exception as e:
+            logger.debug(f"DOM.getDetachedDomNodes unavailable: {e}")
+            return None
+
+    @staticmethod
+    def save_heap_snapshot(driver, path: str) -> Optional[str]:
+        """Write a gzip-compressed .heapsnapshot (gunzip, then load in DevTools > Memory); None on failure
+
+        The snapshot arrives as HeapProfiler.addHeapSnapshotChunk events,
+        which execute_cdp_cmd cannot receive, so this opens a DevTools
+        websocket through Selenium's trio-based bidi_connection.
+        """
+        try:
+            import trio
+        except ImportError:
+            logger.warning("trio is not installed; heap snapshot skipped")
+            return None
+
+        async def capture() -> List[str]:
+            async with driver.bidi_connection() as connection:
+                session, devtools = connection.session, connection.devtools
+                events = session.listen(devtools.heap_profiler.AddHeapSnapshotChunk, buffer_size=1_000_000)
+                await session.execute(devtools.heap_profiler.take_heap_snapshot(report_progress=False))
+                chunks = []
+                while True:
+                    try:
+                        chunks.append(events.receive_nowait().chunk)
+                    except trio.WouldBlock:
+                        return chunks
+
+        try:
+            chunks = trio.run(capture)
+        except Exception as e:
+            logger.warning(f"Heap snapshot failed: {e}")
+            return None
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with gzip.open(path, "wt") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        logger.info(f"Heap snapshot saved to {path}")
+        return path
+
+    @staticmethod
+    def rss_mb(driver) -> Optional[float]:
+        """Resident memory of the driver process and all browser processes it started (Linux only)"""
+        service = getattr(driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is None or not os.path.isdir("/proc"):
+            return None
+        pids = BrowserMemory._descendants(process.pid) + [process.pid]
+        total_kb = 0
+        for pid in pids:
+            try:
+                with open(f"/proc/{pid}/status") as f:
+                    for line in f:
+                        if line.startswith("VmRSS:"):
+                            total_kb += int(line.split()[1])
+                            break
+            except OSError:
+                continue
+        return total_kb / 1024
+
+    @staticmethod
+    def _descendants(root: int) -> List[int]:
+        children: Dict[int, List[int]] = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # Field 4 is the parent PID; the command name before it may contain spaces
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+        found, stack = [], [root]
+        while stack:
+            for child in children.get(stack.pop(), []):
+                found.append(child)
+                stack.append(child)
+        return found
@@ -0,0 +1,163 @@
+"""WebDriver command instrumentation and latency metrics"""
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+from tests.utils.stats import histogram, percentile
+
+
+# Name of the user property used to ship per-test metrics to the report
+USER_PROPERTY = "webdriver_commands"
+
+
+class CommandStats:
+    """Latency samples (ms) grouped by WebDriver command name"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def record(self, command: str, duration_ms: float):
+        """Record a single command round trip"""
+        with self._lock:
+            self.samples[command].append(duration_ms)
+
+    def merge(self, other: "CommandStats"):
+        """Fold another stats object into this one"""
+        with self._lock:
+            for command, values in other.samples.items():
+                self.samples[command].extend(values)
+
+    @property
+    def round_trips(self) -> int:
+        """Total number of commands sent to the driver"""
+        return sum(len(values) for values in self.samples.values())
+
+    @property
+    def total_ms(self) -> float:
+        """Total time spent waiting on the driver"""
+        return sum(sum(values) for values in self.samples.values())
+
+    def summary(self) -> Dict[str, dict]:
+        """Per-command count, latency percentiles and histogram"""
+        result = {}
+        for command, values in sorted(self.samples.items(), key=lambda kv: -sum(kv[1])):
+            result[command] = {
+                "count": len(values),
+                "total_ms": round(sum(values), 2),
+                "p50_ms": round(percentile(values, 50), 2),
+                "p95_ms": round(percentile(values, 95), 2),
+                "max_ms": round(max(values), 2),
+                "histogram": histogram(values),
+            }
+        return result
+
+    def to_dict(self) -> dict:
+        """Serializable form, safe to pass through xdist report properties"""
+        return {
+            "round_trips": self.round_trips,
+            "total_ms": round(self.total_ms, 2),
+            "samples": {command: [round(v, 2) for v in values] for command, values in self.samples.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CommandStats":
+        """Rebuild stats from to_dict() output"""
+        stats = cls()
+        for command, values in data.get("samples", {}).items():
+            stats.samples[command].extend(values)
+        return stats
+
+    def format_table(self, limit: int = 15) -> str:
+        """Render a plain-text latency table"""
+        lines = [
+            f"{'command':<28}{'count':>7}{'total ms':>11}{'p50':>9}{'p95':>9}{'max':>9}",
+            "-" * 73,
+        ]
+        for command, row in list(self.summary().items())[:limit]:
+            lines.append(
+                f"{command:<28}{row['count']:>7}{row['total_ms']:>11.1f}"
+                f"{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['max_ms']:>9.1f}"
+            )
+        lines.append(f"round trips: {self.round_trips}, driver time: {self.total_ms / 1000:.2f}s")
+        lines.extend(self.format_histogram())
+        return "\n".join(lines)
+
+    def format_histogram(self, width: int = 40) -> List[str]:
+        """Render an ASCII histogram over all command latencies"""
+        counts = histogram([v for values in self.samples.values() for v in values])
+        peak = max(counts.values()) if counts else 0
+        if not peak:
+            return []
+        return [
+            f"{label:>10} {'#' * max(1, round(width * count / peak)) if count else '':<{width}} {count}"
+            for label, count in counts.items()
+        ]
+
+
+class CommandInstrumentation:
+    """Times every command sent through a driver's command executor"""
+
+    _ATTRIBUTE = "_command_instrumentation"
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.stats = CommandStats()
+        self._listeners: List[Callable] = []
+        self._in_flight: Dict[int, dict] = {}
+        self._original_execute = driver.command_executor.execute
+        driver.command_executor.execute = self._execute
+
+    def _execute(self, command: str, params: Optional[dict] = None):
+        """Timed pass-through to the real executor"""
+        start = time.perf_counter()
+        thread_id = threading.get_ident()
+        self._in_flight[thread_id] = {"command": command, "params": params, "since": time.time()}
+        response = None
+        try:
+            response = self._original_execute(command, params)
+            return response
+        finally:
+            self._in_flight.pop(thread_id, None)
+            duration_ms = (time.perf_counter() - start) * 1000
+            self.stats.record(command, duration_ms)
+            for listener in self._listeners:
+                listener(command, params, duration_ms, response)
+
+    def in_flight(self, thread_id: Optional[int] = None) -> Optional[dict]:
+        """Command the given thread (default: any) is waiting on: command, params, since"""
+        if thread_id is not None:
+            return self._in_flight.get(thread_id)
+        return min(list(self._in_flight.values()), key=lambda c: c["since"], default=None)
+
+    def add_listener(self, listener: Callable):
+        """Call listener(command, params, duration_ms, response) after every command"""
+        self._listeners.append(listener)
+
+    def reset(self) -> CommandStats:
+        """Start a fresh stats window and return the previous one"""
+        previous, self.stats = self.stats, CommandStats()
+        return previous
+
+    @classmethod
+    def attach(cls, driver) -> "CommandInstrumentation":
+        """Instrument driver (idempotent) and return its instrumentation"""
+        existing = cls.get(driver)
+        if existing:
+            return existing
+        instrumentation = cls(driver)
+        setattr(driver, cls._ATTRIBUTE, instrumentation)
+        return instrumentation
+
+    @classmethod
+    def get(cls, driver) -> Optional["CommandInstrumentation"]:
+        """Return the instrumentation attached to driver, if any"""
+        return getattr(driver, cls._ATTRIBUTE, None)
+
+
+def record_test_metrics(node, driver):
+    """Attach the driver's command metrics to a pytest item's report properties"""
+    instrumentation = CommandInstrumentation.get(driver) if driver else None
+    if instrumentation:
+        node.user_properties.append((USER_PROPERTY, instrumentation.reset().to_dict()))
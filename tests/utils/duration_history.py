@@ -0,0 +1,68 @@
+"""Per-test duration history persisted across runs (shared by xdist workers)"""
+import json
+import os
+from typing import Dict, List, Optional
+
+from tests.utils.file_lock import FileLock
+from tests.utils.stats import percentile
+
+
+class DurationHistory:
+    """Last `window` passing durations (seconds) of every test, keyed by node ID
+
+        history = DurationHistory("tests/reports/.cache/durations.json")
+        if history.is_slow(nodeid, 12.3): ...
+        history.record(nodeid, 12.3)
+    """
+
+    def __init__(self, path: str, window: int = 50, min_samples: int = 5):
+        self.path = path
+        self.window = window
+        self.min_samples = min_samples
+        self._lock = FileLock(f"{path}.lock", timeout=30)
+
+    def _load(self) -> Dict[str, List[float]]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def all(self) -> Dict[str, List[float]]:
+        """Node ID -> recorded durations, read once (for whole-run estimates)"""
+        return self._load()
+
+    def durations(self, nodeid: str) -> List[float]:
+        return self._load().get(nodeid, [])
+
+    def p95(self, nodeid: str) -> Optional[float]:
+        """p95 of recorded durations; None until min_samples runs are known"""
+        return self.percentile(nodeid, 95)
+
+    def percentile(self, nodeid: str, pct: float, durations: Optional[List[float]] = None) -> Optional[float]:
+        """pct-th percentile of recorded (or given) durations; None until min_samples runs are known"""
+        durations = self.durations(nodeid) if durations is None else durations
+        return percentile(durations, pct) if len(durations) >= self.min_samples else None
+
+    def is_slow(self, nodeid: str, duration: float) -> bool:
+        """Slower than this test's historical p95"""
+        p95 = self.p95(nodeid)
+        return p95 is not None and duration > p95
+
+    def record(self, nodeid: str, duration: float):
+        """Append a duration, keeping only the most recent window"""
+        self.record_many({nodeid: duration})
+
+    def record_many(self, durations: Dict[str, float]):
+        """Append one duration per test with a single locked read-modify-write"""
+        if not durations:
+            return
+        with self._lock:
+            history = self._load()
+            for nodeid, duration in durations.items():
+                history[nodeid] = (history.get(nodeid, []) + [round(duration, 3)])[-self.window:]
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(history, f)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,137 @@
+"""Bulk element data extraction in a single WebDriver round trip"""
+from typing import Dict, List, Optional, Sequence
+
+
+# Fields understood by ElementExtractor.extract:
+#   text                      trimmed innerText
+#   tag                       lower-case tag name
+#   visible                   rendered with a non-empty box and not visibility:hidden
+#   enabled                   not disabled
+#   rect                      bounding box {x, y, width, height} in CSS px, viewport relative
+#   attr:<name>               getAttribute(name)
+#   prop:<name>               DOM property, e.g. prop:href gives the resolved absolute URL
+#   style:<property>          computed style value
+#   count:<css>               number of descendants matching css
+#   descendants:<css>@<attr>  attribute values of all descendants matching css
+#   window:<name>             window property, e.g. window:devicePixelRatio (same for every row)
+DEFAULT_FIELDS = ("text", "visible")
+
+_EXTRACT_SCRIPT = """
+var queries = arguments[0];
+
+function resolve(by, value) {
+    var root = document;
+    switch (by) {
+        case 'xpath':
+            var snapshot = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+            return nodes;
+        case 'css selector':
+            return Array.prototype.slice.call(root.querySelectorAll(value));
+        case 'id':
+            return Array.prototype.slice.call(root.querySelectorAll('#' + CSS.escape(value)));
+        case 'name':
+            return Array.prototype.filter.call(root.querySelectorAll('[name]'), function (el) {
+                return el.getAttribute('name') === value;
+            });
+        case 'tag name':
+            return Array.prototype.slice.call(root.getElementsByTagName(value));
+        case 'class name':
+            return Array.prototype.slice.call(root.getElementsByClassName(value));
+        case 'link text':
+        case 'partial link text':
+            return Array.prototype.filter.call(root.getElementsByTagName('a'), function (a) {
+                var text = (a.innerText || '').trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+
+function isVisible(el) {
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) { return false; }
+    return window.getComputedStyle(el).visibility !== 'hidden';
+}
+
+function read(el, field) {
+    if (field === 'text') { return (el.innerText || el.textContent || '').trim(); }
+    if (field === 'tag') { return el.tagName.toLowerCase(); }
+    if (field === 'visible') { return isVisible(el); }
+    if (field === 'enabled') { return !el.disabled; }
+    if (field === 'rect') {
+        var r = el.getBoundingClientRect();
+        return {x: r.left, y: r.top, width: r.width, height: r.height};
+    }
+    var sep = field.indexOf(':');
+    var kind = field.slice(0, sep), arg = field.slice(sep + 1);
+    if (kind === 'attr') { return el.getAttribute(arg); }
+    if (kind === 'prop') { var v = el[arg]; return v === undefined ? null : v; }
+    if (kind === 'style') { return window.getComputedStyle(el).getPropertyValue(arg); }
+    if (kind === 'window') { return window[arg]; }
+    if (kind === 'count') { return el.querySelectorAll(arg).length; }
+    if (kind === 'descendants') {
+        var at = arg.lastIndexOf('@');
+        var selector = arg.slice(0, at), attr = arg.slice(at + 1);
+        return Array.prototype.map.call(el.querySelectorAll(selector), function (child) {
+            return child.getAttribute(attr);
+        });
+    }
+    throw new Error('Unsupported field: ' + field);
+}
+
+return queries.map(function (query) {
+    var elements = resolve(query.by, query.value);
+    if (query.limit) { elements = elements.slice(0, query.limit); }
+    return elements.map(function (el) {
+        var row = {};
+        query.fields.forEach(function (field) { row[field] = read(el, field); });
+        return row;
+    });
+});
+"""
+
+
+class ElementExtractor:
+    """Read data for every element matching a locator with one execute_script call"""
+
+    @staticmethod
+    def extract(
+        driver,
+        locator: tuple,
+        fields: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """Return one plain dict per matching element, keyed by field name"""
+        return ElementExtractor.extract_many(driver, {"rows": (locator, fields, limit)})["rows"]
+    
+    @staticmethod
+    def extract_many(driver, queries: Dict[str, tuple]) -> Dict[str, List[Dict]]:
+        """Run several extractions in one call
+        
+        queries maps a name to (locator, fields) or (locator, fields, limit);
+        the result maps the same names to their rows.
+        """
+        names = list(queries)
+        payload = []
+        for name in names:
+            locator, fields, *rest = queries[name]
+            by, value = locator
+            payload.append({
+                "by": by,
+                "value": value,
+                "fields": list(fields or DEFAULT_FIELDS),
+                "limit": rest[0] if rest else None,
+            })
+        results = driver.execute_script(_EXTRACT_SCRIPT, payload) or [[] for _ in names]
+        return dict(zip(names, results))
+    
+    @staticmethod
+    def extract_first(
+        driver,
+        locator: tuple,
+        fields: Optional[Sequence[str]] = None
+    ) -> Optional[Dict]:
+        """Return the data for the first matching element, or None"""
+        rows = ElementExtractor.extract(driver, locator, fields, limit=1)
+        return rows[0] if rows else None
@@ -0,0 +1,58 @@
+"""Cross-process file lock (shared by xdist workers)"""
+import os
+import time
+
+
+class FileLock:
+    """Exclusive lock backed by an O_EXCL lock file
+
+        with FileLock("/tmp/catalog.json.lock"):
+            ...
+    """
+
+    def __init__(self, path: str, timeout: float = 120, stale_after: float = 300, poll_interval: float = 0.1):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    def acquire(self):
+        """Block until the lock file can be created"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        deadline = time.time() + self.timeout
+        while True:
+            try:
+                self._fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, str(os.getpid()).encode())
+                return
+            except FileExistsError:
+                self._break_if_stale()
+                if time.time() >= deadline:
+                    raise TimeoutError(f"Could not acquire lock {self.path} within {self.timeout}s")
+                time.sleep(self.poll_interval)
+
+    def release(self):
+        """Remove the lock file"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+    def _break_if_stale(self):
+        """Remove a lock left behind by a crashed process"""
+        try:
+            if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
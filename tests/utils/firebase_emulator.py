@@ -0,0 +1,223 @@
+"""Local Firestore/Auth emulator management with fast snapshot/restore"""
+import json
+import logging
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import requests
+
+from tests.utils.firestore_seeder import MAX_BATCH_SIZE, FirestoreSeeder
+
+
+logger = logging.getLogger(__name__)
+
+# Documents by collection path, then by document ID
+FirestoreSnapshot = Dict[str, Dict[str, dict]]
+
+
+class FirebaseEmulator:
+    """Starts (or attaches to) the Firestore and Auth emulators
+
+    Projects prefixed with "demo-" never reach the cloud, so the emulator
+    runs fully offline. State can be captured two ways:
+
+    * snapshot()/restore(): documents held in memory and written back with
+      batched commits after a wipe - well under a second for test datasets.
+    * export(directory): the emulator's own on-disk export, which start()
+      loads again through --import (e.g. a large pre-seeded catalog).
+    """
+
+    def __init__(
+        self,
+        project_id: str = "demo-zilacart",
+        host: str = "127.0.0.1",
+        firestore_port: int = 8080,
+        auth_port: int = 9099,
+        hub_port: int = 4400,
+        logging_port: int = 4405,
+        websocket_port: int = 9150,
+        import_dir: Optional[str] = None
+    ):
+        self.project_id = project_id
+        self.host = host
+        self.firestore_port = firestore_port
+        self.auth_port = auth_port
+        self.hub_port = hub_port
+        self.logging_port = logging_port
+        self.websocket_port = websocket_port
+        self.import_dir = import_dir
+        self._process: Optional[subprocess.Popen] = None
+        self._workdir: Optional[str] = None
+        self._seeder: Optional[FirestoreSeeder] = None
+
+    # ==================== Lifecycle ====================
+    @staticmethod
+    def find_cli() -> Optional[List[str]]:
+        """Command prefix for the Firebase CLI (FIREBASE_CLI, firebase or npx)"""
+        if os.getenv("FIREBASE_CLI"):
+            return os.getenv("FIREBASE_CLI").split()
+        if shutil.which("firebase"):
+            return ["firebase"]
+        if shutil.which("npx"):
+            return ["npx", "--yes", "firebase-tools"]
+        return None
+
+    @property
+    def firestore_host(self) -> str:
+        return f"{self.host}:{self.firestore_port}"
+
+    @property
+    def auth_host(self) -> str:
+        return f"{self.host}:{self.auth_port}"
+
+    def is_running(self) -> bool:
+        """Both emulator ports accept connections"""
+        return all(self._port_open(port) for port in (self.firestore_port, self.auth_port))
+
+    def start(self, timeout: float = 90):
+        """Launch the emulators (unless already running) and point the SDKs at them"""
+        if not self.is_running():
+            cli = self.find_cli()
+            if not cli:
+                raise RuntimeError("Firebase CLI not found (install firebase-tools or set FIREBASE_CLI)")
+            self._workdir = tempfile.mkdtemp(prefix="firebase-emulator-")
+            with open(os.path.join(self._workdir, "firebase.json"), "w") as f:
+                json.dump({"emulators": {
+                    "firestore": {"host": self.host, "port": self.firestore_port,
+                                  "websocketPort": self.websocket_port},
+                    "auth": {"host": self.host, "port": self.auth_port},
+                    "hub": {"host": self.host, "port": self.hub_port},
+                    "ui": {"enabled": False},
+                    "logging": {"host": self.host, "port": self.logging_port},
+                }}, f)
+            cmd = cli + ["emulators:start", "--only", "firestore,auth", "--project", self.project_id]
+            if self.import_dir and os.path.isdir(self.import_dir):
+                cmd += ["--import", self.import_dir]
+            logger.info(f"Starting Firebase emulators: {' '.join(cmd)}")
+            self._process = subprocess.Popen(
+                cmd,
+                cwd=self._workdir,
+                stdout=open(os.path.join(self._workdir, "emulator.log"), "w"),
+                stderr=subprocess.STDOUT,
+                start_new_session=True
+            )
+            self._wait_until_ready(timeout)
+
+        os.environ["FIRESTORE_EMULATOR_HOST"] = self.firestore_host
+        os.environ["FIREBASE_AUTH_EMULATOR_HOST"] = self.auth_host
+        os.environ["GCLOUD_PROJECT"] = self.project_id
+
+    def stop(self):
+        """Terminate emulators started by this instance"""
+        if self._process and self._process.poll() is None:
+            os.killpg(self._process.pid, signal.SIGTERM)
+            try:
+                self._process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                os.killpg(self._process.pid, signal.SIGKILL)
+        self._process = None
+        if self._workdir:
+            shutil.rmtree(self._workdir, ignore_errors=True)
+            self._workdir = None
+
+    def _wait_until_ready(self, timeout: float):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Firebase emulators exited early; see {self._workdir}/emulator.log")
+            if self.is_running():
+                return
+            time.sleep(0.5)
+        self.stop()
+        raise RuntimeError(f"Firebase emulators not ready within {timeout}s")
+
+    def _port_open(self, port: int) -> bool:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            return sock.connect_ex((self.host, port)) == 0
+
+    # ==================== Data ====================
+    @property
+    def seeder(self) -> FirestoreSeeder:
+        """Bulk loader bound to the emulator"""
+        if self._seeder is None:
+            self._seeder = FirestoreSeeder.create(project_id=self.project_id)
+        return self._seeder
+
+    def clear_firestore(self):
+        """Delete every document in the emulator"""
+        requests.delete(
+            f"http://{self.firestore_host}/emulator/v1/projects/{self.project_id}"
+            f"/databases/(default)/documents",
+            timeout=30
+        ).raise_for_status()
+
+    def clear_auth(self):
+        """Delete every Auth user in the emulator"""
+        requests.delete(
+            f"http://{self.auth_host}/emulator/v1/projects/{self.project_id}/accounts",
+            timeout=30
+        ).raise_for_status()
+
+    def sign_in(self, email: str, password: str) -> str:
+        """ID token for an emulator Auth user (usable as a Bearer token against the app)"""
+        response = requests.post(
+            f"http://{self.auth_host}/identitytoolkit.googleapis.com/v1/accounts:signInWithPassword",
+            params={"key": "fake-api-key"},
+            json={"email": email, "password": password, "returnSecureToken": True},
+            timeout=30
+        )
+        response.raise_for_status()
+        return response.json()["idToken"]
+
+    def snapshot(self, recursive: bool = False) -> FirestoreSnapshot:
+        """Capture all documents (top-level collections unless recursive)"""
+        db = self.seeder.db
+        state: FirestoreSnapshot = {}
+
+        def capture(collection):
+            docs = {doc.id: doc.to_dict() for doc in collection.stream()}
+            parent = collection.parent
+            state[f"{parent.path}/{collection.id}" if parent else collection.id] = docs
+            if recursive:
+                for doc_id in docs:
+                    for child in collection.document(doc_id).collections():
+                        capture(child)
+
+        for collection in db.collections():
+            capture(collection)
+        logger.info(f"Snapshot: {sum(len(d) for d in state.values())} documents in {len(state)} collections")
+        return state
+
+    def restore(self, state: FirestoreSnapshot):
+        """Wipe Firestore and write the snapshot back with batched commits"""
+        start = time.time()
+        self.clear_firestore()
+        db = self.seeder.db
+        batch, pending = db.batch(), 0
+        for path, docs in state.items():
+            for doc_id, data in docs.items():
+                batch.set(db.collection(path).document(doc_id), data)
+                pending += 1
+                if pending == MAX_BATCH_SIZE:
+                    batch.commit()
+                    batch, pending = db.batch(), 0
+        if pending:
+            batch.commit()
+        logger.info(f"Restored Firestore snapshot in {time.time() - start:.3f}s")
+
+    def export(self, directory: str):
+        """Write the emulator's on-disk export (loadable with import_dir)"""
+        os.makedirs(directory, exist_ok=True)
+        requests.post(
+            f"http://{self.host}:{self.hub_port}/_admin/export",
+            json={"path": os.path.abspath(directory), "initiatedBy": "tests"},
+            timeout=300
+        ).raise_for_status()
+        logger.info(f"Exported emulator state to {directory}")
@@ -0,0 +1,98 @@
+"""Scoped implicit-wait control and detection of time lost in implicit waits"""
+import functools
+import logging
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+
+from tests.utils.command_metrics import CommandInstrumentation
+
+
+logger = logging.getLogger(__name__)
+
+_ATTRIBUTE = "_implicit_wait_seconds"
+FIND_COMMANDS = ("findElement", "findElements", "findChildElement", "findChildElements")
+
+
+def set_implicit_wait(driver, seconds: float):
+    """Set the implicit wait and remember it so scopes can restore it without a round trip"""
+    driver.implicitly_wait(seconds)
+    setattr(driver, _ATTRIBUTE, seconds)
+
+
+def get_implicit_wait(driver) -> float:
+    """Current implicit wait in seconds"""
+    if not hasattr(driver, _ATTRIBUTE):
+        setattr(driver, _ATTRIBUTE, driver.timeouts.implicit_wait)
+    return getattr(driver, _ATTRIBUTE)
+
+
+@contextmanager
+def scoped_implicit_wait(driver, seconds: float):
+    """Temporarily use a different implicit wait, restoring the previous one on exit
+
+        with scoped_implicit_wait(driver, 5):
+            driver.find_element(By.ID, "slow-widget")
+    """
+    previous = get_implicit_wait(driver)
+    if previous == seconds:
+        yield
+        return
+    set_implicit_wait(driver, seconds)
+    try:
+        yield
+    finally:
+        set_implicit_wait(driver, previous)
+
+
+def with_implicit_wait(seconds: float):
+    """Decorator form of scoped_implicit_wait
+
+    The driver is taken from the first argument: either a WebDriver or an
+    object exposing .driver (page objects, BaseTest).
+    """
+    def decorator(func: Callable):
+        @functools.wraps(func)
+        def wrapper(target, *args, **kwargs):
+            driver = getattr(target, "driver", target)
+            with scoped_implicit_wait(driver, seconds):
+                return func(target, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class ImplicitWaitDetector:
+    """Logs element lookups that spent more than threshold_ms inside an implicit wait"""
+
+    def __init__(self, threshold_ms: float = 500):
+        self.threshold_ms = threshold_ms
+        self.implicit_ms = 0
+        self.hits: List[dict] = []
+
+    def __call__(self, command: str, params: Optional[dict], duration_ms: float, response):
+        if command == "setTimeouts" and params and "implicit" in params:
+            self.implicit_ms = params["implicit"]
+            return
+        if command not in FIND_COMMANDS or not self.implicit_ms or duration_ms < self.threshold_ms:
+            return
+        value = (response or {}).get("value")
+        missed = response is None or value in (None, []) or (isinstance(value, dict) and "error" in value)
+        hit = {
+            "command": command,
+            "using": (params or {}).get("using"),
+            "value": (params or {}).get("value"),
+            "duration_ms": round(duration_ms, 1),
+            "implicit_ms": self.implicit_ms,
+            "missed": missed,
+        }
+        self.hits.append(hit)
+        logger.warning(
+            f"{command} ({hit['using']}={hit['value']!r}) spent {hit['duration_ms']}ms "
+            f"with implicit wait {self.implicit_ms}ms{' and found nothing' if missed else ''}"
+        )
+
+    @classmethod
+    def attach(cls, driver, threshold_ms: float = 500) -> "ImplicitWaitDetector":
+        """Instrument driver (if needed) and register a detector on it"""
+        detector = cls(threshold_ms)
+        CommandInstrumentation.attach(driver).add_listener(detector)
+        return detector
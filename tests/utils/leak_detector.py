@@ -0,0 +1,128 @@
+"""Client memory leak checks: repeat a cycle, force GC, fit growth per iteration
+
+    def test_pdp_cycle_does_not_leak(driver, leak_check):
+        leak_check.check(lambda: (open_product(), add_to_cart(), go_back()))
+
+After warmup cycles (first-visit caches, lazily loaded chunks and JIT code
+are not leaks) every cycle is followed by a forced garbage collection and a
+reading of the JS heap, performance.memory, DOM nodes, event listeners and
+detached DOM nodes. Growth per iteration is the least-squares slope over
+the cycles; a leak is a slope above its threshold. When a threshold is
+exceeded a heap snapshot is written next to the report for DevTools.
+"""
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from tests.utils.browser_memory import BrowserMemory
+from tests.utils.stats import linear_fit
+
+
+logger = logging.getLogger(__name__)
+
+# Metric -> (unit, default allowed growth per iteration)
+DEFAULT_THRESHOLDS = {
+    "js_heap_used_kb": ("KB", 100.0),
+    "dom_nodes": ("nodes", 20.0),
+    "listeners": ("listeners", 5.0),
+    "detached_nodes": ("nodes", 5.0),
+}
+
+
+@dataclass
+class LeakReport:
+    """Per-cycle memory samples and the fitted growth per iteration"""
+
+    name: str
+    samples: List[Dict[str, Optional[float]]]
+    thresholds: Dict[str, float]
+    growth: Dict[str, float] = field(default_factory=dict)
+    snapshot_path: Optional[str] = None
+
+    def __post_init__(self):
+        for metric in self.thresholds:
+            points = [(i, s[metric]) for i, s in enumerate(self.samples) if s.get(metric) is not None]
+            if len(points) >= 3:
+                self.growth[metric] = linear_fit([x for x, _ in points], [y for _, y in points])[0]
+
+    def exceeded(self) -> Dict[str, float]:
+        """Metrics growing faster than their threshold -> growth per iteration"""
+        return {metric: growth for metric, growth in self.growth.items() if growth > self.thresholds[metric]}
+
+    @property
+    def passed(self) -> bool:
+        return not self.exceeded()
+
+    def format_table(self) -> str:
+        header = f"{'metric':<18}{'first':>10}{'last':>10}{'per iter':>10}{'limit':>8}"
+        lines = [f"Leak check {self.name}: {len(self.samples)} cycles", header, "-" * len(header)]
+        for metric, growth in self.growth.items():
+            values = [s[metric] for s in self.samples if s.get(metric) is not None]
+            flag = "  <- leak" if growth > self.thresholds[metric] else ""
+            lines.append(f"{metric:<18}{values[0]:>10.0f}{values[-1]:>10.0f}{growth:>10.1f}"
+                         f"{self.thresholds[metric]:>8g}{flag}")
+        if self.snapshot_path:
+            lines.append(f"Heap snapshot: {self.snapshot_path}")
+        return "\n".join(lines)
+
+
+class LeakDetector:
+    """Runs a cycle repeatedly in one driver and measures what it leaves behind"""
+
+    def __init__(
+        self,
+        driver,
+        name: str = "leak_check",
+        iterations: int = 10,
+        warmup: int = 2,
+        thresholds: Optional[Dict[str, float]] = None,
+        snapshot_dir: Optional[str] = None
+    ):
+        self.driver = driver
+        self.name = re.sub(r"[^\w.-]+", "_", name)
+        self.iterations = iterations
+        self.warmup = warmup
+        self.thresholds = {metric: limit for metric, (_, limit) in DEFAULT_THRESHOLDS.items()}
+        self.thresholds.update(thresholds or {})
+        self.snapshot_dir = snapshot_dir
+        self.reports: List[LeakReport] = []
+
+    def sample(self) -> Dict[str, Optional[float]]:
+        """Memory after a forced GC"""
+        memory = BrowserMemory.sample(self.driver, collect_garbage=True)
+        heap_mb = memory.get("js_heap_used_mb")
+        page_heap_mb = BrowserMemory.performance_memory_mb(self.driver)
+        return {
+            "js_heap_used_kb": heap_mb * 1024 if heap_mb is not None else None,
+            "performance_memory_kb": page_heap_mb * 1024 if page_heap_mb is not None else None,
+            "dom_nodes": memory.get("dom_nodes"),
+            "listeners": memory.get("listeners"),
+            "detached_nodes": BrowserMemory.detached_nodes(self.driver),
+        }
+
+    def run(self, cycle: Callable[[], object], iterations: Optional[int] = None) -> LeakReport:
+        """Warm up, then run cycle iterations times with a sample after each"""
+        for _ in range(self.warmup):
+            cycle()
+        samples = [self.sample()]
+        for _ in range(iterations or self.iterations):
+            cycle()
+            samples.append(self.sample())
+        report = LeakReport(self.name, samples, self.thresholds)
+        if not report.passed and self.snapshot_dir:
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            report.snapshot_path = BrowserMemory.save_heap_snapshot(
+                self.driver, os.path.join(self.snapshot_dir, f"{self.name}_{stamp}.heapsnapshot.gz")
+            )
+        logger.info(report.format_table())
+        self.reports.append(report)
+        return report
+
+    def check(self, cycle: Callable[[], object], iterations: Optional[int] = None) -> LeakReport:
+        """run() and fail the test when any metric grows faster than its threshold"""
+        report = self.run(cycle, iterations)
+        assert report.passed, f"Memory grows every cycle: {report.exceeded()}\n{report.format_table()}"
+        return report
@@ -0,0 +1,75 @@
+"""Page-load and server readiness helpers shared by E2E suites and benchmarks"""
+import logging
+import time
+import urllib.error
+import urllib.request
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+logger = logging.getLogger(__name__)
+
+
+def wait_for_document_ready(driver, timeout=20):
+    """Wait until DOM is fully loaded."""
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
+
+
+def wait_for_http_ready(url, timeout=90, interval=2):
+    """Poll URL until HTTP endpoint responds, allowing warm-up time."""
+    deadline = time.time() + timeout
+    last_error = None
+    last_status = None
+    attempt = 0
+
+    while time.time() < deadline:
+        attempt += 1
+        try:
+            with urllib.request.urlopen(url, timeout=5) as response:
+                status = getattr(response, "status", 200)
+                last_status = status
+                if status < 500:
+                    return
+        except urllib.error.HTTPError as error:
+            status = getattr(error, "code", None)
+            if status is not None:
+                last_status = status
+                logger.info(f"HTTP readiness check reached {url} with status={status} (attempt {attempt}); treating as reachable")
+                return
+            last_error = error
+        except Exception as error:
+            last_error = error
+            logger.info(f"HTTP readiness retry for {url} (attempt {attempt}, last_status={last_status}): {error}")
+        time.sleep(interval)
+
+    raise AssertionError(
+        f"Server did not become ready at {url}: last_status={last_status}, last_error={last_error}"
+    )
+
+
+def safe_navigate(driver, url, retries=2, page_load_timeout=45):
+    """Navigate to URL with retry to handle intermittent page-load hangs."""
+    driver.set_page_load_timeout(page_load_timeout)
+    last_error = None
+
+    for attempt in range(1, retries + 1):
+        try:
+            driver.get(url)
+            return
+        except TimeoutException as error:
+            last_error = error
+            logger.warning(f"Page load timeout navigating to {url} (attempt {attempt}/{retries})")
+        except Exception as error:
+            last_error = error
+            logger.warning(f"Navigation error to {url} (attempt {attempt}/{retries}): {error}")
+
+        try:
+            driver.execute_script("window.stop();")
+        except Exception:
+            pass
+        time.sleep(2)
+
+    raise AssertionError(f"Failed to navigate to {url} after {retries} attempts: {last_error}")
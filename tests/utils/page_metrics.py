@@ -0,0 +1,53 @@
+"""Browser-side page performance metrics collected in one script call"""
+from typing import Dict, Optional
+
+
+# Reads navigation timing, paint entries and the latest LCP candidate. LCP is
+# only exposed through PerformanceObserver, so the buffered callback (or a
+# short timeout when the browser reports none) resolves the async script.
+_METRICS_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var result = {lcp_ms: null};
+
+function finish() {
+    var nav = performance.getEntriesByType('navigation')[0];
+    var fcp = performance.getEntriesByName('first-contentful-paint')[0];
+    var resources = performance.getEntriesByType('resource');
+    result.ttfb_ms = nav ? nav.responseStart : null;
+    result.dom_content_loaded_ms = nav ? nav.domContentLoadedEventEnd : null;
+    result.load_ms = nav ? nav.loadEventEnd : null;
+    result.fcp_ms = fcp ? fcp.startTime : null;
+    result.dom_nodes = document.getElementsByTagName('*').length;
+    result.resource_count = resources.length;
+    result.transfer_bytes = resources.reduce(function (sum, r) { return sum + (r.transferSize || 0); },
+                                             nav ? nav.transferSize || 0 : 0);
+    done(result);
+}
+
+try {
+    var observer = new PerformanceObserver(function (list) {
+        var entries = list.getEntries();
+        result.lcp_ms = entries[entries.length - 1].startTime;
+        observer.disconnect();
+        finish();
+    });
+    observer.observe({type: 'largest-contentful-paint', buffered: true});
+    setTimeout(function () { observer.disconnect(); if (result.lcp_ms === null) finish(); }, 1000);
+} catch (e) {
+    finish();
+}
+"""
+
+
+class PageMetrics:
+    """Timing and DOM size of the current page"""
+
+    @staticmethod
+    def collect(driver) -> Dict[str, Optional[float]]:
+        """LCP, FCP, TTFB, DOMContentLoaded and load (ms from navigation start), DOM nodes, resources"""
+        return driver.execute_async_script(_METRICS_SCRIPT)
+
+    @staticmethod
+    def dom_node_count(driver) -> int:
+        """Number of elements in the document"""
+        return driver.execute_script("return document.getElementsByTagName('*').length")
@@ -0,0 +1,347 @@
+"""PayPal webhook event streams, signing and replay for load tests
+
+    python -m tests.utils.paypal_webhooks --orders tests/reports/orders-10000-42/orders.jsonl \
+        --load --rate 100 --duplicates 0.2 --reorder 0.1
+
+Events follow PayPal's PAYMENT.CAPTURE.* payloads. Deliveries are signed the
+way PayPal builds its transmission signature (transmission id, time, webhook
+id and CRC32 of the body), but with HMAC-SHA256 over a shared secret instead
+of PayPal's RSA certificate, so VerificationServer can stand in for
+/v1/notifications/verify-webhook-signature without network access.
+"""
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional
+
+import requests
+
+from tests.fixtures.catalog_generator import DEFAULT_SEED
+
+
+logger = logging.getLogger(__name__)
+
+COMPLETED = "PAYMENT.CAPTURE.COMPLETED"
+DENIED = "PAYMENT.CAPTURE.DENIED"
+REFUNDED = "PAYMENT.CAPTURE.REFUNDED"
+
+# Outcome of a payment -> events PayPal sends for it, in causal order
+SCENARIOS = {
+    "completed": (COMPLETED,),
+    "denied": (DENIED,),
+    "refunded": (COMPLETED, REFUNDED),
+}
+SCENARIO_WEIGHTS = {"completed": 0.7, "denied": 0.1, "refunded": 0.2}
+# Order status the app should end with once every event of a scenario is processed
+EXPECTED_STATUS = {"completed": "processing", "denied": "cancelled", "refunded": "refunded"}
+
+AUTH_ALGO = "HMACSHA256"
+CERT_URL = "http://127.0.0.1/v1/notifications/certs/CERT-LOCAL-STANDIN"
+
+
+# ==================== Event streams ====================
+def payment_ids(order_id: str, seed: int = DEFAULT_SEED) -> Dict[str, str]:
+    """Deterministic PayPal order/capture/refund IDs for one of our orders"""
+    digest = hashlib.sha256(f"{seed}:{order_id}".encode()).hexdigest().upper()
+    return {"paypalOrderId": digest[:17], "paypalCaptureId": digest[17:34], "paypalRefundId": digest[34:51]}
+
+
+def build_event(event_type: str, resource_id: str, amount: float, created: datetime,
+                related_order_id: Optional[str] = None, event_id: Optional[str] = None) -> dict:
+    """A PAYMENT.CAPTURE.* webhook event as PayPal posts it"""
+    status = event_type.rsplit(".", 1)[1]
+    return {
+        "id": event_id or f"WH-{uuid.uuid4().hex[:17].upper()}",
+        "event_version": "1.0",
+        "create_time": created.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "resource_type": "refund" if event_type == REFUNDED else "capture",
+        "event_type": event_type,
+        "summary": f"Payment {status.lower()}",
+        "resource": {
+            "id": resource_id,
+            "status": status,
+            "amount": {"value": f"{amount:.2f}", "currency_code": "USD"},
+            "supplementary_data": {"related_ids": {"order_id": related_order_id}},
+        },
+    }
+
+
+def pending_order(order: dict, scenario: str, seed: int = DEFAULT_SEED) -> dict:
+    """A PayPal order awaiting webhooks (refunded scenarios carry the refund record the webhook matches)"""
+    ids = payment_ids(order["id"], seed)
+    order = dict(order, status="pending", paymentMethod="paypal", paymentDetails={
+        "paypalOrderId": ids["paypalOrderId"],
+        "paypalCaptureId": ids["paypalCaptureId"],
+        "status": "PENDING",
+    })
+    order.pop("refundDetails", None)
+    if scenario == "refunded":
+        order["refundDetails"] = {"paypalRefundId": ids["paypalRefundId"], "status": "PENDING"}
+    return order
+
+
+@dataclass
+class EventStream:
+    """Deliveries in the order they will be posted, plus the scenario of every order"""
+
+    deliveries: List[dict]
+    scenarios: Dict[str, str]
+    duplicates: int = 0
+    reordered: int = 0
+
+
+def event_stream(
+    orders: Iterable[dict],
+    seed: int = DEFAULT_SEED,
+    duplicate_rate: float = 0.2,
+    reorder_rate: float = 0.1,
+    scenario_weights: Optional[Dict[str, float]] = None
+) -> EventStream:
+    """Build a realistic delivery sequence for orders
+
+    Each order gets a scenario (completed, denied, or completed then
+    refunded); seed the orders with pending_order() so the app can match
+    the events. A duplicate_rate share of events is delivered again later
+    with the same event ID, as PayPal does when an acknowledgement is lost.
+    For a reorder_rate share of refunded orders the refund arrives before
+    the capture.
+    """
+    rng = random.Random(f"{seed}:webhooks")
+    names, weights = zip(*(scenario_weights or SCENARIO_WEIGHTS).items())
+    start = datetime.now(timezone.utc)
+    timed, scenarios = [], {}
+    duplicates = reordered = 0
+
+    for order in orders:
+        scenario = rng.choices(names, weights)[0]
+        scenarios[order["id"]] = scenario
+        ids = payment_ids(order["id"], seed)
+        created = start + timedelta(seconds=rng.uniform(0, 600))
+        events = []
+        for event_type in SCENARIOS[scenario]:
+            resource_id = ids["paypalRefundId"] if event_type == REFUNDED else ids["paypalCaptureId"]
+            events.append(build_event(event_type, resource_id, order["totalAmount"], created, ids["paypalOrderId"],
+                                      event_id=f"WH-{rng.getrandbits(68):017X}"))
+            created += timedelta(seconds=rng.uniform(30, 3600))
+        # Delivery position: roughly create_time, with network jitter
+        positions = sorted(i * 60 + rng.uniform(0, 600) for i in range(len(events)))
+        if len(events) > 1 and rng.random() < reorder_rate:
+            positions.reverse()
+            reordered += 1
+        for event, position in zip(events, positions):
+            timed.append((position, event))
+            if rng.random() < duplicate_rate:
+                timed.append((position + rng.uniform(1, 900), event))
+                duplicates += 1
+
+    timed.sort(key=lambda pair: pair[0])
+    return EventStream([event for _, event in timed], scenarios, duplicates, reordered)
+
+
+# ==================== Signing ====================
+class WebhookSigner:
+    """Signs deliveries with PayPal's transmission headers
+
+    The signed string is PayPal's: transmission_id|transmission_time|webhook_id|crc32(body).
+    """
+
+    def __init__(self, webhook_id: str = "WH-LOCAL-STANDIN", secret: str = "local-webhook-secret"):
+        self.webhook_id = webhook_id
+        self._key = secret.encode()
+
+    @staticmethod
+    def body(event: dict) -> bytes:
+        """Canonical JSON encoding the signature covers"""
+        return json.dumps(event, separators=(",", ":")).encode()
+
+    def signature(self, transmission_id: str, transmission_time: str, body: bytes) -> str:
+        message = f"{transmission_id}|{transmission_time}|{self.webhook_id}|{zlib.crc32(body)}"
+        return base64.b64encode(hmac.new(self._key, message.encode(), hashlib.sha256).digest()).decode()
+
+    def headers(self, body: bytes) -> Dict[str, str]:
+        """Fresh transmission headers (every redelivery gets a new transmission ID)"""
+        transmission_id = str(uuid.uuid4())
+        transmission_time = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return {
+            "Content-Type": "application/json",
+            "paypal-transmission-id": transmission_id,
+            "paypal-transmission-time": transmission_time,
+            "paypal-transmission-sig": self.signature(transmission_id, transmission_time, body),
+            "paypal-cert-url": CERT_URL,
+            "paypal-auth-algo": AUTH_ALGO,
+        }
+
+    def verify(self, transmission_id: str, transmission_time: str, signature: str, body: bytes) -> bool:
+        return hmac.compare_digest(self.signature(transmission_id, transmission_time, body), signature)
+
+
+class _VerifyHandler(BaseHTTPRequestHandler):
+    signer: WebhookSigner = None
+
+    def do_POST(self):
+        if self.path != "/v1/notifications/verify-webhook-signature":
+            self.send_error(404)
+            return
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        valid = (
+            payload.get("webhook_id") == self.signer.webhook_id
+            and payload.get("auth_algo") == AUTH_ALGO
+            and self.signer.verify(payload.get("transmission_id", ""), payload.get("transmission_time", ""),
+                                   payload.get("transmission_sig", ""), WebhookSigner.body(payload.get("webhook_event")))
+        )
+        body = json.dumps({"verification_status": "SUCCESS" if valid else "FAILURE"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class VerificationServer:
+    """Local stand-in for PayPal's verify-webhook-signature API"""
+
+    def __init__(self, signer: WebhookSigner, host: str = "127.0.0.1", port: int = 0):
+        self.signer = signer
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "VerificationServer":
+        handler = type("VerifyHandler", (_VerifyHandler,), {"signer": self.signer})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def verify(self, event: dict, headers: Dict[str, str], webhook_id: Optional[str] = None) -> bool:
+        """Ask the stand-in about one delivery, with PayPal's request body (webhook_id defaults to the signer's)"""
+        response = requests.post(f"{self.base_url}/v1/notifications/verify-webhook-signature", json={
+            "auth_algo": headers["paypal-auth-algo"],
+            "cert_url": headers["paypal-cert-url"],
+            "transmission_id": headers["paypal-transmission-id"],
+            "transmission_sig": headers["paypal-transmission-sig"],
+            "transmission_time": headers["paypal-transmission-time"],
+            "webhook_id": webhook_id or self.signer.webhook_id,
+            "webhook_event": event,
+        }, timeout=10)
+        response.raise_for_status()
+        return response.json()["verification_status"] == "SUCCESS"
+
+
+# ==================== Replay ====================
+@dataclass
+class ReplayResult:
+    latencies_ms: List[float] = field(default_factory=list)
+    status_codes: Dict[int, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Deliveries acknowledged per second"""
+        return len(self.latencies_ms) / self.wall_seconds if self.wall_seconds else 0.0
+
+
+class WebhookReplayer:
+    """Posts signed deliveries at a fixed rate (0 = all at once, like a post-outage retry burst)"""
+
+    def __init__(self, url: str, signer: Optional[WebhookSigner] = None, rate: float = 0,
+                 concurrency: int = 16, timeout: float = 60):
+        self.url = url
+        self.signer = signer or WebhookSigner()
+        self.rate = rate
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _post(self, event: dict, result: ReplayResult, lock: threading.Lock):
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        body = self.signer.body(event)
+        start = time.perf_counter()
+        try:
+            response = self._local.session.post(self.url, data=body, headers=self.signer.headers(body),
+                                                timeout=self.timeout)
+        except requests.RequestException as e:
+            with lock:
+                result.errors.append(f"{event['id']}: {type(e).__name__}: {e}")
+            return
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            result.latencies_ms.append(elapsed)
+            result.status_codes[response.status_code] = result.status_codes.get(response.status_code, 0) + 1
+            if response.status_code != 200:
+                result.errors.append(f"{event['id']}: HTTP {response.status_code}")
+
+    def replay(self, deliveries: List[dict]) -> ReplayResult:
+        """Post every delivery; returns latencies, status codes and wall time"""
+        result, lock = ReplayResult(), threading.Lock()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for index, event in enumerate(deliveries):
+                if self.rate:
+                    delay = start + index / self.rate - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                pool.submit(self._post, event, result, lock)
+        result.wall_seconds = time.perf_counter() - start
+        logger.info(f"Replayed {len(deliveries)} webhook deliveries in {result.wall_seconds:.2f}s "
+                    f"({result.throughput:.1f}/s, {len(result.errors)} errors)")
+        return result
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Replay synthetic PayPal webhooks against the app")
+    parser.add_argument("--url", default="http://localhost:3000/api/webhooks/paypal")
+    parser.add_argument("--orders", required=True, help="orders.jsonl from tests.fixtures.order_generator")
+    parser.add_argument("--rate", type=float, default=0, help="Deliveries per second (0 = burst)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duplicates", type=float, default=0.2, help="Share of events delivered twice")
+    parser.add_argument("--reorder", type=float, default=0.1, help="Share of refunds delivered before the capture")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--load", action="store_true",
+                        help="First write the orders as pending PayPal orders (the emulator when "
+                             "FIRESTORE_EMULATOR_HOST is set)")
+    args = parser.parse_args(argv)
+
+    with open(args.orders) as f:
+        orders = [json.loads(line) for line in f if line.strip()]
+    stream = event_stream(orders, args.seed, args.duplicates, args.reorder)
+    if args.load:
+        from tests.fixtures.order_generator import load_orders
+        from tests.utils.firestore_seeder import FirestoreSeeder
+        pending = [pending_order(order, stream.scenarios[order["id"]], args.seed) for order in orders]
+        print(f"Loaded {load_orders(FirestoreSeeder.create(), pending)} pending PayPal orders")
+    result = WebhookReplayer(args.url, rate=args.rate, concurrency=args.concurrency).replay(stream.deliveries)
+    print(f"{len(stream.deliveries)} deliveries ({stream.duplicates} duplicates, {stream.reordered} out of order) "
+          f"in {result.wall_seconds:.2f}s = {result.throughput:.1f}/s; HTTP {result.status_codes}; "
+          f"{len(result.errors)} errors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Session-wide product discovery over HTTP with an on-disk TTL cache"""
+import json
+import logging
+import os
+import time
+from typing import List, Optional
+
+from tests.utils.api_client import APIClient
+from tests.utils.file_lock import FileLock
+
+
+logger = logging.getLogger(__name__)
+
+# Known product IDs tried when the listing API returns nothing usable
+FALLBACK_PRODUCT_IDS = ["KRmdS9LCeZvURKx6NbvI", "1"]
+
+
+class ProductCatalog:
+    """Discovers valid product IDs once and shares them across tests and xdist workers
+
+    The first process to need the catalog queries /api/products, validates
+    the IDs against /api/products/<id> and writes them to cache_path; other
+    workers wait on the lock and read the file. Entries expire after ttl
+    seconds or when base_url changes.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_base_url: str,
+        cache_path: str,
+        ttl: int = 3600,
+        timeout: int = 10,
+        max_products: int = 5
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_base_url = api_base_url.rstrip("/")
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_products = max_products
+        self._product_ids: Optional[List[str]] = None
+
+    # ==================== Public API ====================
+    def product_ids(self) -> List[str]:
+        """Valid product IDs (discovered at most once per TTL across all workers)"""
+        if self._product_ids is None:
+            cached = self._read_cache()
+            if cached is None:
+                with FileLock(f"{self.cache_path}.lock"):
+                    # Another worker may have written it while we waited
+                    cached = self._read_cache()
+                    if cached is None:
+                        cached = self._discover()
+                        if cached:
+                            self._write_cache(cached)
+            self._product_ids = cached
+        return self._product_ids
+
+    def product_url(self, index: int = 0) -> Optional[str]:
+        """Absolute PDP URL for the index-th valid product, or None"""
+        ids = self.product_ids()
+        if not ids:
+            return None
+        return f"{self.base_url}/products/{ids[index % len(ids)]}"
+
+    def invalidate(self):
+        """Drop the cached catalog"""
+        self._product_ids = None
+        try:
+            os.remove(self.cache_path)
+        except FileNotFoundError:
+            pass
+
+    # ==================== Discovery ====================
+    def _discover(self) -> List[str]:
+        """Query the listing API and keep IDs whose detail endpoint responds"""
+        client = APIClient(self.api_base_url, timeout=self.timeout)
+        try:
+            candidates = []
+            try:
+                response = client.get("/products", params={"limit": self.max_products * 2})
+                if response.ok:
+                    candidates = [p["id"] for p in response.json().get("products", []) if p.get("id")]
+            except Exception as e:
+                logger.warning(f"Product listing API unavailable: {e}")
+            candidates += [pid for pid in FALLBACK_PRODUCT_IDS if pid not in candidates]
+
+            valid = []
+            for product_id in candidates:
+                if self._is_valid(client, product_id):
+                    valid.append(product_id)
+                if len(valid) >= self.max_products:
+                    break
+            logger.info(f"Discovered {len(valid)} valid product(s) via {self.api_base_url}/products")
+            return valid
+        finally:
+            client.close()
+
+    @staticmethod
+    def _is_valid(client: APIClient, product_id: str) -> bool:
+        """Product detail endpoint returns the product"""
+        try:
+            response = client.get(f"/products/{product_id}")
+            return response.ok and response.json().get("id") == product_id
+        except Exception:
+            return False
+
+    # ==================== Cache ====================
+    def _read_cache(self) -> Optional[List[str]]:
+        """Cached IDs if fresh and for the same base URL"""
+        try:
+            with open(self.cache_path) as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if data.get("base_url") != self.base_url or time.time() - data.get("created_at", 0) > self.ttl:
+            return None
+        return data.get("product_ids", [])
+
+    def _write_cache(self, product_ids: List[str]):
+        """Atomically persist discovered IDs"""
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"base_url": self.base_url, "created_at": time.time(), "product_ids": product_ids}, f)
+        os.replace(tmp_path, self.cache_path)
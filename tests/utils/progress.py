@@ -0,0 +1,210 @@
+"""Live run progress: per-worker state, ETA from historical durations, stuck tests
+
+    pytest tests/ -n 4 --progress-file tests/reports/run/status.json
+
+The plugin runs where results arrive (the xdist controller, or the only
+process) and rewrites the status file every couple of seconds from a
+background thread, so a hung test still shows up: once a running test
+exceeds the p99 of its past durations it is listed under "stuck" and a
+warning is printed straight away, long before the CI job timeout.
+The history itself is recorded by conftest on every run, with or without
+this plugin.
+
+The ETA is the expected remaining work (historical mean of every test not
+yet finished, minus what running tests have already spent) spread over
+the workers. Tests without history count as the median known test.
+"""
+import json
+import os
+import statistics
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import pytest
+
+from tests.utils.duration_history import DurationHistory
+
+
+DEFAULT_EXPECTED_S = 10.0
+
+
+class ProgressTracker:
+    """pytest plugin maintaining a JSON status file for the current run"""
+
+    def __init__(self, status_path: str, history: DurationHistory, interval: float = 2.0):
+        self.status_path = status_path
+        self.history = history
+        self.interval = interval
+        self.started = time.time()
+        self.state = "collecting"
+        self.pending: List[str] = []
+        self.running: Dict[str, dict] = {}
+        self.outcomes: Dict[str, int] = {}
+        self.workers: Dict[str, dict] = {}
+        self.stuck_reported = set()
+        self.session = None
+        self._expected: Dict[str, float] = {}
+        self._p99: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ==================== Collection ====================
+    def pytest_sessionstart(self, session):
+        self.session = session
+        self._thread = threading.Thread(target=self._loop, name="progress", daemon=True)
+        self._thread.start()
+
+    def pytest_collection_finish(self, session):
+        if session.items:
+            self._collected([item.nodeid for item in session.items])
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_node_collection_finished(self, node, ids):
+        self.workers.setdefault(node.gateway.id, {"completed": 0})
+        # Every worker collects the same IDs
+        if self.state == "collecting":
+            self._collected(ids)
+
+    def _collected(self, nodeids: List[str]):
+        history = self.history.all()
+        with self._lock:
+            self.pending = list(nodeids)
+            for nodeid, durations in history.items():
+                if durations:
+                    self._expected[nodeid] = statistics.fmean(durations)
+                p99 = self.history.percentile(nodeid, 99, durations)
+                if p99 is not None:
+                    self._p99[nodeid] = p99
+            self.state = "running"
+
+    # ==================== Test events ====================
+    def pytest_runtest_logstart(self, nodeid, location):
+        with self._lock:
+            self.running[nodeid] = {"since": time.time(), "worker": None}
+            if nodeid in self.pending:
+                self.pending.remove(nodeid)
+
+    def pytest_runtest_logreport(self, report):
+        worker = getattr(getattr(getattr(report, "node", None), "gateway", None), "id", "main")
+        with self._lock:
+            entry = self.running.setdefault(report.nodeid, {"since": time.time() - report.duration})
+            entry["worker"] = worker
+            entry["duration"] = entry.get("duration", 0.0) + report.duration
+            if report.failed:
+                entry["outcome"] = "failed"
+            elif report.skipped and entry.get("outcome") != "failed":
+                entry["outcome"] = "skipped"
+            if report.when != "teardown":
+                return
+            del self.running[report.nodeid]
+            outcome = entry.get("outcome", "passed")
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+            self.workers.setdefault(worker, {"completed": 0})["completed"] += 1
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(self.interval + 1)
+        self.state = "finished"
+        self.write()
+
+    # ==================== Status ====================
+    def expected(self, nodeid: str) -> float:
+        if nodeid in self._expected:
+            return self._expected[nodeid]
+        known = list(self._expected.values())
+        return statistics.median(known) if known else DEFAULT_EXPECTED_S
+
+    def _queued_per_worker(self) -> Dict[str, int]:
+        """Items xdist has already handed to each worker but not started (LoadScheduling only)"""
+        scheduler = getattr(self.session and self.session.config.pluginmanager.getplugin("dsession"), "sched", None)
+        node2pending = getattr(scheduler, "node2pending", None) or {}
+        queued = {}
+        for node, pending in node2pending.items():
+            worker = node.gateway.id
+            queued[worker] = max(0, len(pending) - sum(1 for r in self.running.values() if r["worker"] == worker))
+        return queued
+
+    def status(self) -> dict:
+        now = time.time()
+        with self._lock:
+            running = []
+            for nodeid, entry in self.running.items():
+                elapsed = now - entry["since"]
+                p99 = self._p99.get(nodeid)
+                running.append({
+                    "nodeid": nodeid,
+                    "worker": entry["worker"],
+                    "elapsed_s": round(elapsed, 1),
+                    "expected_s": round(self.expected(nodeid), 1),
+                    "p99_s": round(p99, 1) if p99 is not None else None,
+                    "stuck": p99 is not None and elapsed > p99,
+                })
+            remaining = sum(self.expected(nodeid) for nodeid in self.pending)
+            remaining += sum(max(0.0, r["expected_s"] - r["elapsed_s"]) for r in running)
+            workers = {name: dict(info, running=None, queued=None) for name, info in self.workers.items()}
+            for worker, queued in self._queued_per_worker().items():
+                workers.setdefault(worker, {"completed": 0, "running": None})["queued"] = queued
+            for r in running:
+                workers.setdefault(r["worker"] or "?", {"completed": 0, "queued": None})["running"] = r["nodeid"]
+            completed = sum(self.outcomes.values())
+            total = completed + len(self.running) + len(self.pending)
+        eta_s = remaining / max(1, len(self.workers)) if self.state == "running" else 0.0
+        return {
+            "state": self.state,
+            "updated": datetime.now().isoformat(timespec="seconds"),
+            "elapsed_s": round(now - self.started, 1),
+            "total": total,
+            "completed": completed,
+            "outcomes": dict(self.outcomes),
+            "running": sorted(running, key=lambda r: -r["elapsed_s"]),
+            "queued": len(self.pending),
+            "workers": workers,
+            "slowest": max(running, key=lambda r: r["elapsed_s"], default=None),
+            "stuck": [r["nodeid"] for r in running if r["stuck"]],
+            "eta_s": round(eta_s),
+            "eta": (datetime.now() + timedelta(seconds=eta_s)).isoformat(timespec="seconds"),
+        }
+
+    def write(self) -> dict:
+        """Atomically rewrite the status file"""
+        status = self.status()
+        os.makedirs(os.path.dirname(self.status_path) or ".", exist_ok=True)
+        tmp_path = f"{self.status_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(status, f, indent=2)
+        os.replace(tmp_path, self.status_path)
+        return status
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            status = self.write()
+            for r in status["running"]:
+                if r["stuck"] and r["nodeid"] not in self.stuck_reported:
+                    self.stuck_reported.add(r["nodeid"])
+                    message = (f"STUCK {r['nodeid']} on {r['worker'] or '?'}: running {r['elapsed_s']:.1f}s, "
+                               f"p99 {r['p99_s']:.1f}s")
+                    terminal = self.session.config.pluginmanager.get_plugin("terminalreporter")
+                    if terminal:
+                        terminal.write_line(message, red=True, bold=True)
+                    else:
+                        print(message, flush=True)
+
+
+def format_status(status: dict) -> str:
+    """One-line summary of a status dict, e.g. for a runner polling the status file"""
+    outcomes = status.get("outcomes", {})
+    line = f"{status['completed']}/{status['total']} done"
+    if outcomes.get("failed"):
+        line += f" ({outcomes['failed']} failed)"
+    line += f" | running {len(status['running'])} | queued {status['queued']}"
+    slowest = status.get("slowest")
+    if slowest:
+        line += f" | slowest {slowest['worker'] or '?'} {slowest['nodeid'].split('::')[-1]} {slowest['elapsed_s']:.0f}s"
+    line += f" | ETA {timedelta(seconds=int(status['eta_s']))}"
+    if status.get("stuck"):
+        line += f" | STUCK: {len(status['stuck'])}"
+    return line
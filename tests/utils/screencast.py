@@ -0,0 +1,153 @@
+"""Last-N-seconds screencast kept in memory and written out only when a test fails
+
+CDP Page.startScreencast pushes JPEG frames as events, which execute_cdp_cmd
+cannot receive, so a background thread holds a DevTools websocket (Selenium's
+trio-based bidi_connection), acknowledges every frame and keeps the newest
+ones in a bounded deque. Nothing touches the disk until save().
+"""
+import base64
+import io
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class ScreencastRecorder:
+    """Ring buffer of recent screencast frames for one driver
+
+        recorder = ScreencastRecorder.attach(driver, seconds=10)
+        ...
+        recorder.save("tests/reports/screencasts/failure_test_x")   # .gif, or JPEG frames
+        recorder.stop()
+    """
+
+    _ATTRIBUTE = "_screencast_recorder"
+
+    def __init__(self, driver, seconds: float = 10, fps: float = 4, max_width: int = 800,
+                 max_height: int = 600, quality: int = 50):
+        self.driver = driver
+        self.seconds = seconds
+        self.fps = fps
+        self.max_width = max_width
+        self.max_height = max_height
+        self.quality = quality
+        # Hard cap in case the clock-based trimming falls behind
+        self._frames: Deque[Tuple[float, bytes]] = deque(maxlen=max(1, int(seconds * fps * 2)))
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_requested = threading.Event()
+        self._started = threading.Event()
+        self.error: Optional[str] = None
+
+    # ==================== Lifecycle ====================
+    @classmethod
+    def attach(cls, driver, **kwargs) -> "ScreencastRecorder":
+        """Start recording driver (idempotent) and return its recorder"""
+        existing = cls.get(driver)
+        if existing:
+            return existing
+        recorder = cls(driver, **kwargs)
+        setattr(driver, cls._ATTRIBUTE, recorder)
+        recorder.start()
+        return recorder
+
+    @classmethod
+    def get(cls, driver) -> Optional["ScreencastRecorder"]:
+        """Return the recorder attached to driver, if any"""
+        return getattr(driver, cls._ATTRIBUTE, None)
+
+    def start(self, timeout: float = 10) -> bool:
+        """Start the background screencast; False if it could not be started"""
+        self._thread = threading.Thread(target=self._run, name="screencast", daemon=True)
+        self._thread.start()
+        self._started.wait(timeout)
+        return self.error is None and self._started.is_set()
+
+    def stop(self, timeout: float = 5):
+        """Stop recording; buffered frames stay available for save()"""
+        self._stop_requested.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        try:
+            import trio
+            trio.run(self._record)
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            logger.warning(f"Screencast stopped: {self.error}")
+        finally:
+            self._started.set()
+
+    async def _record(self):
+        import trio
+
+        async with self.driver.bidi_connection() as connection:
+            session, devtools = connection.session, connection.devtools
+            frames = session.listen(devtools.page.ScreencastFrame, buffer_size=64)
+            await session.execute(devtools.page.start_screencast(
+                format_="jpeg", quality=self.quality, max_width=self.max_width, max_height=self.max_height
+            ))
+            self._started.set()
+            min_interval = 1 / self.fps
+            last_kept = 0.0
+            while not self._stop_requested.is_set():
+                frame = None
+                # Wake up regularly to notice stop()
+                with trio.move_on_after(0.25):
+                    frame = await frames.receive()
+                if frame is None:
+                    continue
+                # Chrome sends no further frames until the previous one is acknowledged
+                await session.execute(devtools.page.screencast_frame_ack(frame.session_id))
+                now = time.monotonic()
+                if now - last_kept >= min_interval:
+                    last_kept = now
+                    self._keep(now, base64.b64decode(frame.data))
+            await session.execute(devtools.page.stop_screencast())
+
+    def _keep(self, timestamp: float, jpeg: bytes):
+        with self._lock:
+            self._frames.append((timestamp, jpeg))
+            while self._frames and self._frames[0][0] < timestamp - self.seconds:
+                self._frames.popleft()
+
+    # ==================== Output ====================
+    def frames(self) -> List[Tuple[float, bytes]]:
+        """(monotonic timestamp, JPEG bytes) of the buffered frames, oldest first"""
+        with self._lock:
+            return list(self._frames)
+
+    def save(self, path_without_extension: str) -> Optional[str]:
+        """Encode the buffer as an animated GIF (Pillow) or a folder of JPEG frames; returns the path"""
+        frames = self.frames()
+        if not frames:
+            return None
+        os.makedirs(os.path.dirname(path_without_extension) or ".", exist_ok=True)
+        if Image is not None:
+            path = f"{path_without_extension}.gif"
+            images = [Image.open(io.BytesIO(jpeg)).convert("P", palette=Image.ADAPTIVE) for _, jpeg in frames]
+            # Real gaps between frames (the screencast only sends frames when something changes)
+            durations = [max(20, int((b[0] - a[0]) * 1000)) for a, b in zip(frames, frames[1:])] + [1000]
+            images[0].save(path, save_all=True, append_images=images[1:], duration=durations, loop=0)
+        else:
+            path = path_without_extension
+            os.makedirs(path, exist_ok=True)
+            start = frames[0][0]
+            for index, (timestamp, jpeg) in enumerate(frames):
+                with open(os.path.join(path, f"{index:04d}_{timestamp - start:07.2f}s.jpg"), "wb") as f:
+                    f.write(jpeg)
+        logger.info(f"Saved {len(frames)} screencast frames to {path}")
+        return path
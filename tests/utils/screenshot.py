@@ -1,7 +1,21 @@
 """Screenshot management"""
-import os
-from datetime import datetime
-from typing import Optional
+import base64
+import io
+import math
+from typing import Dict, Optional
+
+from tests.utils.element_extractor import ElementExtractor
+from tests.utils.screenshot_store import ScreenshotStore
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+# Read with the element boxes so a batch crop needs a single script call
+_PAGE_FIELDS = ["window:innerWidth", "window:scrollX", "window:scrollY", "window:devicePixelRatio",
+                "prop:scrollWidth", "prop:scrollHeight"]
 
 
 class ScreenshotManager:
@@ -13,14 +27,9 @@ class ScreenshotManager:
         screenshots_dir: str,
         name: str = "screenshot"
     ) -> Optional[str]:
-        """Take screenshot and return file path"""
+        """Take screenshot into the deduplicating store and return its file path"""
         try:
-            os.makedirs(screenshots_dir, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}.png"
-            filepath = os.path.join(screenshots_dir, filename)
-            driver.save_screenshot(filepath)
-            return filepath
+            return ScreenshotStore(screenshots_dir).put(driver.get_screenshot_as_png(), name)
         except Exception as e:
             print(f"Failed to take screenshot: {e}")
             return None
@@ -60,12 +69,99 @@ class ScreenshotManager:
     ) -> Optional[str]:
         """Take screenshot of specific element"""
         try:
-            os.makedirs(screenshots_dir, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}.png"
-            filepath = os.path.join(screenshots_dir, filename)
-            element.screenshot(filepath)
-            return filepath
+            return ScreenshotStore(screenshots_dir).put(element.screenshot_as_png, name)
         except Exception as e:
             print(f"Failed to take element screenshot: {e}")
             return None
+    
+    # ==================== Batch element crops ====================
+    @staticmethod
+    def capture_element_images(
+        driver,
+        locators: Dict[str, tuple],
+        full_page: bool = False,
+        padding: int = 0
+    ) -> Dict[str, Optional["Image.Image"]]:
+        """Crop the first match of every locator out of one screenshot
+        
+        Boxes for all locators come from one ElementExtractor call and the
+        crops are cut in memory, so ten elements cost one capture instead of
+        ten element renders. A viewport capture only holds elements on
+        screen; full_page captures the whole document (Chromium, Firefox).
+        Missing, hidden or off-capture elements map to None.
+        """
+        if Image is None:
+            raise RuntimeError("Element crops need Pillow (pip install -r tests/requirements.txt)")
+        queries = {f"element:{name}": (locator, ["rect", "visible"], 1) for name, locator in locators.items()}
+        queries["page"] = (("tag name", "html"), _PAGE_FIELDS, 1)
+        data = ElementExtractor.extract_many(driver, queries)
+        page = data["page"][0]
+        
+        png = ScreenshotManager._full_page_png(driver, page) if full_page else None
+        if png:
+            css_width = page["prop:scrollWidth"]
+            offset_x, offset_y = page["window:scrollX"], page["window:scrollY"]
+        else:
+            png = driver.get_screenshot_as_png()
+            css_width, offset_x, offset_y = page["window:innerWidth"], 0, 0
+        image = Image.open(io.BytesIO(png))
+        image.load()
+        # Measured rather than trusting devicePixelRatio (zoom, scrollbars)
+        scale = image.width / css_width if css_width else page["window:devicePixelRatio"] or 1
+        
+        crops = {}
+        for name in locators:
+            rows = data[f"element:{name}"]
+            rect = rows[0]["rect"] if rows and rows[0]["visible"] else None
+            crops[name] = None
+            if rect is None:
+                continue
+            box = (
+                max(0, math.floor((rect["x"] + offset_x - padding) * scale)),
+                max(0, math.floor((rect["y"] + offset_y - padding) * scale)),
+                min(image.width, math.ceil((rect["x"] + offset_x + rect["width"] + padding) * scale)),
+                min(image.height, math.ceil((rect["y"] + offset_y + rect["height"] + padding) * scale)),
+            )
+            if box[2] > box[0] and box[3] > box[1]:
+                crops[name] = image.crop(box)
+        return crops
+    
+    @staticmethod
+    def take_element_screenshots(
+        driver,
+        locators: Dict[str, tuple],
+        screenshots_dir: str,
+        full_page: bool = False,
+        padding: int = 0
+    ) -> Dict[str, Optional[str]]:
+        """Batch take_element_screenshot: one capture, one stored PNG per element"""
+        try:
+            images = ScreenshotManager.capture_element_images(driver, locators, full_page, padding)
+        except Exception as e:
+            print(f"Failed to take element screenshots: {e}")
+            return {name: None for name in locators}
+        store = ScreenshotStore(screenshots_dir)
+        paths = {}
+        for name, image in images.items():
+            if image is None:
+                paths[name] = None
+                continue
+            buffer = io.BytesIO()
+            image.save(buffer, "PNG")
+            paths[name] = store.put(buffer.getvalue(), name)
+        return paths
+    
+    @staticmethod
+    def _full_page_png(driver, page: dict) -> Optional[bytes]:
+        """Whole-document PNG, or None when the browser cannot capture beyond the viewport"""
+        if hasattr(driver, "execute_cdp_cmd"):
+            result = driver.execute_cdp_cmd("Page.captureScreenshot", {
+                "format": "png",
+                "captureBeyondViewport": True,
+                "clip": {"x": 0, "y": 0, "width": page["prop:scrollWidth"],
+                         "height": page["prop:scrollHeight"], "scale": 1},
+            })
+            return base64.b64decode(result["data"])
+        if hasattr(driver, "get_full_page_screenshot_as_png"):
+            return driver.get_full_page_screenshot_as_png()
+        return None
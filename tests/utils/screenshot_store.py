@@ -0,0 +1,230 @@
+"""Content-addressed screenshot storage shared by xdist workers
+
+Each capture is stored once under blobs/<2 hex>/<sha256 of the PNG>.png and
+described by a line in manifest.jsonl (time, test, name, blob), so repeated
+identical frames cost one manifest line instead of another file, and parallel
+workers cannot overwrite each other's captures. New blobs are re-encoded as
+optimized PNG on a background thread (same pixels, same path); `compact`
+can convert them to lossless WebP and trims the store to a size cap.
+
+    python -m tests.utils.screenshot_store stats
+    python -m tests.utils.screenshot_store compact --max-mb 200 --webp
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from tests.utils.file_lock import FileLock
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+logger = logging.getLogger(__name__)
+
+BLOB_EXTENSIONS = (".png", ".webp")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _background() -> ThreadPoolExecutor:
+    """Single encoder thread per process; pending work finishes at interpreter exit"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot-store")
+        return _executor
+
+
+def _reencode(path: str, target: str, **save_options) -> int:
+    """Re-encode path as target (losslessly) when that is smaller; returns bytes saved"""
+    tmp_path = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with Image.open(path) as image:
+            image.load()
+            image.save(tmp_path, **save_options)
+        saved = os.path.getsize(path) - os.path.getsize(tmp_path)
+        if saved <= 0:
+            os.remove(tmp_path)
+            return 0
+        os.replace(tmp_path, target)
+        if target != path:
+            os.remove(path)
+        return saved
+    except OSError as e:
+        # Compaction may have removed the blob in the meantime
+        logger.debug(f"Could not re-encode {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return 0
+
+
+def current_test() -> str:
+    """Node ID of the running pytest test, if any"""
+    return os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0]
+
+
+class ScreenshotStore:
+    """Deduplicating screenshot store rooted at a directory (tests/reports/screenshots)"""
+
+    def __init__(self, root: str, optimize: bool = True):
+        self.root = root
+        self.optimize = optimize and Image is not None
+        self.manifest_path = os.path.join(root, "manifest.jsonl")
+        self._lock = FileLock(f"{self.manifest_path}.lock", timeout=30)
+
+    # ==================== Writing ====================
+    def put(self, png: bytes, name: str, test: Optional[str] = None) -> str:
+        """Store PNG bytes (once per distinct content) and record the capture; returns the blob path"""
+        digest = hashlib.sha256(png).hexdigest()
+        path = self.blob_path(digest)
+        if path is None:
+            path = os.path.join(self.root, "blobs", digest[:2], f"{digest}.png")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(png)
+            os.replace(tmp_path, path)
+            if self.optimize:
+                _background().submit(_reencode, path, path, format="PNG", optimize=True)
+        self._append({
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "test": test if test is not None else current_test(),
+            "name": name,
+            "blob": digest,
+            "bytes": len(png),
+        })
+        return path
+
+    def _append(self, entry: dict):
+        with self._lock:
+            with open(self.manifest_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+
+    # ==================== Reading ====================
+    def blob_path(self, digest: str) -> Optional[str]:
+        """Current file for a blob (PNG, or WebP after compaction), or None"""
+        stem = os.path.join(self.root, "blobs", digest[:2], digest)
+        for extension in BLOB_EXTENSIONS:
+            if os.path.exists(stem + extension):
+                return stem + extension
+        return None
+
+    def entries(self) -> List[dict]:
+        """Manifest entries, oldest first"""
+        try:
+            with open(self.manifest_path) as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def _blob_sizes(self) -> Dict[str, int]:
+        sizes = {}
+        blobs_dir = os.path.join(self.root, "blobs")
+        for directory, _, files in os.walk(blobs_dir):
+            for name in files:
+                stem, extension = os.path.splitext(name)
+                if extension in BLOB_EXTENSIONS:
+                    sizes[stem] = sizes.get(stem, 0) + os.path.getsize(os.path.join(directory, name))
+        return sizes
+
+    def stats(self) -> dict:
+        entries, sizes = self.entries(), self._blob_sizes()
+        captured = sum(entry["bytes"] for entry in entries)
+        stored = sum(sizes.values())
+        return {
+            "captures": len(entries),
+            "blobs": len(sizes),
+            "captured_mb": round(captured / 1024 / 1024, 1),
+            "stored_mb": round(stored / 1024 / 1024, 1),
+            "ratio": round(captured / stored, 2) if stored else None,
+        }
+
+    # ==================== Compaction ====================
+    def compact(self, max_mb: float, webp: bool = False) -> dict:
+        """Drop the oldest captures until the referenced blobs fit in max_mb
+
+        Also removes blobs no manifest entry refers to and, with webp,
+        converts PNG blobs to lossless WebP where that is smaller.
+        """
+        with self._lock:
+            converted_bytes = 0
+            if webp and Image is not None:
+                for digest in self._blob_sizes():
+                    path = self.blob_path(digest)
+                    if path and path.endswith(".png"):
+                        converted_bytes += _reencode(path, path[:-4] + ".webp", format="WEBP",
+                                                     lossless=True, quality=100, method=4)
+            sizes = self._blob_sizes()
+            all_entries = self.entries()
+            entries = [entry for entry in all_entries if entry["blob"] in sizes]
+            kept, kept_blobs, kept_bytes, full = [], set(), 0, False
+            for entry in reversed(entries):
+                blob = entry["blob"]
+                if blob not in kept_blobs:
+                    full = full or kept_bytes + sizes[blob] > max_mb * 1024 * 1024
+                    if full:
+                        continue
+                    kept_blobs.add(blob)
+                    kept_bytes += sizes[blob]
+                kept.append(entry)
+            kept.reverse()
+
+            tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                f.writelines(json.dumps(entry) + "\n" for entry in kept)
+            os.replace(tmp_path, self.manifest_path)
+            referenced = {entry["blob"] for entry in entries}
+            removed_bytes, removed_blobs = 0, 0
+            for digest, size in sizes.items():
+                path = self.blob_path(digest)
+                # An unreferenced blob may belong to a put() that has not appended its entry yet
+                if digest in kept_blobs or (digest not in referenced and time.time() - os.path.getmtime(path) < 60):
+                    continue
+                os.remove(path)
+                removed_bytes += size
+                removed_blobs += 1
+        result = {
+            "removed_captures": len(all_entries) - len(kept),
+            "removed_blobs": removed_blobs,
+            "freed_mb": round((removed_bytes + converted_bytes) / 1024 / 1024, 1),
+            "kept_mb": round(kept_bytes / 1024 / 1024, 1),
+        }
+        logger.info(f"Screenshot store compacted: {result}")
+        return result
+
+
+def main(argv: Optional[List[str]] = None):
+    from tests.config import CONFIG
+
+    parser = argparse.ArgumentParser(description="Inspect or compact the screenshot store")
+    parser.add_argument("command", choices=["stats", "list", "compact"])
+    parser.add_argument("--dir", default=CONFIG.screenshots_dir)
+    parser.add_argument("--max-mb", type=float, default=CONFIG.screenshot_retention_mb)
+    parser.add_argument("--webp", action="store_true", help="Convert PNG blobs to lossless WebP")
+    parser.add_argument("--test", default="", help="list: only captures whose test contains this")
+    args = parser.parse_args(argv)
+
+    store = ScreenshotStore(args.dir)
+    if args.command == "stats":
+        print(json.dumps(store.stats(), indent=2))
+    elif args.command == "list":
+        for entry in store.entries():
+            if args.test in entry["test"]:
+                print(f"{entry['time']}  {entry['test'] or '-'}  {entry['name']}  {store.blob_path(entry['blob'])}")
+    else:
+        print(json.dumps(store.compact(args.max_mb, args.webp), indent=2))
+
+
+if __name__ == "__main__":
+    main()
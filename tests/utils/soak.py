@@ -0,0 +1,254 @@
+"""Soak runs: hours of repeated journeys in long-lived browsers with drift and leak tracking
+
+Two browsers stay open for the whole run:
+
+* the app browser signs in, loads /products once and then only navigates
+  client-side (open a product, add it to or remove it from the cart, go
+  back), so React state, the cart context and event listeners accumulate
+  exactly as in a long customer session. Its JS heap (after a forced GC), DOM node and listener counts
+  are sampled every iteration.
+* the page-load browser repeats the smoke journey with full loads and
+  records TTFB/LCP, so server-side slowdowns show up separately.
+
+Server response times come from direct API calls. Every metric is fitted
+against elapsed time (latencies) or iteration (memory); a metric fails when
+it grows steadily (positive slope with a good fit) and its last quarter is
+clearly above its first quarter. Failed iterations carry no samples, so the
+run also fails on too many errors or a metric with too few samples to fit.
+"""
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import requests
+
+from tests.pages.login_page import LoginPage
+from tests.pages.product_details_page import ProductDetailsPage
+from tests.pages.products_page import ProductsPage
+from tests.utils.browser_helper import BrowserHelper
+from tests.utils.browser_memory import BrowserMemory
+from tests.utils.page_metrics import PageMetrics
+from tests.utils.stats import linear_fit, percentile
+
+
+logger = logging.getLogger(__name__)
+
+LATENCY_METRICS = ("spa_pdp_ms", "spa_back_ms", "add_to_cart_ms", "page_ttfb_ms", "page_lcp_ms", "api_products_ms")
+MEMORY_METRICS = ("js_heap_used_mb", "dom_nodes", "listeners", "rss_mb")
+# A trend only counts when the linear fit explains this much of the variance
+MIN_TREND_R_SQUARED = 0.5
+# Samples a metric needs before it is fitted
+MIN_TREND_SAMPLES = 8
+
+
+@dataclass
+class Drift:
+    """Linear trend of one metric over a soak run"""
+
+    metric: str
+    slope: float            # per hour for latencies, per iteration for memory
+    r_squared: float
+    first_quarter: float    # median of the first quarter of samples
+    last_quarter: float
+    growth: float           # last_quarter / first_quarter - 1
+    sustained: bool = False
+
+
+def drift(metric: str, xs: List[float], ys: List[float], max_growth: float) -> Optional[Drift]:
+    """Fit ys against xs; sustained when rising with a good fit and by more than max_growth"""
+    if len(ys) < MIN_TREND_SAMPLES:
+        return None
+    slope, _, r_squared = linear_fit(xs, ys)
+    quarter = len(ys) // 4
+    first, last = percentile(ys[:quarter], 50), percentile(ys[-quarter:], 50)
+    growth = last / first - 1 if first else 0.0
+    return Drift(metric, slope, r_squared, first, last, growth,
+                 sustained=slope > 0 and r_squared >= MIN_TREND_R_SQUARED and growth > max_growth)
+
+
+class SoakRunner:
+    """Runs soak iterations until the deadline, streaming samples to a JSONL file"""
+
+    def __init__(self, config, hours: float, sample_every_s: float = 0, report_dir: Optional[str] = None,
+                 account: Optional[dict] = None):
+        self.config = config
+        self.account = account or {"email": config.test_email, "password": config.test_password}
+        self.hours = hours
+        self.sample_every_s = sample_every_s
+        self.report_dir = report_dir or config.benchmark_dir
+        self.rows: List[dict] = []
+        self._session = requests.Session()
+
+    # ==================== Iterations ====================
+    def _timed(self, func) -> float:
+        start = time.perf_counter()
+        func()
+        return (time.perf_counter() - start) * 1000
+
+    def _spa_cycle(self, listing: ProductsPage, pdp: ProductDetailsPage, index: int) -> Dict[str, float]:
+        """Listing -> product -> toggle the cart -> back, without reloading the page
+
+        The cart toggle adds products and removes them again once they are in
+        the cart, so the cart stays bounded however long the run is.
+        """
+        cards = listing.get_product_count() or 1
+        row = {"spa_pdp_ms": self._timed(lambda: (listing.open_product(index % cards), pdp.snapshot()))}
+        toggled = []
+        row["add_to_cart_ms"] = self._timed(lambda: toggled.append(pdp.toggle_cart()))
+        if not toggled[0]:
+            raise RuntimeError("Cart toggle did not change the cart")
+        row["spa_back_ms"] = self._timed(lambda: (listing.go_back(), listing.wait_for_products()))
+        return row
+
+    def _smoke_load(self, driver) -> Dict[str, Optional[float]]:
+        listing = ProductsPage(driver, self.config.base_url)
+        listing.navigate_to_products()
+        listing.wait_for_products()
+        metrics = PageMetrics.collect(driver)
+        return {"page_ttfb_ms": metrics.get("ttfb_ms"), "page_lcp_ms": metrics.get("lcp_ms")}
+
+    def _api_call(self) -> float:
+        def fetch():
+            self._session.get(f"{self.config.api_base_url}/products", params={"limit": 20}, timeout=60).raise_for_status()
+        return self._timed(fetch)
+
+    def _sign_in(self, driver):
+        """Sign the app browser in; guests only get a "Login Required" toast from the cart button"""
+        if not LoginPage(driver, self.config.base_url).log_in(self.account["email"], self.account["password"]):
+            raise RuntimeError(f"Could not sign in as {self.account['email']}")
+
+    def _ensure_responsive(self, driver):
+        """Return (driver, False) if it still answers, else a fresh browser and True"""
+        try:
+            driver.current_url
+            return driver, False
+        except Exception:
+            logger.warning("Soak browser stopped responding; starting a new one")
+        BrowserHelper.close_driver(driver)
+        fresh = BrowserHelper.get_driver(self.config.browser.value, headless=True)
+        if fresh is None:
+            raise RuntimeError("Could not restart a browser for the soak run")
+        return fresh, True
+
+    # ==================== Run ====================
+    def run(self) -> str:
+        """Loop until the deadline; returns the path of the JSONL sample log"""
+        os.makedirs(self.report_dir, exist_ok=True)
+        path = os.path.join(self.report_dir, f"soak_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+        browser = self.config.browser.value
+        app_driver = BrowserHelper.get_driver(browser, headless=True)
+        load_driver = BrowserHelper.get_driver(browser, headless=True)
+        if app_driver is None or load_driver is None:
+            raise RuntimeError("Could not start browsers for the soak run")
+
+        listing = ProductsPage(app_driver, self.config.base_url)
+        pdp = ProductDetailsPage(app_driver, self.config.base_url)
+        iteration = 0
+        signed_in = False
+        try:
+            self._sign_in(app_driver)
+            signed_in = True
+            listing.navigate_to_products()
+            listing.wait_for_products()
+            started = time.time()
+            deadline = started + self.hours * 3600
+            logger.info(f"Soak run for {self.hours}h as {self.account['email']}, samples in {path}")
+            with open(path, "w") as log:
+                while time.time() < deadline:
+                    iteration_start = time.time()
+                    row: Dict[str, Optional[float]] = {"iteration": iteration, "elapsed_h": (time.time() - started) / 3600}
+                    try:
+                        row.update(self._spa_cycle(listing, pdp, iteration))
+                        row.update(self._smoke_load(load_driver))
+                        row["api_products_ms"] = self._api_call()
+                        row.update(BrowserMemory.sample(app_driver, collect_garbage=True))
+                        row["rss_mb"] = BrowserMemory.rss_mb(app_driver)
+                    except Exception as e:
+                        row["error"] = f"{type(e).__name__}: {e}"[:300]
+                        logger.warning(f"Soak iteration {iteration} failed: {row['error']}")
+                        # Replace crashed browsers and start the client-side loop over from a fresh listing
+                        try:
+                            app_driver, app_restarted = self._ensure_responsive(app_driver)
+                            load_driver, load_restarted = self._ensure_responsive(load_driver)
+                            restarted = [name for name, flag in (("app", app_restarted), ("load", load_restarted)) if flag]
+                            if restarted:
+                                row["restarted"] = restarted
+                            # A new app browser (or one whose sign-in failed last time) has no session
+                            signed_in = signed_in and not app_restarted
+                            if not signed_in:
+                                self._sign_in(app_driver)
+                                signed_in = True
+                            listing = ProductsPage(app_driver, self.config.base_url)
+                            pdp = ProductDetailsPage(app_driver, self.config.base_url)
+                            listing.navigate_to_products()
+                            listing.wait_for_products()
+                        except Exception as recovery_error:
+                            row["recovery_error"] = f"{type(recovery_error).__name__}: {recovery_error}"[:300]
+                            logger.warning(f"Soak iteration {iteration} could not recover: {row['recovery_error']}")
+                    self.rows.append(row)
+                    log.write(json.dumps(row) + "\n")
+                    log.flush()
+                    iteration += 1
+                    if self.sample_every_s:
+                        time.sleep(max(0.0, self.sample_every_s - (time.time() - iteration_start)))
+        finally:
+            BrowserHelper.close_driver(app_driver)
+            BrowserHelper.close_driver(load_driver)
+        return path
+
+    # ==================== Analysis ====================
+    def drifts(self, max_latency_growth: float, max_memory_growth: float) -> List[Drift]:
+        """Trend of every latency metric over time and every memory metric over iterations
+
+        Memory is only fitted since the app browser was last restarted, as a
+        new browser starts from a clean heap.
+        """
+        results = []
+        restarts = [i for i, row in enumerate(self.rows) if "app" in row.get("restarted", [])]
+        since_restart = self.rows[restarts[-1] + 1:] if restarts else self.rows
+        for metric in LATENCY_METRICS + MEMORY_METRICS:
+            source = self.rows if metric in LATENCY_METRICS else since_restart
+            rows = [row for row in source if row.get(metric) is not None]
+            if metric in LATENCY_METRICS:
+                result = drift(metric, [row["elapsed_h"] for row in rows], [row[metric] for row in rows],
+                               max_latency_growth)
+            else:
+                result = drift(metric, [row["iteration"] for row in rows], [row[metric] for row in rows],
+                               max_memory_growth)
+            if result:
+                results.append(result)
+        return results
+
+    def error_count(self) -> int:
+        return sum(1 for row in self.rows if "error" in row)
+
+    def error_rate(self) -> float:
+        return self.error_count() / len(self.rows) if self.rows else 1.0
+
+    def unfitted(self, drifts: List[Drift]) -> List[str]:
+        """Metrics without a fit because too few iterations produced them
+
+        A metric missing from every one of enough successful iterations is
+        one this browser or platform does not report (rss_mb off Linux, LCP
+        outside Chromium) and is left out.
+        """
+        fitted = {d.metric for d in drifts}
+        succeeded = [row for row in self.rows if "error" not in row]
+        return [metric for metric in LATENCY_METRICS + MEMORY_METRICS
+                if metric not in fitted
+                and not (len(succeeded) >= MIN_TREND_SAMPLES and all(row.get(metric) is None for row in succeeded))]
+
+    @staticmethod
+    def format_table(drifts: List[Drift]) -> str:
+        header = f"{'metric':<20}{'slope':>12}{'r2':>6}{'first':>10}{'last':>10}{'growth':>9}"
+        lines = [header, "-" * len(header)]
+        for d in drifts:
+            unit = "/h" if d.metric in LATENCY_METRICS else "/it"
+            flag = "  <- sustained growth" if d.sustained else ""
+            lines.append(f"{d.metric:<20}{d.slope:>10.3f}{unit:<2}{d.r_squared:>6.2f}{d.first_quarter:>10.1f}"
+                         f"{d.last_quarter:>10.1f}{d.growth:>8.0%}{flag}")
+        return "\n".join(lines)
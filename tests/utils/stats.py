@@ -0,0 +1,70 @@
+"""Small statistics helpers shared by metrics and reporting utilities"""
+import math
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+
+# Upper bounds (ms) for latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Return the pct-th percentile (0-100) using linear interpolation"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return float(ordered[0])
+    rank = (pct / 100.0) * (len(ordered) - 1)
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return float(ordered[int(rank)])
+    fraction = rank - lower
+    return float(ordered[lower] + (ordered[upper] - ordered[lower]) * fraction)
+
+
+def bucket_label(upper_ms: float, buckets: Sequence[float] = LATENCY_BUCKETS_MS) -> str:
+    """Human readable label for a bucket of buckets; the open-ended one is named after the last bound"""
+    return f"<={upper_ms:g}ms" if upper_ms != math.inf else f">{buckets[-1]:g}ms"
+
+
+def histogram(values: Iterable[float], buckets: Sequence[float] = LATENCY_BUCKETS_MS) -> Dict[str, int]:
+    """Count values into latency buckets, keyed by bucket label"""
+    bounds: List[float] = list(buckets) + [math.inf]
+    labels = {bound: bucket_label(bound, buckets) for bound in bounds}
+    counts = {labels[bound]: 0 for bound in bounds}
+    for value in values:
+        for bound in bounds:
+            if value <= bound:
+                counts[labels[bound]] += 1
+                break
+    return counts
+
+
+def linear_fit(xs: Sequence[float], ys: Sequence[float]) -> Tuple[float, float, float]:
+    """Least-squares fit y = slope * x + intercept; returns (slope, intercept, r_squared)"""
+    n = len(xs)
+    if n < 2:
+        return 0.0, float(ys[0]) if ys else 0.0, 0.0
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    syy = sum((y - mean_y) ** 2 for y in ys)
+    slope = sxy / sxx if sxx else 0.0
+    intercept = mean_y - slope * mean_x
+    r_squared = (sxy * sxy) / (sxx * syy) if sxx and syy else 0.0
+    return slope, intercept, r_squared
+
+
+def power_law_fit(xs: Sequence[float], ys: Sequence[float]) -> Tuple[float, float, float]:
+    """Fit y = coefficient * x ** exponent on log-log axes; returns (exponent, coefficient, r_squared)
+
+    An exponent near 0 means flat, near 1 linear and above 1 super-linear
+    growth. Non-positive points are ignored.
+    """
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len(points) < 2:
+        return 0.0, 0.0, 0.0
+    exponent, intercept, r_squared = linear_fit([p[0] for p in points], [p[1] for p in points])
+    return exponent, math.exp(intercept), r_squared
@@ -0,0 +1,221 @@
+"""Streaming test report: JSON lines while tests run, a small HTML index at the end
+
+    pytest tests/ --stream-report tests/reports/run_20250101_120000
+
+Writes into the directory:
+
+    results.jsonl   one line per finished test, flushed as soon as it finishes
+    details/N.js    longrepr and captured output of test N, loaded by the index on demand
+    summary.json    outcome counts and timings (end of session)
+    index.html      one table row per test; details and images load when a row is opened
+
+Assets (screenshots, traces, screencasts, visual diffs) are not copied or
+inlined: any user property that names an existing file is linked relative to
+the report, so screenshots point into the content-addressed screenshot store.
+Under xdist only the controller writes; worker reports arrive there one at a
+time, so merging their streams needs no per-worker files and no buffering
+beyond the tests currently running.
+"""
+import argparse
+import html
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+
+RESULTS_FILE = "results.jsonl"
+IMAGE_EXTENSIONS = (".png", ".webp", ".gif", ".jpg", ".jpeg")
+
+
+def _assets(user_properties) -> List[dict]:
+    """Existing files named by user properties (top-level strings or string values of dicts)"""
+    assets = []
+    for name, value in user_properties:
+        candidates = [(name, value)] if isinstance(value, str) else []
+        if isinstance(value, dict):
+            candidates = [(f"{name}.{key}", item) for key, item in value.items() if isinstance(item, str)]
+        for label, path in candidates:
+            if os.path.isfile(path):
+                assets.append({"name": label, "path": os.path.abspath(path)})
+    return assets
+
+
+def _worker_id(report) -> Optional[str]:
+    """xdist worker (gw0, gw1, ...) that ran the test, as seen on the controller"""
+    gateway = getattr(getattr(report, "node", None), "gateway", None)
+    return getattr(gateway, "id", None)
+
+
+class StreamReport:
+    """pytest plugin writing results incrementally to a report directory"""
+
+    def __init__(self, directory: str):
+        self.directory = os.path.abspath(directory)
+        self.details_dir = os.path.join(self.directory, "details")
+        os.makedirs(self.details_dir, exist_ok=True)
+        self._results = open(os.path.join(self.directory, RESULTS_FILE), "w")
+        self._running: Dict[str, dict] = {}
+        self._counts: Dict[str, int] = {}
+        self._index = 0
+        self._started = time.time()
+
+    # ==================== Hooks ====================
+    def pytest_runtest_logreport(self, report):
+        row = self._running.setdefault(report.nodeid, {
+            "nodeid": report.nodeid,
+            "outcome": "passed",
+            "duration": 0.0,
+            "start": getattr(report, "start", None),
+            "worker": _worker_id(report),
+            "phases": {},
+        })
+        row["duration"] += report.duration
+        row["phases"][report.when] = report.outcome
+        if report.failed:
+            row["outcome"] = "failed" if report.when == "call" else "error"
+            row["failed_in"] = report.when
+        elif report.skipped and row["outcome"] == "passed":
+            row["outcome"] = "xfailed" if hasattr(report, "wasxfail") else "skipped"
+        details = row.setdefault("_details", {"longrepr": [], "sections": []})
+        if report.longrepr:
+            details["longrepr"].append(f"[{report.when}]\n{report.longreprtext}")
+        details["sections"].extend(report.sections if report.when == "teardown" else [])
+        if report.when == "teardown":
+            row["user_properties"] = report.user_properties
+            self._finish(self._running.pop(report.nodeid))
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self._results.close()
+        with open(os.path.join(self.directory, "summary.json"), "w") as f:
+            json.dump({
+                "started": datetime.fromtimestamp(self._started).isoformat(timespec="seconds"),
+                "duration": round(time.time() - self._started, 1),
+                "exitstatus": int(exitstatus),
+                "counts": self._counts,
+            }, f, indent=2)
+        render_index(self.directory)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_sep("-", f"streamed report: {os.path.join(self.directory, 'index.html')}")
+
+    # ==================== Writing ====================
+    def _finish(self, row: dict):
+        self._index += 1
+        details = row.pop("_details")
+        user_properties = row.pop("user_properties", [])
+        row["index"] = self._index
+        row["duration"] = round(row["duration"], 3)
+        row["assets"] = [
+            dict(asset, path=os.path.relpath(asset["path"], self.directory)) for asset in _assets(user_properties)
+        ]
+        details_path = os.path.join(self.details_dir, f"{self._index}.js")
+        with open(details_path, "w") as f:
+            payload = json.dumps(dict(details, properties=dict(user_properties)), default=str)
+            f.write(f"window.reportDetails({self._index}, {payload});\n")
+        self._counts[row["outcome"]] = self._counts.get(row["outcome"], 0) + 1
+        self._results.write(json.dumps(row, default=str) + "\n")
+        self._results.flush()
+
+
+# ==================== HTML index ====================
+_STYLE = """
+body { font: 13px system-ui, sans-serif; margin: 16px; }
+table { border-collapse: collapse; width: 100%; }
+td, th { padding: 4px 8px; border-bottom: 1px solid #ddd; text-align: left; vertical-align: top; }
+tr.test { cursor: pointer; }
+.passed { color: #16794c; } .failed, .error { color: #b42318; } .skipped, .xfailed { color: #8a6d00; }
+pre { white-space: pre-wrap; background: #f6f6f6; padding: 8px; max-height: 480px; overflow: auto; }
+img { max-width: 640px; border: 1px solid #ccc; display: block; margin: 4px 0; }
+"""
+
+_SCRIPT = """
+function toggle(row) {
+    var detail = document.getElementById('detail-' + row.dataset.index);
+    if (detail.hidden && !detail.dataset.loaded) {
+        detail.dataset.loaded = '1';
+        var script = document.createElement('script');
+        script.src = 'details/' + row.dataset.index + '.js';
+        document.body.appendChild(script);
+        detail.querySelectorAll('img[data-src]').forEach(function (img) { img.src = img.dataset.src; });
+    }
+    detail.hidden = !detail.hidden;
+}
+window.reportDetails = function (index, details) {
+    var cell = document.querySelector('#detail-' + index + ' .output');
+    var text = details.longrepr.join('\\n\\n');
+    details.sections.forEach(function (s) { text += '\\n\\n----- ' + s[0] + ' -----\\n' + s[1]; });
+    if (Object.keys(details.properties).length) { text += '\\n\\n----- properties -----\\n' + JSON.stringify(details.properties, null, 2); }
+    cell.textContent = text || '(no output)';
+};
+function filter(outcome) {
+    document.querySelectorAll('tr.test').forEach(function (row) {
+        var show = !outcome || row.dataset.outcome === outcome;
+        row.hidden = !show;
+        if (!show) { document.getElementById('detail-' + row.dataset.index).hidden = true; }
+    });
+}
+"""
+
+
+def read_results(directory: str) -> Iterator[dict]:
+    """Rows of results.jsonl, one at a time"""
+    with open(os.path.join(directory, RESULTS_FILE)) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def render_index(directory: str) -> str:
+    """Write index.html by streaming results.jsonl (a trailing partial line is ignored)"""
+    try:
+        with open(os.path.join(directory, "summary.json")) as f:
+            summary = json.load(f)
+    except (OSError, ValueError):
+        summary = {"counts": {}}
+    path = os.path.join(directory, "index.html")
+    with open(path, "w") as out:
+        counts = " ".join(
+            f'<a href="#" onclick="filter(\'{outcome}\');return false" class="{outcome}">{count} {outcome}</a>'
+            for outcome, count in sorted(summary.get("counts", {}).items())
+        )
+        out.write(f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Test report</title>"
+                  f"<style>{_STYLE}</style><script>{_SCRIPT}</script></head><body>"
+                  f"<h1>Test report</h1><p>{html.escape(summary.get('started', ''))} "
+                  f"({summary.get('duration', '?')} s) &mdash; {counts} "
+                  f"<a href='#' onclick='filter();return false'>all</a></p>"
+                  f"<table><tr><th>#</th><th>Test</th><th>Outcome</th><th>Duration</th><th>Worker</th></tr>\n")
+        try:
+            for row in read_results(directory):
+                out.write(_render_row(row))
+        except (OSError, ValueError):
+            pass
+        out.write("</table></body></html>\n")
+    return path
+
+
+def _render_row(row: dict) -> str:
+    index, outcome = row["index"], html.escape(row["outcome"])
+    assets = "".join(
+        f'<img data-src="{html.escape(asset["path"])}" alt="{html.escape(asset["name"])}" loading="lazy">'
+        if asset["path"].lower().endswith(IMAGE_EXTENSIONS)
+        else f'<a href="{html.escape(asset["path"])}">{html.escape(asset["name"])}</a> '
+        for asset in row.get("assets", [])
+    )
+    return (f'<tr class="test" data-index="{index}" data-outcome="{outcome}" onclick="toggle(this)">'
+            f'<td>{index}</td><td>{html.escape(row["nodeid"])}</td><td class="{outcome}">{outcome}</td>'
+            f'<td>{row["duration"]:.2f}s</td><td>{html.escape(str(row.get("worker") or ""))}</td></tr>\n'
+            f'<tr id="detail-{index}" hidden><td></td><td colspan="4">{assets}'
+            f'<pre class="output">loading...</pre></td></tr>\n')
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Re-render index.html from a streamed report (e.g. after a crash)")
+    parser.add_argument("directory")
+    args = parser.parse_args(argv)
+    print(render_index(args.directory))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Per-locator wait durations and the timeouts they suggest
+
+BasePage times every element wait and records it here, keyed by page object
+and locator ("ProductDetailsPage: css selector=h1"). Samples are kept in
+memory and merged into tests/reports/cache/wait_durations.json once per
+process at the end of the session, so xdist workers never contend per wait.
+
+With ADAPTIVE_TIMEOUTS=true, a wait without an explicit timeout gets a
+budget: the p99 of the locator's successful waits times a safety factor,
+kept between a floor and the configured timeout. A wait fails when its
+budget runs out and is counted as over budget. After probe_after misses in a
+row, the locator's next wait gets the full configured timeout once: if the
+element shows up, its real duration goes into the history and a locator that
+got slower (say, on a slower CI machine) raises its own p99; if not, the
+element is really missing and the locator goes back to its budget. The
+report lists locators whose configured timeout is far above what they ever
+needed, with how often each ran over budget:
+
+    python -m tests.utils.timeout_advisor --min-ratio 10
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional
+
+from tests.utils.file_lock import FileLock
+from tests.utils.stats import percentile
+
+
+logger = logging.getLogger(__name__)
+
+
+def locator_key(page: str, locator: tuple) -> str:
+    """History key of a locator used by a page object"""
+    by, value = locator
+    return f"{page}: {by}={value}"
+
+
+class TimeoutAdvisor:
+    """Wait-duration history (seconds) per locator and the adaptive timeouts derived from it"""
+
+    def __init__(self, path: str, adaptive: bool = False, factor: float = 3.0, floor: float = 2.0,
+                 window: int = 100, min_samples: int = 10, probe_after: int = 3):
+        self.path = path
+        self.adaptive = adaptive
+        self.factor = factor
+        self.floor = floor
+        self.window = window
+        self.min_samples = min_samples
+        self.probe_after = probe_after
+        self._file_lock = FileLock(f"{path}.lock", timeout=30)
+        self._lock = threading.Lock()
+        self._history: Optional[Dict[str, dict]] = None
+        self._pending: Dict[str, dict] = {}
+        self._misses: Dict[str, int] = {}
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @property
+    def history(self) -> Dict[str, dict]:
+        """Recorded history as of the first use in this process"""
+        if self._history is None:
+            self._history = self._load()
+        return self._history
+
+    # ==================== Timeouts ====================
+    def p99(self, key: str) -> Optional[float]:
+        """p99 of successful waits; None until min_samples are known"""
+        durations = self.history.get(key, {}).get("durations", [])
+        return percentile(durations, 99) if len(durations) >= self.min_samples else None
+
+    def suggest(self, key: str, configured: float) -> float:
+        """p99 x factor, at least floor and at most configured"""
+        p99 = self.p99(key)
+        if p99 is None:
+            return configured
+        return min(configured, max(self.floor, p99 * self.factor))
+
+    def misses(self, key: str) -> int:
+        """Waits in a row that ran out of their budget"""
+        with self._lock:
+            return self._misses.get(key, self.history.get(key, {}).get("misses", 0))
+
+    def timeout(self, key: str, configured: float) -> float:
+        """Budget for a wait: the suggestion in adaptive mode (configured for a probe), else configured"""
+        if not self.adaptive or self.misses(key) >= self.probe_after:
+            return configured
+        return self.suggest(key, configured)
+
+    # ==================== Recording ====================
+    def record(self, key: str, duration: float, configured: float, found: bool, over_budget: bool = False):
+        """Note one wait; only successful waits count towards the p99
+
+        over_budget marks a miss at an adaptive budget below configured.
+        Any other outcome (a find, or a miss at the full timeout) ends the
+        locator's run of misses.
+        """
+        misses = self.misses(key)
+        with self._lock:
+            entry = self._pending.setdefault(key, {"durations": [], "timeout": configured, "timeouts": 0,
+                                                   "over_budget": 0})
+            entry["timeout"] = configured
+            entry["over_budget"] += int(over_budget)
+            if found:
+                entry["durations"].append(round(duration, 3))
+            else:
+                entry["timeouts"] += 1
+            self._misses[key] = entry["misses"] = misses + 1 if over_budget else 0
+
+    def flush(self):
+        """Merge this process's samples into the history file"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        with self._file_lock:
+            history = self._load()
+            for key, entry in pending.items():
+                current = history.setdefault(key, {"durations": [], "timeout": entry["timeout"], "timeouts": 0})
+                current["durations"] = (current["durations"] + entry["durations"])[-self.window:]
+                current["timeout"] = entry["timeout"]
+                current["timeouts"] += entry["timeouts"]
+                current["over_budget"] = current.get("over_budget", 0) + entry["over_budget"]
+                current["misses"] = entry["misses"]
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(history, f)
+            os.replace(tmp_path, self.path)
+
+    # ==================== Report ====================
+    def report(self, min_ratio: float = 10.0) -> List[dict]:
+        """Locators whose configured timeout is at least min_ratio x their p99, most over-provisioned first"""
+        rows = []
+        for key, entry in self._load().items():
+            durations = entry["durations"]
+            if len(durations) < self.min_samples:
+                continue
+            p99 = percentile(durations, 99)
+            ratio = entry["timeout"] / max(p99, 0.001)
+            if ratio >= min_ratio:
+                rows.append({
+                    "locator": key,
+                    "samples": len(durations),
+                    "timeouts": entry["timeouts"],
+                    "over_budget": entry.get("over_budget", 0),
+                    "p50_s": round(percentile(durations, 50), 2),
+                    "p99_s": round(p99, 2),
+                    "configured_s": entry["timeout"],
+                    "suggested_s": round(max(self.floor, p99 * self.factor), 1),
+                    "ratio": round(ratio, 1),
+                })
+        return sorted(rows, key=lambda row: -row["ratio"])
+
+    @staticmethod
+    def format_report(rows: List[dict]) -> str:
+        lines = [f"{'p50':>7}{'p99':>7}{'config':>8}{'suggest':>9}{'ratio':>7}{'n':>6}{'t/o':>5}{'over':>6}  locator",
+                 "-" * 86]
+        for row in rows:
+            lines.append(f"{row['p50_s']:>7.2f}{row['p99_s']:>7.2f}{row['configured_s']:>8.0f}{row['suggested_s']:>9.1f}"
+                         f"{row['ratio']:>6.0f}x{row['samples']:>6}{row['timeouts']:>5}{row['over_budget']:>6}"
+                         f"  {row['locator']}")
+        return "\n".join(lines)
+
+    # ==================== Singleton ====================
+    @classmethod
+    def get_advisor(cls) -> "TimeoutAdvisor":
+        """Process-wide advisor configured from CONFIG"""
+        if not hasattr(cls, "_instance"):
+            from tests.config import CONFIG
+
+            cls._instance = cls(
+                os.path.join(CONFIG.cache_dir, "wait_durations.json"),
+                adaptive=CONFIG.adaptive_timeouts,
+                factor=CONFIG.adaptive_timeout_factor,
+                floor=CONFIG.adaptive_timeout_min_s,
+                probe_after=CONFIG.adaptive_timeout_probe_after
+            )
+        return cls._instance
+
+
+def main(argv: Optional[List[str]] = None):
+    from tests.config import CONFIG
+
+    parser = argparse.ArgumentParser(description="List over-provisioned element wait timeouts")
+    parser.add_argument("--min-ratio", type=float, default=10.0, help="configured timeout / p99 to report")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    advisor = TimeoutAdvisor(
+        os.path.join(CONFIG.cache_dir, "wait_durations.json"),
+        factor=CONFIG.adaptive_timeout_factor,
+        floor=CONFIG.adaptive_timeout_min_s
+    )
+    rows = advisor.report(args.min_ratio)
+    print(json.dumps(rows, indent=2) if args.json else advisor.format_report(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Chrome performance traces kept only for failing or unusually slow tests
+
+ChromeDriver records a trace for the whole session when perfLoggingPrefs
+lists trace categories; the events are only fetched (through the
+"performance" log) when a test turns out to need them, so a passing test
+pays for a low-overhead category set and nothing else. Saved traces are
+gzipped Chrome trace JSON, which the DevTools Performance panel and
+chrome://tracing open directly.
+"""
+import gzip
+import json
+import logging
+import os
+import re
+from datetime import datetime
+from typing import List, Optional
+
+from tests.utils.duration_history import DurationHistory
+
+
+logger = logging.getLogger(__name__)
+
+# Timeline, JS execution, loading and user timing; no screenshots or sampling profiler
+TRACE_CATEGORIES = [
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "disabled-by-default-devtools.timeline.frame",
+    "blink.user_timing",
+    "loading",
+    "v8.execute",
+]
+USER_PROPERTY = "chrome_trace"
+
+
+class TraceCapture:
+    """Enable, fetch and persist ChromeDriver session traces"""
+
+    @staticmethod
+    def enable(options, categories: Optional[List[str]] = None):
+        """Configure ChromeOptions to trace the session (network/page log events off)"""
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {
+            "enableNetwork": False,
+            "enablePage": False,
+            "traceCategories": ",".join(categories or TRACE_CATEGORIES),
+        })
+
+    @staticmethod
+    def collect(driver) -> List[dict]:
+        """Stop the running trace and return its events"""
+        events = []
+        for entry in driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            if message.get("method") == "Tracing.dataCollected":
+                value = message["params"]
+                events.extend(value if isinstance(value, list) else [value])
+        return events
+
+    @staticmethod
+    def save(events: List[dict], path: str) -> str:
+        """Write events as gzipped Chrome trace JSON"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with gzip.open(path, "wt") as f:
+            json.dump({"traceEvents": events}, f, separators=(",", ":"))
+        return path
+
+    @staticmethod
+    def enforce_retention(directory: str, max_mb: float, max_files: int) -> int:
+        """Delete the oldest traces until both caps hold; returns files removed"""
+        if not os.path.isdir(directory):
+            return 0
+        traces = sorted(
+            (os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".json.gz")),
+            key=os.path.getmtime,
+            reverse=True
+        )
+        kept_bytes, removed = 0, 0
+        for index, path in enumerate(traces):
+            kept_bytes += os.path.getsize(path)
+            if index >= max_files or kept_bytes > max_mb * 1024 * 1024:
+                os.remove(path)
+                removed += 1
+        if removed:
+            logger.info(f"Trace retention removed {removed} old trace(s) from {directory}")
+        return removed
+
+
+def finish_trace(node, driver, config, history: Optional[DurationHistory] = None) -> Optional[str]:
+    """Keep the test's trace if it failed or ran slower than its historical p95
+
+    Call before the driver quits. The history holds whole-test durations
+    (recorded by conftest), so setup + call is compared against its p95.
+    Returns the saved trace path, if any.
+    """
+    report = getattr(node, "rep_call", None)
+    if driver is None or report is None or not config.capture_traces:
+        return None
+    history = history or DurationHistory(config.duration_history_path)
+    setup = getattr(node, "rep_setup", None)
+    duration = report.duration + (setup.duration if setup else 0.0)
+    slow = report.passed and history.is_slow(node.nodeid, duration)
+    if not (report.failed or slow):
+        return None
+
+    try:
+        events = TraceCapture.collect(driver)
+    except Exception as e:
+        logger.warning(f"Could not collect trace for {node.nodeid}: {e}")
+        return None
+    reason = "failed" if report.failed else "slow"
+    name = re.sub(r"[^\w.-]+", "_", node.name)
+    path = TraceCapture.save(events, os.path.join(
+        config.traces_dir, f"{reason}_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json.gz"
+    ))
+    TraceCapture.enforce_retention(config.traces_dir, config.trace_retention_mb, config.trace_retention_files)
+    node.user_properties.append((USER_PROPERTY, path))
+    logger.info(f"Saved {reason} trace ({len(events)} events, {duration:.1f}s) to {path}")
+    return path
@@ -0,0 +1,456 @@
+"""Visual regression: screenshots compared against per-test, per-viewport baselines
+
+    def test_listing(driver, visual):
+        ...
+        visual.assert_matches("listing", ignore=[driver.find_element(*BANNER)])
+
+A screenshot is compared in three steps, cheapest first:
+
+1. Pixel digest. The baseline's digest and perceptual hash live in a JSON
+   sidecar, so an unchanged screenshot passes without decoding the baseline.
+2. Perceptual hash (dHash). A large Hamming distance means a different
+   layout (error page, missing section); the diff then skips anti-aliasing
+   analysis because it cannot change the verdict.
+3. Full diff, vectorized with NumPy over the pixels that actually differ:
+   YIQ colour distance against a threshold, anti-aliasing tolerance, ignore
+   masks and per-region limits on the share of changed pixels.
+
+Failed comparisons write the actual screenshot and a diff image (changes red,
+anti-aliasing yellow, ignored areas blue) and the HTML report embeds the diff.
+A screenshot without a baseline is "missing": its capture is written next to
+the diffs for review and assert_matches skips the test, or fails it with
+VISUAL_REQUIRE_BASELINES=true. Set UPDATE_BASELINES=true to accept the
+current screenshots as baselines, then commit tests/visual_baselines.
+"""
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pytest
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    np = None
+    Image = None
+
+
+logger = logging.getLogger(__name__)
+
+USER_PROPERTY = "visual"
+# Largest possible YIQ distance between two colours (black vs white)
+MAX_YIQ_DELTA = 35215.0
+# dHash bits (of 64) that may differ before a screenshot counts as a different layout
+LAYOUT_CHANGE_DISTANCE = 12
+# Share of visibly changed pixels above which anti-aliasing analysis cannot change the verdict
+ANTI_ALIASING_MAX_SHARE = 0.05
+
+_NEIGHBOURS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+
+# One round trip: freeze animations and the caret, then measure viewport and elements
+_PREPARE_SCRIPT = """
+if (!document.getElementById('__visual_freeze')) {
+    const style = document.createElement('style');
+    style.id = '__visual_freeze';
+    style.textContent = '*, *::before, *::after { animation: none !important; '
+        + 'transition: none !important; caret-color: transparent !important; }';
+    document.head.appendChild(style);
+}
+return {
+    dpr: window.devicePixelRatio,
+    width: window.innerWidth,
+    height: window.innerHeight,
+    rects: arguments[0].map(el => { const r = el.getBoundingClientRect(); return [r.left, r.top, r.width, r.height]; })
+};
+"""
+
+
+# ==================== Regions ====================
+@dataclass
+class Region:
+    """Rectangle in screenshot pixels; max_ratio is the share of it allowed to change"""
+
+    x: int
+    y: int
+    width: int
+    height: int
+    name: str = ""
+    max_ratio: float = 0.0
+
+    @classmethod
+    def from_rect(cls, rect: Sequence[float], dpr: float = 1.0, origin: Tuple[float, float] = (0, 0),
+                  name: str = "", max_ratio: float = 0.0) -> "Region":
+        """CSS-pixel [left, top, width, height] (e.g. getBoundingClientRect) -> screenshot pixels"""
+        left, top, width, height = rect
+        return cls(
+            int((left - origin[0]) * dpr), int((top - origin[1]) * dpr),
+            int(round(width * dpr)), int(round(height * dpr)), name, max_ratio
+        )
+
+    def slices(self, shape: Tuple[int, ...]) -> Tuple[slice, slice]:
+        """Row and column slices clipped to an image of the given shape"""
+        height, width = shape[:2]
+        return (slice(max(0, self.y), max(0, min(height, self.y + self.height))),
+                slice(max(0, self.x), max(0, min(width, self.x + self.width))))
+
+
+# ==================== Fingerprints ====================
+def pixel_digest(pixels) -> str:
+    """Exact digest of decoded pixels (PNG bytes differ for identical pixels across encoders)"""
+    return hashlib.sha1(pixels.tobytes() + str(pixels.shape).encode()).hexdigest()
+
+
+def dhash(image, size: int = 8) -> int:
+    """Difference hash: signs of horizontal gradients on a (size+1) x size grayscale thumbnail"""
+    thumbnail = np.asarray(image.convert("L").resize((size + 1, size), Image.BILINEAR), dtype=np.int16)
+    bits = (thumbnail[:, 1:] > thumbnail[:, :-1]).flatten()
+    return int("".join("1" if bit else "0" for bit in bits), 2)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+# ==================== Diff ====================
+def _yiq(pixels):
+    """RGB (..., 3) -> YIQ float32 (..., 3)"""
+    rgb = pixels.astype(np.float32)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    return np.stack([
+        r * 0.29889531 + g * 0.58662247 + b * 0.11448223,
+        r * 0.59597799 - g * 0.27417610 - b * 0.32180189,
+        r * 0.21147017 - g * 0.52261711 + b * 0.31114694,
+    ], axis=-1)
+
+
+def _yiq_delta(a, b):
+    d = a - b
+    return 0.5053 * d[..., 0] ** 2 + 0.299 * d[..., 1] ** 2 + 0.1957 * d[..., 2] ** 2
+
+
+def _neighbours(pixels, ys, xs):
+    """The 8 neighbours of each (ys, xs), clamped at the borders -> (8, N, ...)"""
+    height, width = pixels.shape[:2]
+    return np.stack([pixels[(ys + dy).clip(0, height - 1), (xs + dx).clip(0, width - 1)] for dy, dx in _NEIGHBOURS])
+
+
+def _anti_aliased(own, other, ys, xs, limit: float):
+    """Pixels that sit between a darker and a brighter neighbour in `own` (an edge, with at most
+    two identical neighbours) and whose colour appears next to the same spot in `other`"""
+    centre = _yiq(own[ys, xs])
+    luma = _yiq(_neighbours(own, ys, xs))[..., 0] - centre[:, 0]
+    identical = (np.abs(luma) < 1e-3).sum(axis=0)
+    on_edge = (identical <= 2) & (luma.min(axis=0) < 0) & (luma.max(axis=0) > 0)
+    # The colour moved by a pixel rather than changed
+    shifted = (_yiq_delta(_yiq(_neighbours(other, ys, xs)), centre[None]) <= limit).any(axis=0)
+    return on_edge & shifted
+
+
+def diff_pixels(baseline, actual, threshold: float = 0.1, anti_aliasing: bool = True):
+    """Changed and anti-aliased masks (H x W bool) for two same-sized RGB arrays
+
+    threshold is the YIQ colour distance (0-1) below which pixels count as equal.
+    Only pixels whose bytes differ are converted and examined.
+    """
+    changed = np.zeros(baseline.shape[:2], dtype=bool)
+    aliased = np.zeros(baseline.shape[:2], dtype=bool)
+    different = baseline != actual
+    ys, xs = np.nonzero(different[..., 0] | different[..., 1] | different[..., 2])
+    if not len(ys):
+        return changed, aliased
+    limit = MAX_YIQ_DELTA * threshold * threshold
+    visible = _yiq_delta(_yiq(baseline[ys, xs]), _yiq(actual[ys, xs])) > limit
+    ys, xs = ys[visible], xs[visible]
+    if anti_aliasing and 0 < len(ys) <= ANTI_ALIASING_MAX_SHARE * changed.size:
+        tolerated = _anti_aliased(baseline, actual, ys, xs, limit) | _anti_aliased(actual, baseline, ys, xs, limit)
+        aliased[ys[tolerated], xs[tolerated]] = True
+        ys, xs = ys[~tolerated], xs[~tolerated]
+    changed[ys, xs] = True
+    return changed, aliased
+
+
+def diff_image(baseline, changed, aliased, ignored=None):
+    """Faded grayscale baseline with changes red, anti-aliasing yellow and ignored areas blue"""
+    rgb = baseline.astype(np.uint16)
+    luma = (rgb[..., 0] * 77 + rgb[..., 1] * 150 + rgb[..., 2] * 29) >> 8
+    faded = (255 - (255 - luma) // 10).astype(np.uint8)
+    output = np.repeat(faded[..., None], 3, axis=2)
+    if ignored is not None:
+        output[ignored] = (output[ignored] * [0.6, 0.7, 1.0]).astype(np.uint8)
+    output[aliased] = (255, 200, 0)
+    output[changed] = (255, 0, 0)
+    return output
+
+
+@dataclass
+class VisualResult:
+    """Outcome of one screenshot comparison"""
+
+    name: str
+    key: str
+    status: str  # identical, passed, failed, missing, updated, size_changed
+    changed_pixels: int = 0
+    compared_pixels: int = 0
+    anti_aliased_pixels: int = 0
+    max_ratio: float = 0.0
+    region_ratios: Dict[str, float] = field(default_factory=dict)
+    failed_regions: List[str] = field(default_factory=list)
+    phash_distance: Optional[int] = None
+    elapsed_ms: float = 0.0
+    baseline_path: Optional[str] = None
+    actual_path: Optional[str] = None
+    diff_path: Optional[str] = None
+
+    @property
+    def ratio(self) -> float:
+        return self.changed_pixels / self.compared_pixels if self.compared_pixels else 0.0
+
+    @property
+    def passed(self) -> bool:
+        return self.status not in ("failed", "missing", "size_changed")
+
+    def summary(self) -> str:
+        text = f"{self.name}: {self.status}"
+        if self.status in ("passed", "failed"):
+            text += (f" ({self.changed_pixels} px changed = {self.ratio:.3%}, limit {self.max_ratio:.3%}, "
+                     f"{self.anti_aliased_pixels} anti-aliased, dHash distance {self.phash_distance})")
+        if self.failed_regions:
+            text += f"; regions over limit: {', '.join(self.failed_regions)}"
+        if self.diff_path:
+            text += f"; diff: {self.diff_path}"
+        if self.status == "missing":
+            text += (f" (no baseline; capture at {self.actual_path}, "
+                     f"run with UPDATE_BASELINES=true to accept it and commit tests/visual_baselines)")
+        return text
+
+    def to_dict(self) -> dict:
+        return dict(asdict(self), ratio=self.ratio, passed=self.passed)
+
+
+def compare(
+    baseline,
+    actual,
+    threshold: float = 0.1,
+    max_ratio: float = 0.0,
+    ignore: Sequence[Region] = (),
+    regions: Sequence[Region] = (),
+    anti_aliasing: bool = True,
+    name: str = "screenshot"
+) -> Tuple[VisualResult, Optional[object]]:
+    """Diff two RGB arrays; returns the result and the diff image (None when it passed)
+
+    Pixels inside `regions` are judged against that region's max_ratio, all
+    other non-ignored pixels against max_ratio.
+    """
+    result = VisualResult(name=name, key=name, status="passed", max_ratio=max_ratio)
+    if baseline.shape != actual.shape:
+        result.status = "size_changed"
+        return result, None
+    changed, aliased = diff_pixels(baseline, actual, threshold, anti_aliasing)
+    counted = np.ones(baseline.shape[:2], dtype=bool)
+    ignored = None
+    if ignore:
+        ignored = np.zeros(baseline.shape[:2], dtype=bool)
+        for region in ignore:
+            ignored[region.slices(baseline.shape)] = True
+        counted &= ~ignored
+    for index, region in enumerate(regions):
+        area = region.slices(baseline.shape)
+        region_name = region.name or f"region{index}"
+        pixels = counted[area].sum()
+        ratio = float((changed[area] & counted[area]).sum() / pixels) if pixels else 0.0
+        result.region_ratios[region_name] = round(ratio, 6)
+        if ratio > region.max_ratio:
+            result.failed_regions.append(region_name)
+        counted[area] = False
+    result.changed_pixels = int((changed & counted).sum())
+    result.compared_pixels = int(counted.sum())
+    result.anti_aliased_pixels = int(aliased.sum())
+    if result.ratio > max_ratio or result.failed_regions:
+        result.status = "failed"
+        return result, diff_image(baseline, changed, aliased, ignored)
+    return result, None
+
+
+# ==================== Baselines ====================
+class BaselineStore:
+    """Baseline PNGs under root/<test path>/<name>@<viewport>.png, each with a JSON sidecar
+    holding its pixel digest and dHash"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    @staticmethod
+    def key(test_id: str, name: str, viewport: str) -> str:
+        """tests/suites/test_x.py::TestX::test_y[a] + listing + 1920x1080 ->
+        suites/test_x/TestX/test_y_a_/listing@1920x1080"""
+        module, _, rest = test_id.partition("::")
+        module = re.sub(r"^tests/|\.py$", "", module.replace(os.sep, "/"))
+        parts = module.split("/") + [part for part in rest.split("::") if part] + [f"{name}@{viewport}"]
+        return "/".join(re.sub(r"[^\w.@-]+", "_", part) for part in parts)
+
+    def path(self, key: str, suffix: str = ".png") -> str:
+        return os.path.join(self.root, *key.split("/")) + suffix
+
+    def metadata(self, key: str) -> Optional[dict]:
+        try:
+            with open(self.path(key, ".json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def load(self, key: str):
+        """Baseline pixels as an RGB array"""
+        with Image.open(self.path(key)) as image:
+            return np.asarray(image.convert("RGB"))
+
+    def save(self, key: str, image, pixels) -> dict:
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        image.save(path, optimize=False)
+        metadata = {"digest": pixel_digest(pixels), "dhash": f"{dhash(image):016x}",
+                    "width": image.width, "height": image.height}
+        with open(self.path(key, ".json"), "w") as f:
+            json.dump(metadata, f, indent=2)
+        return metadata
+
+
+# ==================== Checker ====================
+class VisualChecker:
+    """Compares a test's screenshots with its baselines; one instance per test"""
+
+    def __init__(
+        self,
+        driver,
+        store: BaselineStore,
+        test_id: str,
+        output_dir: str,
+        threshold: float = 0.1,
+        max_ratio: float = 0.0,
+        update: bool = False,
+        require_baselines: bool = False
+    ):
+        if np is None or Image is None:
+            raise RuntimeError("Visual checks need numpy and Pillow (pip install -r tests/requirements.txt)")
+        self.driver = driver
+        self.store = store
+        self.test_id = test_id
+        self.output_dir = output_dir
+        self.threshold = threshold
+        self.max_ratio = max_ratio
+        self.update = update
+        self.require_baselines = require_baselines
+        self.results: List[VisualResult] = []
+
+    def capture(self, element=None, ignore: Sequence = (), regions: Sequence = ()):
+        """Screenshot (page viewport or element) as (PIL image, viewport, ignore, regions)
+
+        ignore/regions accept Regions (screenshot pixels) or WebElements;
+        elements become Regions in the screenshot's pixel space.
+        """
+        elements = [element] if element is not None else []
+        elements += [item for item in list(ignore) + list(regions) if not isinstance(item, Region)]
+        page = self.driver.execute_script(_PREPARE_SCRIPT, elements)
+        dpr = page["dpr"] or 1.0
+        rects = iter(page["rects"])
+        origin = tuple(next(rects)[:2]) if element is not None else (0, 0)
+
+        def to_region(item, max_ratio: float) -> Region:
+            if isinstance(item, Region):
+                return item
+            return Region.from_rect(next(rects), dpr, origin, max_ratio=max_ratio)
+
+        ignore_regions = [to_region(item, 0.0) for item in ignore]
+        check_regions = [to_region(item, self.max_ratio) for item in regions]
+        png = element.screenshot_as_png if element is not None else self.driver.get_screenshot_as_png()
+        image = Image.open(io.BytesIO(png)).convert("RGB")
+        viewport = f"{page['width']}x{page['height']}" + (f"@{dpr:g}x" if dpr != 1 else "")
+        return image, viewport, ignore_regions, check_regions
+
+    def check(self, name: str, element=None, ignore: Sequence = (), regions: Sequence = (),
+              max_ratio: Optional[float] = None, threshold: Optional[float] = None) -> VisualResult:
+        """Compare a screenshot with its baseline ("missing" without one, unless updating)"""
+        image, viewport, ignore_regions, check_regions = self.capture(element, ignore, regions)
+        started = time.perf_counter()
+        key = BaselineStore.key(self.test_id, name, viewport)
+        max_ratio = self.max_ratio if max_ratio is None else max_ratio
+        result = self._compare(name, key, image, ignore_regions, check_regions, max_ratio,
+                               self.threshold if threshold is None else threshold)
+        result.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(f"Visual {result.summary()} [{result.elapsed_ms:.0f} ms]")
+        self.results.append(result)
+        return result
+
+    def _compare(self, name, key, image, ignore, regions, max_ratio, threshold) -> VisualResult:
+        pixels = np.asarray(image)
+        metadata = self.store.metadata(key)
+        baseline_path = self.store.path(key)
+        if self.update:
+            self.store.save(key, image, pixels)
+            return VisualResult(name, key, "updated", max_ratio=max_ratio, baseline_path=baseline_path)
+        if metadata is None or not os.path.exists(baseline_path):
+            result = VisualResult(name, key, "missing", max_ratio=max_ratio, baseline_path=baseline_path)
+            result.actual_path = self._save_actual(key, image)
+            return result
+        if metadata["digest"] == pixel_digest(pixels):
+            return VisualResult(name, key, "identical", compared_pixels=pixels.shape[0] * pixels.shape[1],
+                                max_ratio=max_ratio, phash_distance=0, baseline_path=baseline_path)
+
+        distance = hamming(int(metadata["dhash"], 16), dhash(image))
+        result, diff = compare(
+            self.store.load(key), pixels, threshold, max_ratio, ignore, regions,
+            anti_aliasing=distance <= LAYOUT_CHANGE_DISTANCE, name=name
+        )
+        result.key, result.phash_distance, result.baseline_path = key, distance, baseline_path
+        if not result.passed:
+            result.actual_path = self._save_actual(key, image)
+            if diff is not None:
+                result.diff_path = f"{result.actual_path[:-len('.actual.png')]}.diff.png"
+                Image.fromarray(diff).save(result.diff_path)
+        return result
+
+    def _save_actual(self, key: str, image) -> str:
+        """Write the capture to <output_dir>/<key>.actual.png"""
+        stem = os.path.join(self.output_dir, *key.split("/"))
+        os.makedirs(os.path.dirname(stem), exist_ok=True)
+        image.save(f"{stem}.actual.png")
+        return f"{stem}.actual.png"
+
+    def assert_matches(self, name: str, **kwargs) -> VisualResult:
+        """check() and fail the test when the screenshot differs beyond its limits
+
+        Without a baseline the test is skipped unless baselines are required.
+        """
+        result = self.check(name, **kwargs)
+        if result.status == "missing" and not self.require_baselines:
+            pytest.skip(f"No visual baseline yet: {result.summary()}")
+        assert result.passed, f"Visual regression in {result.summary()}"
+        return result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Diff two screenshots")
+    parser.add_argument("baseline")
+    parser.add_argument("actual")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--max-ratio", type=float, default=0.0)
+    parser.add_argument("--diff", help="Write the diff image here")
+    args = parser.parse_args()
+
+    with Image.open(args.baseline) as a, Image.open(args.actual) as b:
+        baseline_pixels, actual_pixels = np.asarray(a.convert("RGB")), np.asarray(b.convert("RGB"))
+    started = time.perf_counter()
+    outcome, diff = compare(baseline_pixels, actual_pixels, args.threshold, args.max_ratio)
+    outcome.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    if args.diff and diff is not None:
+        Image.fromarray(diff).save(args.diff)
+    print(f"{outcome.summary()} [{outcome.elapsed_ms:.0f} ms]")
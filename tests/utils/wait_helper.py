@@ -8,6 +8,34 @@ from typing import Optional, Callable, Any
 import time
 
 
+# Resolves once the document is loaded, the Next.js client has booted and no
+# DOM mutation happened for quiet_ms; resolves false when timeout_ms runs out.
+_SETTLED_SCRIPT = """
+var quietMs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var start = Date.now(), lastMutation = Date.now();
+var observer = new MutationObserver(function () { lastMutation = Date.now(); });
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+
+function hydrated() {
+    var isNextPage = !!(window.__next_f || window.__NEXT_DATA__);
+    return !isNextPage || !!window.next;
+}
+
+(function check() {
+    var now = Date.now();
+    if (document.readyState === 'complete' && hydrated() && now - lastMutation >= quietMs) {
+        observer.disconnect();
+        done(true);
+    } else if (now - start >= timeoutMs) {
+        observer.disconnect();
+        done(false);
+    } else {
+        setTimeout(check, 50);
+    }
+})();
+"""
+
+
 class WaitHelper:
     """Enhanced wait utilities with custom conditions"""
     
@@ -147,6 +175,22 @@ class WaitHelper:
         except TimeoutException:
             return False
     
+    @staticmethod
+    def wait_for_page_settled(
+        driver,
+        quiet_ms: int = 300,
+        timeout: float = 10
+    ) -> bool:
+        """Wait until the page is hydrated and the DOM has been quiet for quiet_ms
+        
+        Presence/absence can be answered immediately afterwards, so negative
+        checks no longer have to burn a full element timeout.
+        """
+        try:
+            return bool(driver.execute_async_script(_SETTLED_SCRIPT, quiet_ms, int(timeout * 1000)))
+        except TimeoutException:
+            return False
+    
     @staticmethod
     def wait_and_get_text(
         driver,
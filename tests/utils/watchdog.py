@@ -0,0 +1,256 @@
+"""Hang watchdog: diagnose and abort a test stuck on its browser
+
+The driver fixture starts one watchdog per test. Its limit adapts to the
+test's history (p99 of past durations times a factor, clamped to a floor
+and a ceiling; the ceiling alone while fewer than five runs are known). Once
+the test runs past it, the watchdog writes tests/reports/hangs/hang_<test>_<time>.json
+with the WebDriver command the test thread is blocked on, the URL, window
+handles, browser console, a screenshot (in the screenshot store) and every
+Python thread's stack, then recycles the driver: quit, or kill the driver
+process tree if quit does not return. The blocked command then raises and
+only that test fails; the next test gets a fresh browser.
+
+Tests stuck without touching the driver (sleep loops) are left to
+pytest-timeout, which conftest sets to the same limit plus a grace period.
+"""
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from tests.utils.command_metrics import CommandInstrumentation
+from tests.utils.screenshot_store import ScreenshotStore
+from tests.utils.stats import percentile
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+logger = logging.getLogger(__name__)
+
+# User properties naming the dump and screenshot (linked by the stream report)
+USER_PROPERTY = "hang_dump"
+SCREENSHOT_PROPERTY = "hang_screenshot"
+
+
+def hang_limit(durations: List[float], factor: float, floor: float, ceiling: float, min_samples: int = 5) -> float:
+    """Seconds a test may run: p99 of its history times factor, within [floor, ceiling]"""
+    if len(durations) < min_samples:
+        return ceiling
+    return min(ceiling, max(floor, percentile(durations, 99) * factor))
+
+
+def python_stacks(first: Optional[int] = None) -> str:
+    """Stack of every Python thread, the given thread first"""
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    frames = sys._current_frames()
+    order = sorted(frames, key=lambda ident: ident != first)
+    return "\n".join(
+        f"Thread {names.get(ident, '?')} ({ident}):\n{''.join(traceback.format_stack(frames[ident]))}"
+        for ident in order
+    )
+
+
+class HangWatchdog:
+    """Background thread aborting a driver's test once it exceeds limit_s"""
+
+    _ATTRIBUTE = "_hang_watchdog"
+
+    def __init__(self, driver, name: str, limit_s: float, dump_dir: str,
+                 screenshots_dir: Optional[str] = None, probe_timeout: float = 5.0, poll: float = 1.0):
+        self.driver = driver
+        self.name = name
+        self.limit_s = limit_s
+        self.dump_dir = dump_dir
+        self.screenshots_dir = screenshots_dir
+        self.probe_timeout = probe_timeout
+        self.poll = poll
+        self.instrumentation = CommandInstrumentation.attach(driver)
+        self.started: Optional[float] = None
+        self.fired = False
+        self.dump: Optional[dict] = None
+        self.dump_path: Optional[str] = None
+        self._thread_id: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ==================== Lifecycle ====================
+    def start(self) -> "HangWatchdog":
+        """Start the clock for the calling (test) thread"""
+        self.started = time.time()
+        self._thread_id = threading.get_ident()
+        self._thread = threading.Thread(target=self._loop, name=f"watchdog-{self.name}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop watching; waits for a dump in progress"""
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    @property
+    def elapsed(self) -> float:
+        return time.time() - self.started if self.started else 0.0
+
+    def _loop(self):
+        while not self._stop.wait(self.poll):
+            if self.elapsed > self.limit_s:
+                self.fire()
+                return
+
+    def fire(self):
+        """Dump diagnostics and recycle the driver"""
+        self.fired = True
+        in_flight = self.instrumentation.in_flight(self._thread_id)
+        logger.error(f"{self.name} exceeded {self.limit_s:.0f}s "
+                     f"(blocked on {in_flight['command'] if in_flight else 'no WebDriver command'}); aborting")
+        try:
+            self.dump_path = self._write_dump(self.diagnose())
+        except Exception as e:
+            logger.warning(f"Could not write hang dump for {self.name}: {e}")
+        self.recycle()
+
+    # ==================== Diagnostics ====================
+    def _probe(self, fn: Callable, timeout: Optional[float] = None):
+        """Run fn in a helper thread; raises TimeoutError if the driver does not answer in time"""
+        result: Dict[str, object] = {}
+
+        def run():
+            try:
+                result["value"] = fn()
+            except Exception as e:
+                result["error"] = e
+
+        thread = threading.Thread(target=run, name=f"watchdog-probe-{self.name}", daemon=True)
+        thread.start()
+        thread.join(timeout or self.probe_timeout)
+        if thread.is_alive():
+            raise TimeoutError(f"no answer within {timeout or self.probe_timeout:.0f}s")
+        if "error" in result:
+            raise result["error"]
+        return result["value"]
+
+    def diagnose(self) -> dict:
+        """What the test was doing; driver probes stop at the first one the busy driver does not answer"""
+        in_flight = self.instrumentation.in_flight(self._thread_id)
+        dump = {
+            "test": self.name,
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "elapsed_s": round(self.elapsed, 1),
+            "limit_s": round(self.limit_s, 1),
+            "command": None,
+        }
+        if in_flight:
+            dump["command"] = {
+                "name": in_flight["command"],
+                "params": {k: v for k, v in (in_flight["params"] or {}).items() if k != "sessionId"},
+                "waiting_s": round(time.time() - in_flight["since"], 1),
+            }
+        dump["python_stacks"] = python_stacks(self._thread_id)
+
+        probes = {
+            "url": lambda: self.driver.current_url,
+            "window_handles": lambda: self.driver.window_handles,
+            "console": lambda: self.driver.get_log("browser"),
+            "screenshot": self._screenshot,
+        }
+        busy = None
+        for key, probe in probes.items():
+            if busy:
+                dump[key] = f"unavailable: {busy}"
+                continue
+            try:
+                dump[key] = self._probe(probe)
+            except TimeoutError as e:
+                busy = f"driver busy ({e})"
+                dump[key] = f"unavailable: {busy}"
+            except Exception as e:
+                dump[key] = f"unavailable: {type(e).__name__}: {e}"
+        self.dump = dump
+        return dump
+
+    def _screenshot(self) -> Optional[str]:
+        png = self.driver.get_screenshot_as_png()
+        if self.screenshots_dir:
+            return ScreenshotStore(self.screenshots_dir).put(png, "hang", test=self.name)
+        return None
+
+    def _write_dump(self, dump: dict) -> str:
+        os.makedirs(self.dump_dir, exist_ok=True)
+        name = re.sub(r"[^\w.-]+", "_", self.name.rsplit("::", 1)[-1])
+        path = os.path.join(self.dump_dir, f"hang_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, "w") as f:
+            json.dump(dump, f, indent=2, default=str)
+        logger.error(f"Hang diagnostics written to {path}")
+        return path
+
+    # ==================== Abort ====================
+    def recycle(self, quit_timeout: float = 10.0):
+        """End the browser session so the blocked command raises; kill the driver if quit hangs too"""
+        try:
+            self._probe(self.driver.quit, quit_timeout)
+            return
+        except TimeoutError:
+            logger.warning(f"driver.quit() did not return within {quit_timeout:.0f}s; killing the driver process")
+        except Exception as e:
+            logger.warning(f"driver.quit() failed ({e}); killing the driver process")
+        process = getattr(getattr(self.driver, "service", None), "process", None)
+        if process is None:
+            return
+        if psutil is not None:
+            try:
+                parent = psutil.Process(process.pid)
+                for child in parent.children(recursive=True):
+                    child.kill()
+            except psutil.Error:
+                pass
+        else:
+            logger.warning("psutil not installed; browser processes of the killed driver may linger")
+        process.kill()
+
+    def summary(self) -> str:
+        """Short text for the test report"""
+        command = (self.dump or {}).get("command") or {}
+        elapsed = (self.dump or {}).get("elapsed_s", self.elapsed)
+        lines = [f"Aborted after {elapsed:.0f}s (limit {self.limit_s:.0f}s)"]
+        if command:
+            lines.append(f"Blocked on {command['name']} {command['params']} for {command['waiting_s']}s")
+        if self.dump:
+            lines.append(f"URL: {self.dump.get('url')}")
+            lines.append(f"Windows: {self.dump.get('window_handles')}")
+        if self.dump_path:
+            lines.append(f"Diagnostics: {self.dump_path}")
+        return "\n".join(lines)
+
+    def properties(self) -> List[tuple]:
+        """User properties for a fired watchdog (dump file and screenshot)"""
+        properties = [(USER_PROPERTY, self.dump_path)] if self.dump_path else []
+        screenshot = (self.dump or {}).get("screenshot")
+        if screenshot and os.path.isfile(str(screenshot)):
+            properties.append((SCREENSHOT_PROPERTY, screenshot))
+        return properties
+
+    # ==================== Registry ====================
+    @classmethod
+    def attach(cls, driver, name: str, limit_s: float, dump_dir: str, **kwargs) -> "HangWatchdog":
+        """Start watching driver's test (replacing any previous watchdog) and return the watchdog"""
+        existing = cls.get(driver)
+        if existing:
+            existing.stop()
+        watchdog = cls(driver, name, limit_s, dump_dir, **kwargs).start()
+        setattr(driver, cls._ATTRIBUTE, watchdog)
+        return watchdog
+
+    @classmethod
+    def get(cls, driver) -> Optional["HangWatchdog"]:
+        """Return the watchdog attached to driver, if any"""
+        return getattr(driver, cls._ATTRIBUTE, None)